@@ -339,6 +339,7 @@ def run_execute(  # noqa: PLR0913, PLR0917
         application_version_id=application_version_id,
         metadata_csv_file=metadata_csv_file,
         upload_prefix=upload_prefix,
+        skip_unchanged=False,
     )
     application_run_id = run_submit(
         application_version_id=application_version_id,
@@ -409,13 +410,37 @@ def run_prepare(
         aignostics application run prepare "he-tme:v0.51.0" metadata.csv /path/to/source_directory
         --mapping "*.tiff:staining_method:H&E,tissue:LUNG,disease:LUNG_CANCER"
     """
-    write_metadata_dict_to_csv(
-        metadata_csv=metadata_csv,
-        metadata_dict=Service().generate_metadata_from_source_directory(
+    from rich.progress import (  # noqa: PLC0415
+        BarColumn,
+        MofNCompleteColumn,
+        Progress,
+        TextColumn,
+        TimeRemainingColumn,
+    )
+
+    with Progress(
+        TextColumn(f"[progress.description]Scanning {source_directory}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TimeRemainingColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+        transient=True,
+    ) as progress:
+        task = progress.add_task("Finding whole slide images ...", total=None)
+
+        def update_progress(scanned: int, total: int, file_path: Path) -> None:
+            progress.update(task, completed=scanned, total=total, description=file_path.name)
+
+        metadata_dict = Service().generate_metadata_from_source_directory(
             application_version_id=application_version_id,
             source_directory=source_directory,
             mappings=mapping or [],
-        ),
+            progress_callable=update_progress,
+        )
+    write_metadata_dict_to_csv(
+        metadata_csv=metadata_csv,
+        metadata_dict=metadata_dict,
     )
     console.print(f"Generated metadata file [bold]{metadata_csv}[/bold]")
     logger.info("Generated metadata file: '%s'", metadata_csv)
@@ -448,6 +473,12 @@ def run_upload(
             help="Prefix for the upload destination. If not given will be set to current milliseconds.",
         ),
     ] = f"{time.time() * 1000}",
+    skip_unchanged: Annotated[
+        bool,
+        typer.Option(
+            help="Skip files already uploaded with the same upload prefix, size and checksum.",
+        ),
+    ] = False,
 ) -> None:
     """Upload files referenced in the metadata CSV file to the Aignostics platform.
 
@@ -500,18 +531,20 @@ def run_upload(
             progress.update(task, advance=bytes_uploaded, description=f"{source.name}")
             for entry in metadata_dict:
                 if entry["reference"] == str(source):
-                    entry["platform_bucket_url"] = platform_bucket_url
+                    if entry.get("platform_bucket_url") != platform_bucket_url:
+                        entry["platform_bucket_url"] = platform_bucket_url
+                        write_metadata_dict_to_csv(
+                            metadata_csv=metadata_csv_file,
+                            metadata_dict=metadata_dict,
+                        )
                     break
-            write_metadata_dict_to_csv(
-                metadata_csv=metadata_csv_file,
-                metadata_dict=metadata_dict,
-            )
 
         Service().application_run_upload(
             application_version_id=application_version_id,
             metadata=metadata_dict,
             upload_prefix=upload_prefix,
             upload_progress_callable=update_progress,
+            skip_unchanged=skip_unchanged,
         )
 
     logger.info("Upload completed.")
@@ -754,10 +787,10 @@ def result_download(  # noqa: PLR0913, PLR0917
                     main_task,
                     description=(
                         progress.status
-                        if progress.status is not DownloadProgressState.DOWNLOADING or not progress.total_artifact_index
+                        if progress.status is not DownloadProgressState.DOWNLOADING or not progress.total_artifact_count
                         else (
-                            f"Downloading artifact {progress.total_artifact_index + 1} "
-                            f"of {progress.total_artifact_count}"
+                            f"Downloaded {progress.processed_artifact_count} of {progress.total_artifact_count} "
+                            f"artifacts ({len(progress.active_downloads)} in progress)"
                         )
                     ).ljust(50),
                 )
@@ -776,16 +809,11 @@ def result_download(  # noqa: PLR0913, PLR0917
                         advance=progress.artifact_downloaded_chunk_size,
                     )
 
-                if (
-                    progress.item_count
-                    and progress.item_index is not None
-                    and progress.artifact_count
-                    and progress.artifact_index is not None
-                ):
+                if progress.status is DownloadProgressState.DOWNLOADING and progress.total_artifact_count:
                     main_download_progress_ui.update(
                         main_task,
-                        completed=progress.item_index * progress.artifact_count + progress.artifact_index + 1,
-                        total=float(progress.total_artifact_count) if progress.total_artifact_count else 0.0,
+                        completed=progress.processed_artifact_count,
+                        total=float(progress.total_artifact_count),
                     )
 
             destination_directory = Service().application_run_download(
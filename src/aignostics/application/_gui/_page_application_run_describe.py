@@ -177,11 +177,10 @@ async def _page_application_run_describe(application_run_id: str) -> None:  # no
                     progress = progress_queue.get()
                     download_item_status.set_text(
                         progress.status
-                        if progress.status is not DownloadProgressState.DOWNLOADING
-                        or progress.total_artifact_index is None
+                        if progress.status is not DownloadProgressState.DOWNLOADING or not progress.total_artifact_count
                         else (
-                            f"Downloading artifact {progress.total_artifact_index + 1} "
-                            f"of {progress.total_artifact_count}"
+                            f"Downloaded {progress.processed_artifact_count} "
+                            f"of {progress.total_artifact_count} artifacts"
                         )
                     )
                     download_item_status.set_visibility(True)
@@ -1,19 +1,19 @@
 """Service of the application module."""
 
-import base64
 import re
+import threading
 import time
 from collections.abc import Callable, Generator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from enum import StrEnum
 from http import HTTPStatus
 from importlib.util import find_spec
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
-import google_crc32c
 import requests
 import semver
-from pydantic import BaseModel, computed_field
+from pydantic import BaseModel, Field, computed_field
 
 from aignostics.bucket import Service as BucketService
 from aignostics.constants import WSI_SUPPORTED_FILE_EXTENSIONS
@@ -26,17 +26,34 @@ from aignostics.platform import (
     ApplicationRunStatus,
     ApplicationVersion,
     Client,
+    DownloadSegment,
     InputArtifact,
     InputItem,
     ItemResult,
+    ItemResultTracker,
     ItemStatus,
     NotFoundException,
     OutputArtifactElement,
+    download_file_segmented,
+    get_download_size_if_ranges_supported,
+    get_segment_count,
 )
 from aignostics.platform import (
     Service as PlatformService,
 )
-from aignostics.utils import UNHIDE_SENSITIVE_INFO, BaseService, Health, get_logger, sanitize_path_component
+from aignostics.utils import (
+    UNHIDE_SENSITIVE_INFO,
+    BaseService,
+    FileIdentity,
+    Health,
+    StreamingChecksum,
+    calculate_file_crc32c,
+    get_checksum_cache,
+    get_http_session,
+    get_logger,
+    load_settings,
+    sanitize_path_component,
+)
 from aignostics.wsi import Service as WSIService
 
 from ._settings import Settings
@@ -51,10 +68,12 @@ if has_qupath_extra:
 
 logger = get_logger(__name__)
 
-APPLICATION_RUN_DOWNLOAD_SLEEP_SECONDS = 5
-APPLICATION_RUN_FILE_READ_CHUNK_SIZE = 1024 * 1024 * 1024  # 1GB
 APPLICATION_RUN_DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
 APPLICATION_RUN_UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
+APPLICATION_RUN_UPLOAD_PROGRESS_STEP = 0.01  # Minimum progress of a file between updates sent to the queue
+APPLICATION_RUN_DOWNLOAD_CHECKPOINT_SIZE = 16 * 1024 * 1024  # 16MB
+APPLICATION_RUN_DOWNLOAD_PART_SUFFIX = ".part"
+APPLICATION_RUN_DOWNLOAD_CHECKPOINT_SUFFIX = ".json"
 
 
 class DownloadProgressState(StrEnum):
@@ -85,6 +104,10 @@ class DownloadProgress(BaseModel):
     artifact_size: int | None = None
     artifact_downloaded_chunk_size: int = 0
     artifact_downloaded_size: int = 0
+    worker: str | None = None
+    active_downloads: dict[str, str] = Field(default_factory=dict)
+    processed_artifact_count: int = 0
+    total_downloaded_size: int = 0
     if has_qupath_extra:
         qupath_add_input_progress: QuPathAddProgress | None = None
         qupath_add_results_progress: QuPathAddProgress | None = None
@@ -113,9 +136,9 @@ class DownloadProgress(BaseModel):
             float: The normalized item progress in range 0..1.
         """
         if self.status == DownloadProgressState.DOWNLOADING:
-            if (not self.total_artifact_count) or self.total_artifact_index is None:
+            if not self.total_artifact_count:
                 return 0.0
-            return min(1, float(self.total_artifact_index + 1) / float(self.total_artifact_count))
+            return min(1, float(self.processed_artifact_count) / float(self.total_artifact_count))
         if has_qupath_extra:
             if self.status == DownloadProgressState.QUPATH_ADD_INPUT and self.qupath_add_input_progress:
                 return self.qupath_add_input_progress.progress_normalized
@@ -148,6 +171,286 @@ class DownloadProgress(BaseModel):
         return 0.0
 
 
+class DownloadCheckpoint(BaseModel):
+    """Checkpoint of a partial artifact download, persisted in a sidecar next to the partial file.
+
+    Downloads streamed in a single range record their offset and running CRC32C, segmented downloads
+    the size of the preallocated partial file and the progress of each segment.
+    """
+
+    checksum: str
+    offset: int = 0
+    crc32c: int = 0
+    size: int | None = None
+    segments: list[DownloadSegment] = []
+
+    @classmethod
+    def load(cls, part_path: Path, checkpoint_path: Path, checksum: str) -> "DownloadCheckpoint":
+        """Load the checkpoint of a partial download if it can be resumed.
+
+        A checkpoint can be resumed if it refers to the same expected checksum and the partial file
+        holds at least the checkpointed number of bytes, or has the preallocated size of a segmented download.
+        Otherwise a fresh checkpoint is returned.
+
+        Args:
+            part_path (Path): Path of the partial file.
+            checkpoint_path (Path): Path of the checkpoint sidecar.
+            checksum (str): Expected CRC32C checksum of the complete content in base64.
+
+        Returns:
+            DownloadCheckpoint: The checkpoint to continue from.
+        """
+        try:
+            checkpoint = cls.model_validate_json(checkpoint_path.read_bytes())
+            part_size = part_path.stat().st_size
+            if checkpoint.checksum == checksum and (
+                part_size == checkpoint.size if checkpoint.segments else part_size >= checkpoint.offset
+            ):
+                return checkpoint
+        except (OSError, ValueError):
+            pass
+        return cls(checksum=checksum)
+
+    def save(self, checkpoint_path: Path) -> None:
+        """Persist the checkpoint.
+
+        Args:
+            checkpoint_path (Path): Path of the checkpoint sidecar.
+        """
+        checkpoint_path.write_text(self.model_dump_json(), encoding="utf-8")
+
+    def checksum_base64(self) -> str:
+        """Get the CRC32C checksum of the checkpointed content.
+
+        Returns:
+            str: The CRC32C checksum in base64.
+        """
+        return StreamingChecksum(crc32c=self.crc32c).crc32c_base64()
+
+
+class _DownloadProgressTracker:
+    """Fans in progress of concurrent artifact download workers into coherent progress updates.
+
+    Each worker operates on its own copy of the shared progress, carrying the item and artifact it is
+    currently downloading. Updates of workers are serialized, amended with the aggregate counters
+    of the shared progress and passed on to the callable and queue as snapshots.
+    """
+
+    def __init__(
+        self,
+        progress: DownloadProgress,
+        download_progress_queue: Any | None = None,  # noqa: ANN401
+        download_progress_callable: Callable | None = None,  # type: ignore[type-arg]
+    ) -> None:
+        """Initialize tracker.
+
+        Args:
+            progress (DownloadProgress): The shared progress holding aggregate counters.
+            download_progress_queue (Queue | None): Queue for GUI progress updates.
+            download_progress_callable (Callable | None): Callback for CLI progress updates.
+        """
+        self._lock = threading.Lock()
+        self._progress = progress
+        self._download_progress_queue = download_progress_queue
+        self._download_progress_callable = download_progress_callable
+
+    def start_artifact(
+        self, item_index: int, item: ItemResult, artifact_index: int, artifact: OutputArtifactElement
+    ) -> DownloadProgress:
+        """Register the start of an artifact download by the calling worker.
+
+        Args:
+            item_index (int): Index of the item in the run.
+            item (ItemResult): The item the artifact belongs to.
+            artifact_index (int): Index of the artifact in the item.
+            artifact (OutputArtifactElement): The artifact to download.
+
+        Returns:
+            DownloadProgress: Progress owned by the calling worker.
+        """
+        worker = threading.current_thread().name
+        with self._lock:
+            self._progress.status = DownloadProgressState.DOWNLOADING
+            self._progress.active_downloads[worker] = artifact.name
+            worker_progress = self._progress.model_copy(
+                update={
+                    "worker": worker,
+                    "active_downloads": {},
+                    "item_index": item_index,
+                    "item": item,
+                    "item_reference": item.reference,
+                    "artifact_count": len(item.output_artifacts),
+                    "artifact_index": artifact_index,
+                    "artifact": artifact,
+                    "artifact_path": None,
+                    "artifact_download_url": None,
+                    "artifact_size": None,
+                    "artifact_downloaded_chunk_size": 0,
+                    "artifact_downloaded_size": 0,
+                }
+            )
+            self._emit(worker_progress)
+        return worker_progress
+
+    def update(self, worker_progress: DownloadProgress) -> None:
+        """Account for progress reported by a worker and pass on a snapshot.
+
+        Args:
+            worker_progress (DownloadProgress): Progress owned by the reporting worker.
+        """
+        with self._lock:
+            self._progress.total_downloaded_size += worker_progress.artifact_downloaded_chunk_size
+            self._emit(worker_progress)
+
+    def finish_artifact(self, worker_progress: DownloadProgress) -> None:
+        """Register the completion of an artifact download, including skipped downloads.
+
+        Args:
+            worker_progress (DownloadProgress): Progress owned by the reporting worker.
+        """
+        with self._lock:
+            self._progress.processed_artifact_count += 1
+            self._progress.active_downloads.pop(worker_progress.worker or "", None)
+            worker_progress.artifact_downloaded_chunk_size = 0
+            self._emit(worker_progress)
+
+    def _emit(self, worker_progress: DownloadProgress) -> None:
+        """Amend worker progress with aggregate counters and pass on a snapshot.
+
+        Must be called while holding the lock.
+
+        Args:
+            worker_progress (DownloadProgress): Progress owned by the reporting worker.
+        """
+        snapshot = worker_progress.model_copy(
+            update={
+                "run": self._progress.run,
+                "item_count": self._progress.item_count,
+                "active_downloads": dict(self._progress.active_downloads),
+                "processed_artifact_count": self._progress.processed_artifact_count,
+                "total_downloaded_size": self._progress.total_downloaded_size,
+            }
+        )
+        if self._download_progress_callable:
+            self._download_progress_callable(snapshot)
+        if self._download_progress_queue:
+            self._download_progress_queue.put_nowait(snapshot)
+
+
+class _UploadProgressTracker:
+    """Fans in progress of concurrent file upload workers into coherent progress updates.
+
+    Updates of workers are serialized. The callable receives every uploaded chunk, while the queue
+    only receives an update per file when its normalized progress advanced by at least one percent,
+    so concurrent uploads do not flood the GUI.
+    """
+
+    def __init__(
+        self,
+        total_size: int,
+        upload_progress_queue: Any | None = None,  # noqa: ANN401
+        upload_progress_callable: Callable[[int, Path, str], None] | None = None,
+    ) -> None:
+        """Initialize tracker.
+
+        Args:
+            total_size (int): Total size of all files to upload in bytes.
+            upload_progress_queue (Queue | None): Queue for GUI progress updates.
+            upload_progress_callable (Callable[[int, Path, str], None] | None): Callback for CLI progress updates.
+        """
+        self._lock = threading.Lock()
+        self._upload_progress_queue = upload_progress_queue
+        self._upload_progress_callable = upload_progress_callable
+        self._reported_progress: dict[str, float] = {}
+        self.total_size = total_size
+        self.total_uploaded_size = 0
+
+    def start_file(self, reference: str, platform_bucket_url: str) -> None:
+        """Register the start of a file upload.
+
+        Args:
+            reference (str): The reference of the file in the metadata.
+            platform_bucket_url (str): URL of the object in the platform bucket.
+        """
+        with self._lock:
+            self._reported_progress[reference] = 0.0
+            if self._upload_progress_queue:
+                self._upload_progress_queue.put_nowait({
+                    "reference": reference,
+                    "platform_bucket_url": platform_bucket_url,
+                })
+
+    def update(  # noqa: PLR0913, PLR0917
+        self,
+        reference: str,
+        file_path: Path,
+        platform_bucket_url: str,
+        chunk_size: int,
+        uploaded_size: int,
+        file_size: int,
+    ) -> None:
+        """Account for a chunk uploaded by a worker and pass on progress.
+
+        Args:
+            reference (str): The reference of the file in the metadata.
+            file_path (Path): Path of the local file.
+            platform_bucket_url (str): URL of the object in the platform bucket.
+            chunk_size (int): Size of the chunk uploaded in bytes.
+            uploaded_size (int): Size of the file uploaded so far in bytes.
+            file_size (int): Size of the file in bytes.
+        """
+        file_upload_progress = min(1.0, uploaded_size / file_size) if file_size else 1.0
+        with self._lock:
+            self.total_uploaded_size += chunk_size
+            if self._upload_progress_callable:
+                self._upload_progress_callable(chunk_size, file_path, platform_bucket_url)
+            reported_progress = self._reported_progress.get(reference, 0.0)
+            if self._upload_progress_queue and (
+                file_upload_progress >= 1.0
+                or file_upload_progress - reported_progress >= APPLICATION_RUN_UPLOAD_PROGRESS_STEP
+            ):
+                self._reported_progress[reference] = file_upload_progress
+                self._upload_progress_queue.put_nowait({
+                    "reference": reference,
+                    "file_upload_progress": file_upload_progress,
+                })
+
+
+def _scan_slide(file_path: Path) -> tuple[str, dict[str, Any], str | None]:
+    """Checksum a slide and extract its metadata, run in worker processes of the metadata scan.
+
+    Errors extracting the metadata are captured and returned, so a single unreadable slide
+    does not abort the scan. Checksum and metadata are looked up in and stored to the persistent
+    checksum cache, so unchanged slides are neither read nor opened again.
+
+    Args:
+        file_path (Path): Path of the slide.
+
+    Returns:
+        tuple[str, dict[str, Any], str | None]: The CRC32C checksum in base64, the metadata extracted
+            for the metadata file and the error extracting the metadata, if any.
+    """
+    checksum = calculate_file_crc32c(file_path, use_cache=True)
+    cache = get_checksum_cache()
+    identity = FileIdentity.of(file_path) if cache else None
+    cached = cache.get(identity) if cache and identity else None
+    if cached and cached.metadata:
+        return checksum, cached.metadata, None
+    try:
+        image_metadata = WSIService().get_metadata(file_path)
+        slide_metadata = {
+            "width": image_metadata["dimensions"]["width"],
+            "height": image_metadata["dimensions"]["height"],
+            "mpp": image_metadata["resolution"]["mpp_x"],
+            "file_size_human": image_metadata["file"]["size_human"],
+        }
+    except Exception as e:  # noqa: BLE001
+        return checksum, {}, str(e)
+    if cache and identity:
+        cache.put(identity, metadata=slide_metadata)
+    return checksum, slide_metadata, None
+
+
 class Service(BaseService):
     """Service of the application module."""
 
@@ -387,11 +690,13 @@ class Service(BaseService):
                 Service._process_key_value_pair(entry, key_value, reference)
 
     @staticmethod
-    def generate_metadata_from_source_directory(
+    def generate_metadata_from_source_directory(  # noqa: PLR0913, PLR0917
         application_version_id: str,
         source_directory: Path,
         with_gui_metadata: bool = False,
         mappings: list[str] | None = None,
+        processes: int | None = None,
+        progress_callable: Callable[[int, int, Path], None] | None = None,
     ) -> list[dict[str, Any]]:
         """Generate metadata from the source directory.
 
@@ -415,6 +720,10 @@ class Service(BaseService):
             mappings (list[str]): Mappings of the form '<regexp>:<key>:<value>,<key>:<value>,...'.
                 The regular expression is matched against the reference attribute of the entry.
                 The key/value pairs are applied to the entry if the pattern matches.
+            processes (int | None): Maximum number of worker processes checksumming slides and extracting
+                their metadata. If None, the metadata_scan_processes setting is used.
+            progress_callable (Callable[[int, int, Path], None] | None): Called with the number of slides scanned,
+                the total number of slides and the path of the slide scanned last.
 
         Returns:
             dict[str, Any]: The generated metadata.
@@ -435,50 +744,44 @@ class Service(BaseService):
         metadata = []
 
         try:
-            for extension in list(WSI_SUPPORTED_FILE_EXTENSIONS):
-                for file_path in source_directory.glob(f"**/*{extension}"):
-                    # Generate CRC32C checksum with google_crc32c and encode as base64
-                    hash_sum = google_crc32c.Checksum()  # type: ignore[no-untyped-call]
-                    with file_path.open("rb") as f:
-                        while chunk := f.read(1024):
-                            hash_sum.update(chunk)  # type: ignore[no-untyped-call]
-                    checksum = str(base64.b64encode(hash_sum.digest()), "UTF-8")  # type: ignore[no-untyped-call]
-                    try:
-                        image_metadata = WSIService().get_metadata(file_path)
-                        width = image_metadata["dimensions"]["width"]
-                        height = image_metadata["dimensions"]["height"]
-                        mpp = image_metadata["resolution"]["mpp_x"]
-                        file_size_human = image_metadata["file"]["size_human"]
-                        reference = file_path.absolute()
-                        entry = {
-                            "reference": str(reference),
-                            "reference_short": str(reference.name),
-                            "source": str(file_path),
-                            "checksum_base64_crc32c": checksum,
-                            "resolution_mpp": mpp,
-                            "width_px": width,
-                            "height_px": height,
-                            "staining_method": None,
-                            "tissue": None,
-                            "disease": None,
-                            "file_size_human": file_size_human,
-                            "file_upload_progress": 0.0,
-                            "platform_bucket_url": None,
-                        }
-                        if not with_gui_metadata:
-                            entry.pop("reference_short", None)
-                            entry.pop("source", None)
-                            entry.pop("file_size_human", None)
-                            entry.pop("file_upload_progress", None)
-
-                        if mappings:
-                            Service._apply_mappings_to_entry(entry, mappings)
-
-                        metadata.append(entry)
-                    except Exception as e:  # noqa: BLE001
-                        message = f"Failed to process file '{file_path}': {e}"
-                        logger.warning(message)
-                        continue
+            file_paths = Service._find_slides(source_directory)
+            scan_results = Service._scan_slides(
+                file_paths, processes or load_settings(Settings).metadata_scan_processes, progress_callable
+            )
+            for file_path, (checksum, image_metadata, error) in zip(file_paths, scan_results, strict=True):
+                try:
+                    if error is not None:
+                        raise RuntimeError(error)  # noqa: TRY301
+                    reference = file_path.absolute()
+                    entry = {
+                        "reference": str(reference),
+                        "reference_short": str(reference.name),
+                        "source": str(file_path),
+                        "checksum_base64_crc32c": checksum,
+                        "resolution_mpp": image_metadata["mpp"],
+                        "width_px": image_metadata["width"],
+                        "height_px": image_metadata["height"],
+                        "staining_method": None,
+                        "tissue": None,
+                        "disease": None,
+                        "file_size_human": image_metadata["file_size_human"],
+                        "file_upload_progress": 0.0,
+                        "platform_bucket_url": None,
+                    }
+                    if not with_gui_metadata:
+                        entry.pop("reference_short", None)
+                        entry.pop("source", None)
+                        entry.pop("file_size_human", None)
+                        entry.pop("file_upload_progress", None)
+
+                    if mappings:
+                        Service._apply_mappings_to_entry(entry, mappings)
+
+                    metadata.append(entry)
+                except Exception as e:  # noqa: BLE001
+                    message = f"Failed to process file '{file_path}': {e}"
+                    logger.warning(message)
+                    continue
 
             logger.debug("Generated metadata for %d files", len(metadata))
             return metadata
@@ -489,15 +792,80 @@ class Service(BaseService):
             raise RuntimeError(message) from e
 
     @staticmethod
-    def application_run_upload(
+    def _find_slides(source_directory: Path) -> list[Path]:
+        """Find whole slide images in the source directory with a single directory walk.
+
+        Files are grouped by supported extension and keep the walk order within each group,
+        which is the order of globbing the source directory once per extension.
+
+        Args:
+            source_directory (Path): The source directory to search recursively.
+
+        Returns:
+            list[Path]: The paths of the whole slide images found.
+        """
+        extensions = list(WSI_SUPPORTED_FILE_EXTENSIONS)
+        file_paths_per_extension: list[list[Path]] = [[] for _ in extensions]
+        for file_path in source_directory.rglob("*"):
+            for index, extension in enumerate(extensions):
+                if file_path.match(f"*{extension}"):
+                    file_paths_per_extension[index].append(file_path)
+                    break
+        return [file_path for file_paths in file_paths_per_extension for file_path in file_paths]
+
+    @staticmethod
+    def _scan_slides(
+        file_paths: list[Path],
+        processes: int,
+        progress_callable: Callable[[int, int, Path], None] | None = None,
+    ) -> list[tuple[str, dict[str, Any], str | None]]:
+        """Checksum slides and extract their metadata, in parallel worker processes if more than one.
+
+        Args:
+            file_paths (list[Path]): The slides to scan.
+            processes (int): Maximum number of worker processes.
+            progress_callable (Callable[[int, int, Path], None] | None): Called with the number of slides scanned,
+                the total number of slides and the path of the slide scanned last, in order of completion.
+
+        Returns:
+            list[tuple[str, dict[str, Any], str | None]]: Per slide, in order of file_paths, the checksum,
+                the extracted metadata and the error extracting the metadata, if any.
+        """
+        results: list[tuple[str, dict[str, Any], str | None] | None] = [None] * len(file_paths)
+        if processes <= 1 or len(file_paths) <= 1:
+            for index, file_path in enumerate(file_paths):
+                results[index] = _scan_slide(file_path)
+                if progress_callable:
+                    progress_callable(index + 1, len(file_paths), file_path)
+            return cast("list[tuple[str, dict[str, Any], str | None]]", results)
+
+        with ProcessPoolExecutor(max_workers=min(processes, len(file_paths))) as executor:
+            futures = {executor.submit(_scan_slide, file_path): index for index, file_path in enumerate(file_paths)}
+            try:
+                for scanned, future in enumerate(as_completed(futures), start=1):
+                    results[futures[future]] = future.result()
+                    if progress_callable:
+                        progress_callable(scanned, len(file_paths), file_paths[futures[future]])
+            except BaseException:
+                executor.shutdown(wait=True, cancel_futures=True)
+                raise
+        return cast("list[tuple[str, dict[str, Any], str | None]]", results)
+
+    @staticmethod
+    def application_run_upload(  # noqa: PLR0913, PLR0917
         application_version_id: str,
         metadata: list[dict[str, Any]],
         upload_prefix: str,
         upload_progress_queue: Any | None = None,  # noqa: ANN401
         upload_progress_callable: Callable[[int, Path, str], None] | None = None,
+        skip_unchanged: bool = False,
     ) -> bool:
         """Upload files with a progress queue.
 
+        Files are uploaded concurrently, bounded by the upload_file_concurrency setting, sharing a
+        single presigning client and the pooled HTTP session of the process. Large files are uploaded as resumable
+        multipart uploads, so uploading again with the same upload prefix continues interrupted uploads.
+
         Args:
             application_version_id (str): The ID of the application version.
                 If application id is given, the latest version of that application is used.
@@ -505,6 +873,8 @@ class Service(BaseService):
             upload_prefix (str): The prefix for the upload.
             upload_progress_queue (Queue | None): The queue to send progress updates to.
             upload_progress_callable (Callable[[int, Path, str], None] | None): The task to update for progress updates.
+            skip_unchanged (bool): If True, files already present in the bucket with identical size and
+                checksum are not uploaded again, but reported as uploaded.
 
         Returns:
             bool: True if the upload was successful, False otherwise.
@@ -513,73 +883,142 @@ class Service(BaseService):
             NotFoundException: If the application version with the given ID is not found.
             RuntimeError: If fetching the application version fails unexpectedly.
             requests.HTTPError: If the upload fails with an HTTP error.
+            botocore.exceptions.ClientError: If a multipart upload fails after retrying its parts.
         """
         import psutil  # noqa: PLC0415
 
         logger.debug("Uploading files with upload ID '%s'", upload_prefix)
         application_version = Service().application_version(application_version_id, use_latest_if_no_version_given=True)
         for row in metadata:
-            reference = row["reference"]
-            source_file_path = Path(row["reference"])
-            if not source_file_path.is_file():
-                logger.warning("Source file '%s' does not exist.", row["referebce"])
+            if not Path(row["reference"]).is_file():
+                logger.warning("Source file '%s' does not exist.", row["reference"])
                 return False
-            username = psutil.Process().username().replace("\\", "_")
+        if not metadata:
+            logger.info("Upload completed successfully.")
+            return True
+
+        username = psutil.Process().username().replace("\\", "_")
+        bucket_service = BucketService()
+        bucket_url = f"{bucket_service.get_bucket_protocol()}://{bucket_service.get_bucket_name()}"
+        uploads: list[tuple[str, Path, str, str]] = []
+        for row in metadata:
+            source_file_path = Path(row["reference"])
             object_key = (
                 f"{username}/{upload_prefix}/{application_version.application_version_id}/{source_file_path.name}"
             )
-            platform_bucket_url = (
-                f"{BucketService().get_bucket_protocol()}://{BucketService().get_bucket_name()}/{object_key}"
-            )
-            signed_upload_url = BucketService().create_signed_upload_url(object_key)
-            logger.debug("Generated signed upload URL '%s' for object '%s'", signed_upload_url, platform_bucket_url)
-            if upload_progress_queue:
-                upload_progress_queue.put_nowait({
-                    "reference": reference,
-                    "platform_bucket_url": platform_bucket_url,
-                })
-            file_size = source_file_path.stat().st_size
+            uploads.append((row["reference"], source_file_path, object_key, f"{bucket_url}/{object_key}"))
+
+        concurrency = min(load_settings(Settings).upload_file_concurrency, len(uploads))
+        tracker = _UploadProgressTracker(
+            total_size=sum(source_file_path.stat().st_size for _, source_file_path, _, _ in uploads),
+            upload_progress_queue=upload_progress_queue,
+            upload_progress_callable=upload_progress_callable,
+        )
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="upload") as executor:
+            futures = [
+                executor.submit(
+                    Service._upload_file_with_progress,
+                    bucket_service,
+                    tracker,
+                    reference,
+                    source_file_path,
+                    object_key,
+                    platform_bucket_url,
+                    skip_unchanged,
+                )
+                for reference, source_file_path, object_key, platform_bucket_url in uploads
+            ]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except BaseException:
+                executor.shutdown(wait=True, cancel_futures=True)
+                raise
+        logger.info("Upload completed successfully.")
+        return True
+
+    @staticmethod
+    def _upload_file_with_progress(  # noqa: PLR0913, PLR0917
+        bucket_service: BucketService,
+        tracker: "_UploadProgressTracker",
+        reference: str,
+        source_file_path: Path,
+        object_key: str,
+        platform_bucket_url: str,
+        skip_unchanged: bool = False,
+    ) -> None:
+        """Upload a single file, reporting progress to the tracker.
+
+        Large files are uploaded as resumable multipart uploads, continuing interrupted uploads
+        of the same file to the same object. Other files are uploaded via a signed URL.
+
+        Args:
+            bucket_service (BucketService): Bucket service shared by upload workers.
+            tracker (_UploadProgressTracker): Tracker aggregating the progress of all upload workers.
+            reference (str): The reference of the file in the metadata.
+            source_file_path (Path): Path of the local file.
+            object_key (str): Key of the object in the platform bucket.
+            platform_bucket_url (str): URL of the object in the platform bucket.
+            skip_unchanged (bool): If True, skip the upload if the object exists with identical content.
+
+        Raises:
+            requests.HTTPError: If the upload fails with an HTTP error.
+            botocore.exceptions.ClientError: If the multipart upload fails after retrying its parts.
+        """
+        file_size = source_file_path.stat().st_size
+        if skip_unchanged and bucket_service.is_object_unchanged(source_file_path, object_key):
+            logger.debug("Skipping upload of unchanged file '%s' to '%s'", source_file_path, platform_bucket_url)
+            tracker.start_file(reference, platform_bucket_url)
+            tracker.update(reference, source_file_path, platform_bucket_url, file_size, file_size, file_size)
+            return
+        if bucket_service.is_multipart_upload(file_size):
             logger.debug(
-                "Uploading file '%s' with size %d bytes to '%s' via '%s'",
+                "Uploading file '%s' with size %d bytes to '%s' in parts",
                 source_file_path,
                 file_size,
                 platform_bucket_url,
-                signed_upload_url,
             )
-            with (
-                open(source_file_path, "rb") as f,
-            ):
+            tracker.start_file(reference, platform_bucket_url)
+            uploaded_size = 0
 
-                def read_in_chunks(  # noqa: PLR0913, PLR0917
-                    reference: str,
-                    file_size: int,
-                    upload_progress_queue: Any | None = None,  # noqa: ANN401
-                    upload_progress_callable: Callable[[int, Path, str], None] | None = None,
-                    file_path: Path = source_file_path,
-                    platform_bucket_url: str = platform_bucket_url,
-                ) -> Generator[bytes, None, None]:
-                    while True:
-                        chunk = f.read(APPLICATION_RUN_UPLOAD_CHUNK_SIZE)
-                        if not chunk:
-                            break
-                        if upload_progress_queue:
-                            upload_progress_queue.put_nowait({
-                                "reference": reference,
-                                "file_upload_progress": min(100.0, f.tell() / file_size),
-                            })
-                        if upload_progress_callable:
-                            upload_progress_callable(len(chunk), file_path, platform_bucket_url)
-                        yield chunk
-
-                response = requests.put(
-                    signed_upload_url,
-                    data=read_in_chunks(reference, file_size, upload_progress_queue, upload_progress_callable),
-                    headers={"Content-Type": "application/octet-stream"},
-                    timeout=60,
-                )
-                response.raise_for_status()
-        logger.info("Upload completed successfully.")
-        return True
+            def part_uploaded(part_size: int, file_path: Path) -> None:
+                nonlocal uploaded_size
+                uploaded_size += part_size
+                tracker.update(reference, file_path, platform_bucket_url, part_size, uploaded_size, file_size)
+
+            bucket_service.upload_file_multipart(source_file_path, object_key, part_uploaded)
+            return
+
+        signed_upload_url = bucket_service.create_signed_upload_url(object_key)
+        logger.debug(
+            "Uploading file '%s' with size %d bytes to '%s' via '%s'",
+            source_file_path,
+            file_size,
+            platform_bucket_url,
+            signed_upload_url,
+        )
+        tracker.start_file(reference, platform_bucket_url)
+        with open(source_file_path, "rb") as f:
+
+            def read_in_chunks() -> Generator[bytes, None, None]:
+                uploaded_size = 0
+                while True:
+                    chunk = f.read(APPLICATION_RUN_UPLOAD_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    uploaded_size += len(chunk)
+                    tracker.update(
+                        reference, source_file_path, platform_bucket_url, len(chunk), uploaded_size, file_size
+                    )
+                    yield chunk
+
+            response = get_http_session().put(
+                signed_upload_url,
+                data=read_in_chunks(),
+                headers={"Content-Type": "application/octet-stream"},
+            )
+            response.raise_for_status()
+        logger.debug("Uploaded file '%s' to '%s'", source_file_path, platform_bucket_url)
 
     @staticmethod
     def application_runs_static(limit: int | None = None, completed_only: bool = False) -> list[dict[str, Any]]:
@@ -680,13 +1119,14 @@ class Service(BaseService):
         """
         logger.debug("Submitting application run with metadata: %s", metadata)
         items = []
+        bucket_service = BucketService()
         for row in metadata:
             platform_bucket_url = row["platform_bucket_url"]
             if platform_bucket_url and platform_bucket_url.startswith("gs://"):
                 url_parts = platform_bucket_url[5:].split("/", 1)
                 bucket_name = url_parts[0]
                 object_key = url_parts[1]
-                download_url = BucketService().create_signed_download_url(object_key, bucket_name)
+                download_url = bucket_service.create_signed_download_url(object_key, bucket_name)
             else:
                 message = f"Invalid platform bucket URL: '{platform_bucket_url}'."
                 logger.warning(message)
@@ -847,6 +1287,8 @@ class Service(BaseService):
         qupath_project: bool = False,
         download_progress_queue: Any | None = None,  # noqa: ANN401
         download_progress_callable: Callable | None = None,  # type: ignore[type-arg]
+        item_concurrency: int | None = None,
+        artifact_concurrency: int | None = None,
     ) -> Path:
         """Download application run results with progress tracking.
 
@@ -864,6 +1306,10 @@ class Service(BaseService):
                 of the destination directory.
             download_progress_queue (Queue | None): Queue for GUI progress updates.
             download_progress_callable (Callable | None): Callback for CLI progress updates.
+            item_concurrency (int | None): Maximum number of items downloaded concurrently.
+                If None, the download_item_concurrency setting is used.
+            artifact_concurrency (int | None): Maximum number of artifacts per item downloaded concurrently.
+                If None, the download_artifact_concurrency setting is used.
 
         Returns:
             Path: The directory containing downloaded results.
@@ -933,19 +1379,30 @@ class Service(BaseService):
         Service._update_progress(progress, download_progress_callable, download_progress_queue)
 
         downloaded_items: set[str] = set()  # Track downloaded items to avoid re-downloading
+        result_tracker = ItemResultTracker(application_run)  # Only polls results of items not yet finished
         while True:
             run_details = application_run.details()  # (Re)load current run details
             progress.run = run_details
             Service._update_progress(progress, download_progress_callable, download_progress_queue)
 
+            poll = result_tracker.poll()
+            logger.debug(
+                "Polled results of run '%s': %d items finished, %d pending, %d requests",
+                run_id,
+                len(poll.finished),
+                poll.pending_count,
+                poll.request_count,
+            )
             self._download_available_items(
                 progress,
-                application_run,
+                list(result_tracker.items.values()),
                 final_destination_directory,
                 downloaded_items,
                 create_subdirectory_per_item,
                 download_progress_queue,
                 download_progress_callable,
+                item_concurrency or self._settings.download_item_concurrency,
+                artifact_concurrency or self._settings.download_artifact_concurrency,
             )
 
             if run_details.status in {
@@ -972,7 +1429,7 @@ class Service(BaseService):
             )
             progress.status = DownloadProgressState.WAITING
             Service._update_progress(progress, download_progress_callable, download_progress_queue)
-            time.sleep(APPLICATION_RUN_DOWNLOAD_SLEEP_SECONDS)
+            time.sleep(poll.next_poll_in_seconds)
 
         if qupath_project:
             logger.debug("Adding result images to QuPath project ...")
@@ -1059,69 +1516,133 @@ class Service(BaseService):
     def _download_available_items(  # noqa: PLR0913, PLR0917
         self,
         progress: DownloadProgress,
-        application_run: ApplicationRun,
+        items: list[ItemResult],
         destination_directory: Path,
         downloaded_items: set[str],
         create_subdirectory_per_item: bool = False,
         download_progress_queue: Any | None = None,  # noqa: ANN401
         download_progress_callable: Callable | None = None,  # type: ignore[type-arg]
+        item_concurrency: int = 1,
+        artifact_concurrency: int = 1,
     ) -> None:
         """Download items that are available and not yet downloaded.
 
+        Items are downloaded by a bounded pool of item_concurrency workers, each downloading
+        up to artifact_concurrency artifacts of its item concurrently. If any download fails,
+        pending downloads are canceled and the error is raised.
+
         Args:
             progress (DownloadProgress): Progress tracking object for GUI or CLI updates.
-            application_run (ApplicationRun): The application run object.
+            items (list[ItemResult]): The latest known results of all items of the run.
             destination_directory (Path): Directory to save files.
             downloaded_items (set): Set of already downloaded item references.
             create_subdirectory_per_item (bool): Whether to create a subdirectory for each item.
             download_progress_queue (Queue | None): Queue for GUI progress updates.
             download_progress_callable (Callable | None): Callback for CLI progress updates.
+            item_concurrency (int): Maximum number of items downloaded concurrently.
+            artifact_concurrency (int): Maximum number of artifacts per item downloaded concurrently.
         """
-        items = list(application_run.results())
         progress.item_count = len(items)
-        for item_index, item in enumerate(items):
-            if item.reference in downloaded_items:
-                continue
+        pending_items = [
+            (item_index, item)
+            for item_index, item in enumerate(items)
+            if item.reference not in downloaded_items and item.status == ItemStatus.SUCCEEDED
+        ]
+        if not pending_items:
+            return
 
-            if item.status == ItemStatus.SUCCEEDED:
-                progress.status = DownloadProgressState.DOWNLOADING
-                progress.item_index = item_index
-                progress.item = item
-                progress.item_reference = item.reference
+        tracker = _DownloadProgressTracker(progress, download_progress_queue, download_progress_callable)
+        if item_concurrency <= 1:
+            for item_index, item in pending_items:
+                self._download_item(
+                    tracker, item_index, item, destination_directory, create_subdirectory_per_item, artifact_concurrency
+                )
+                downloaded_items.add(item.reference)
+            return
 
-                progress.artifact_count = len(item.output_artifacts)
-                Service._update_progress(progress, download_progress_callable, download_progress_queue)
+        with ThreadPoolExecutor(max_workers=item_concurrency, thread_name_prefix="download-item") as executor:
+            futures = {
+                executor.submit(
+                    self._download_item,
+                    tracker,
+                    item_index,
+                    item,
+                    destination_directory,
+                    create_subdirectory_per_item,
+                    artifact_concurrency,
+                ): item
+                for item_index, item in pending_items
+            }
+            try:
+                for future in as_completed(futures):
+                    future.result()
+                    downloaded_items.add(futures[future].reference)
+            except BaseException:
+                executor.shutdown(wait=True, cancel_futures=True)
+                raise
+
+    def _download_item(  # noqa: PLR0913, PLR0917
+        self,
+        tracker: _DownloadProgressTracker,
+        item_index: int,
+        item: ItemResult,
+        destination_directory: Path,
+        create_subdirectory_per_item: bool = False,
+        artifact_concurrency: int = 1,
+    ) -> None:
+        """Download all artifacts of a succeeded item.
 
-                if create_subdirectory_per_item:
-                    reference_path = Path(item.reference)
-                    stem_name = reference_path.stem
-                    try:
-                        # Handle case where reference might be relative to destination
-                        rel_path = reference_path.relative_to(destination_directory)
-                        stem_name = rel_path.stem
-                    except ValueError:
-                        # Not a subfolder - just use the stem
-                        pass
-                    item_directory = destination_directory / stem_name
-                else:
-                    item_directory = destination_directory
-                item_directory.mkdir(exist_ok=True)
-
-                for artifact_index, artifact in enumerate(item.output_artifacts):
-                    progress.artifact_index = artifact_index
-                    progress.artifact = artifact
-                    Service._update_progress(progress, download_progress_callable, download_progress_queue)
+        Args:
+            tracker (_DownloadProgressTracker): Tracker to report progress to.
+            item_index (int): Index of the item in the run.
+            item (ItemResult): The item to download the artifacts of.
+            destination_directory (Path): Directory to save files.
+            create_subdirectory_per_item (bool): Whether to create a subdirectory for the item.
+            artifact_concurrency (int): Maximum number of artifacts downloaded concurrently.
+        """
+        if create_subdirectory_per_item:
+            reference_path = Path(item.reference)
+            stem_name = reference_path.stem
+            try:
+                # Handle case where reference might be relative to destination
+                rel_path = reference_path.relative_to(destination_directory)
+                stem_name = rel_path.stem
+            except ValueError:
+                # Not a subfolder - just use the stem
+                pass
+            item_directory = destination_directory / stem_name
+        else:
+            item_directory = destination_directory
+        item_directory.mkdir(exist_ok=True)
+
+        def download_artifact(artifact_index: int, artifact: OutputArtifactElement) -> None:
+            worker_progress = tracker.start_artifact(item_index, item, artifact_index, artifact)
+            self._download_item_artifact(
+                worker_progress,
+                artifact,
+                item_directory,
+                item.reference if not create_subdirectory_per_item else "",
+                None,
+                tracker.update,
+            )
+            tracker.finish_artifact(worker_progress)
 
-                    self._download_item_artifact(
-                        progress,
-                        artifact,
-                        item_directory,
-                        item.reference if not create_subdirectory_per_item else "",
-                        download_progress_queue,
-                        download_progress_callable,
-                    )
+        if artifact_concurrency <= 1:
+            for artifact_index, artifact in enumerate(item.output_artifacts):
+                download_artifact(artifact_index, artifact)
+            return
 
-                downloaded_items.add(item.reference)
+        with ThreadPoolExecutor(max_workers=artifact_concurrency, thread_name_prefix="download-artifact") as executor:
+            futures = [
+                executor.submit(download_artifact, artifact_index, artifact)
+                for artifact_index, artifact in enumerate(item.output_artifacts)
+            ]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except BaseException:
+                executor.shutdown(wait=True, cancel_futures=True)
+                raise
 
     def _download_item_artifact(  # noqa: PLR0913, PLR0917
         self,
@@ -1158,15 +1679,9 @@ class Service(BaseService):
             / f"{prefix}{sanitize_path_component(artifact.name)}{get_file_extension_for_artifact(artifact)}"
         )
 
-        if artifact_path.exists():
-            checksum = google_crc32c.Checksum()  # type: ignore[no-untyped-call]
-            with open(artifact_path, "rb") as f:
-                while chunk := f.read(APPLICATION_RUN_FILE_READ_CHUNK_SIZE):
-                    checksum.update(chunk)  # type: ignore[no-untyped-call]
-            existing_checksum = base64.b64encode(checksum.digest()).decode("ascii")  # type: ignore[no-untyped-call]
-            if existing_checksum == metadata_checksum:
-                logger.debug("File %s already exists with correct checksum", artifact_path)
-                return
+        if artifact_path.exists() and calculate_file_crc32c(artifact_path, use_cache=True) == metadata_checksum:
+            logger.debug("File %s already exists with correct checksum", artifact_path)
+            return
 
         self._download_file_with_progress(
             progress,
@@ -1175,6 +1690,7 @@ class Service(BaseService):
             metadata_checksum,
             download_progress_queue,
             download_progress_callable,
+            segment_count=self._settings.download_segment_count,
         )
 
     @staticmethod
@@ -1185,8 +1701,18 @@ class Service(BaseService):
         metadata_checksum: str,
         download_progress_queue: Any | None = None,  # noqa: ANN401
         download_progress_callable: Callable | None = None,  # type: ignore[type-arg]
+        segment_count: int = 1,
     ) -> None:
-        """Download a file with progress tracking support.
+        """Download a file with progress tracking support, resuming interrupted downloads.
+
+        The file is downloaded to a partial file next to the artifact path. The byte offset and
+        the running CRC32C of the partial file are checkpointed in a sidecar, so an interrupted download
+        continues with an HTTP range request where it left off. The partial file is moved to the artifact
+        path only after the checksum of the complete content was verified.
+
+        Large files not yet partially downloaded are split into up to segment_count byte ranges fetched
+        concurrently, if the server supports range requests. The offset and running CRC32C of each segment
+        are checkpointed, so an interrupted segmented download continues each segment where it left off.
 
         Args:
             progress (DownloadProgress): Progress tracking object for GUI or CLI updates.
@@ -1195,6 +1721,7 @@ class Service(BaseService):
             metadata_checksum (str): Expected CRC32C checksum in base64.
             download_progress_queue (Any | None): Queue for GUI progress updates.
             download_progress_callable (Callable | None): Callback for CLI progress updates.
+            segment_count (int): Maximum number of byte ranges downloaded concurrently.
 
         Raises:
             ValueError: If checksum verification fails.
@@ -1214,24 +1741,197 @@ class Service(BaseService):
         progress.artifact_size = None
         Service._update_progress(progress, download_progress_callable, download_progress_queue)
 
-        checksum = google_crc32c.Checksum()  # type: ignore[no-untyped-call]
+        part_path = artifact_path.with_name(f"{artifact_path.name}{APPLICATION_RUN_DOWNLOAD_PART_SUFFIX}")
+        checkpoint_path = part_path.with_name(f"{part_path.name}{APPLICATION_RUN_DOWNLOAD_CHECKPOINT_SUFFIX}")
+        checkpoint = DownloadCheckpoint.load(part_path, checkpoint_path, metadata_checksum)
+        if checkpoint.segments:
+            logger.debug("Resuming segmented download of '%s'", artifact_path)
+            size = checkpoint.size
+        elif checkpoint.offset:
+            logger.debug("Resuming download of '%s' at byte offset %d", artifact_path, checkpoint.offset)
+            size = None
+        else:
+            size = get_download_size_if_ranges_supported(signed_url) if segment_count > 1 else None
+        if size is not None and (checkpoint.segments or get_segment_count(size, segment_count) > 1):
+            downloaded_checksum = Service._download_segments_to_partial_file(
+                progress,
+                signed_url,
+                part_path,
+                checkpoint_path,
+                checkpoint,
+                size,
+                get_segment_count(size, segment_count),
+                download_progress_queue,
+                download_progress_callable,
+            )
+        else:
+            Service._download_range_to_partial_file(
+                progress,
+                signed_url,
+                part_path,
+                checkpoint_path,
+                checkpoint,
+                download_progress_queue,
+                download_progress_callable,
+            )
+            downloaded_checksum = checkpoint.checksum_base64()
 
-        with requests.get(signed_url, stream=True, timeout=60) as stream:
-            stream.raise_for_status()
-            progress.artifact_size = int(stream.headers.get("content-length", 0))
-            Service._update_progress(progress, download_progress_callable, download_progress_queue)
-            with open(artifact_path, mode="wb") as file:
-                for chunk in stream.iter_content(chunk_size=APPLICATION_RUN_DOWNLOAD_CHUNK_SIZE):
-                    if chunk:
-                        file.write(chunk)
-                        checksum.update(chunk)  # type: ignore[no-untyped-call]
-                        progress.artifact_downloaded_chunk_size = len(chunk)
-                        progress.artifact_downloaded_size += progress.artifact_downloaded_chunk_size
-                        Service._update_progress(progress, download_progress_callable, download_progress_queue)
-
-        downloaded_checksum = base64.b64encode(checksum.digest()).decode("ascii")  # type: ignore[no-untyped-call]
         if downloaded_checksum != metadata_checksum:
-            artifact_path.unlink()  # Remove corrupted file
+            part_path.unlink(missing_ok=True)  # Remove corrupted file
+            checkpoint_path.unlink(missing_ok=True)
             msg = f"Checksum mismatch for {artifact_path}: {downloaded_checksum} != {metadata_checksum}"
             logger.error(msg)
             raise ValueError(msg)
+        part_path.replace(artifact_path)
+        checkpoint_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _download_segments_to_partial_file(  # noqa: PLR0913, PLR0917
+        progress: DownloadProgress,
+        signed_url: str,
+        part_path: Path,
+        checkpoint_path: Path,
+        checkpoint: DownloadCheckpoint,
+        size: int,
+        segment_count: int,
+        download_progress_queue: Any | None = None,  # noqa: ANN401
+        download_progress_callable: Callable | None = None,  # type: ignore[type-arg]
+    ) -> str:
+        """Download a file as concurrently fetched byte ranges into a preallocated partial file.
+
+        Continues the checkpointed segments if any, otherwise starts a new segmented download.
+
+        Args:
+            progress (DownloadProgress): Progress tracking object for GUI or CLI updates.
+            signed_url (str): The signed URL to download from.
+            part_path (Path): Path of the partial file.
+            checkpoint_path (Path): Path of the checkpoint sidecar.
+            checkpoint (DownloadCheckpoint): The checkpoint to continue from, updated in place.
+            size (int): Total size of the file in bytes.
+            segment_count (int): Number of byte ranges downloaded concurrently, if starting a new download.
+            download_progress_queue (Any | None): Queue for GUI progress updates.
+            download_progress_callable (Callable | None): Callback for CLI progress updates.
+
+        Returns:
+            str: The CRC32C checksum of the downloaded content in base64, combined from the segments.
+        """
+        logger.debug("Downloading '%s' in %d segments", part_path, segment_count)
+        progress.artifact_size = size
+        progress.artifact_downloaded_size = sum(segment.offset for segment in checkpoint.segments)
+        progress.artifact_downloaded_chunk_size = progress.artifact_downloaded_size
+        Service._update_progress(progress, download_progress_callable, download_progress_queue)
+
+        def update_progress(chunk_size: int) -> None:
+            progress.artifact_downloaded_chunk_size = chunk_size
+            progress.artifact_downloaded_size += chunk_size
+            Service._update_progress(progress, download_progress_callable, download_progress_queue)
+
+        def save_checkpoint(segments: list[DownloadSegment]) -> None:
+            checkpoint.size, checkpoint.segments = size, segments
+            checkpoint.save(checkpoint_path)
+
+        return download_file_segmented(
+            signed_url,
+            part_path,
+            size,
+            segment_count,
+            update_progress,
+            chunk_size=APPLICATION_RUN_DOWNLOAD_CHUNK_SIZE,
+            segments=checkpoint.segments or None,
+            checkpoint_callback=save_checkpoint,
+            checkpoint_size=APPLICATION_RUN_DOWNLOAD_CHECKPOINT_SIZE,
+        )
+
+    @staticmethod
+    def _download_range_to_partial_file(  # noqa: PLR0913, PLR0917
+        progress: DownloadProgress,
+        signed_url: str,
+        part_path: Path,
+        checkpoint_path: Path,
+        checkpoint: DownloadCheckpoint,
+        download_progress_queue: Any | None = None,  # noqa: ANN401
+        download_progress_callable: Callable | None = None,  # type: ignore[type-arg]
+    ) -> None:
+        """Download a file into a partial file, continuing at the checkpointed offset.
+
+        Args:
+            progress (DownloadProgress): Progress tracking object for GUI or CLI updates.
+            signed_url (str): The signed URL to download from.
+            part_path (Path): Path of the partial file.
+            checkpoint_path (Path): Path of the checkpoint sidecar.
+            checkpoint (DownloadCheckpoint): The checkpoint to continue from, updated in place.
+            download_progress_queue (Any | None): Queue for GUI progress updates.
+            download_progress_callable (Callable | None): Callback for CLI progress updates.
+
+        Raises:
+            requests.HTTPError: If download fails.
+        """
+        headers = {"Range": f"bytes={checkpoint.offset}-"} if checkpoint.offset else {}
+        with get_http_session().get(signed_url, headers=headers, stream=True) as stream:
+            # If the range is not satisfiable, the partial file already holds the complete content
+            if not (checkpoint.offset and stream.status_code == HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE):
+                stream.raise_for_status()
+                if checkpoint.offset and stream.status_code != HTTPStatus.PARTIAL_CONTENT:
+                    logger.debug("Server ignored range request for '%s', restarting download", part_path)
+                    checkpoint.offset, checkpoint.crc32c = 0, 0
+                progress.artifact_size = checkpoint.offset + int(stream.headers.get("content-length", 0))
+                progress.artifact_downloaded_size = checkpoint.offset
+                progress.artifact_downloaded_chunk_size = checkpoint.offset
+                Service._update_progress(progress, download_progress_callable, download_progress_queue)
+                Service._stream_to_partial_file(
+                    stream,
+                    part_path,
+                    checkpoint_path,
+                    checkpoint,
+                    progress,
+                    download_progress_queue,
+                    download_progress_callable,
+                )
+
+    @staticmethod
+    def _stream_to_partial_file(  # noqa: PLR0913, PLR0917
+        stream: requests.Response,
+        part_path: Path,
+        checkpoint_path: Path,
+        checkpoint: DownloadCheckpoint,
+        progress: DownloadProgress,
+        download_progress_queue: Any | None = None,  # noqa: ANN401
+        download_progress_callable: Callable | None = None,  # type: ignore[type-arg]
+    ) -> None:
+        """Append the content of a streamed response to a partial file, checkpointing as we go.
+
+        The checkpoint is persisted periodically and when streaming ends, including on errors,
+        so an interrupted download can be resumed.
+
+        Args:
+            stream (requests.Response): The streamed response providing the content from checkpoint offset on.
+            part_path (Path): Path of the partial file.
+            checkpoint_path (Path): Path of the checkpoint sidecar.
+            checkpoint (DownloadCheckpoint): The checkpoint to continue from, updated in place.
+            progress (DownloadProgress): Progress tracking object for GUI or CLI updates.
+            download_progress_queue (Any | None): Queue for GUI progress updates.
+            download_progress_callable (Callable | None): Callback for CLI progress updates.
+        """
+        with open(part_path, mode="r+b" if checkpoint.offset else "wb") as file:
+            file.truncate(checkpoint.offset)
+            file.seek(checkpoint.offset)
+            checkpointed_offset = checkpoint.offset
+            checksum = StreamingChecksum(crc32c=checkpoint.crc32c)
+            try:
+                for chunk in stream.iter_content(chunk_size=APPLICATION_RUN_DOWNLOAD_CHUNK_SIZE):
+                    if not chunk:
+                        continue
+                    file.write(chunk)
+                    checksum.update(chunk)
+                    checkpoint.crc32c = checksum.crc32c
+                    checkpoint.offset += len(chunk)
+                    if checkpoint.offset - checkpointed_offset >= APPLICATION_RUN_DOWNLOAD_CHECKPOINT_SIZE:
+                        file.flush()
+                        checkpoint.save(checkpoint_path)
+                        checkpointed_offset = checkpoint.offset
+                    progress.artifact_downloaded_chunk_size = len(chunk)
+                    progress.artifact_downloaded_size += progress.artifact_downloaded_chunk_size
+                    Service._update_progress(progress, download_progress_callable, download_progress_queue)
+            finally:
+                file.flush()
+                checkpoint.save(checkpoint_path)
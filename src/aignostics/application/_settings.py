@@ -1,5 +1,8 @@
 """Settings of the application module."""
 
+from typing import Annotated
+
+from pydantic import Field
 from pydantic_settings import SettingsConfigDict
 
 from ..utils import OpaqueSettings, __env_file__, __project_name__  # noqa: TID252
@@ -14,3 +17,59 @@ class Settings(OpaqueSettings):
         env_file=__env_file__,
         env_file_encoding="utf-8",
     )
+
+    download_item_concurrency: Annotated[
+        int,
+        Field(
+            description="Number of items of an application run whose artifacts are downloaded concurrently.",
+            default=4,
+            ge=1,
+            le=32,
+        ),
+    ]
+
+    download_artifact_concurrency: Annotated[
+        int,
+        Field(
+            description="Number of artifacts of a single item downloaded concurrently.",
+            default=2,
+            ge=1,
+            le=16,
+        ),
+    ]
+
+    download_segment_count: Annotated[
+        int,
+        Field(
+            description=(
+                "Maximum number of byte ranges of a single large artifact downloaded concurrently. "
+                "Set to 1 to download each artifact as a single stream."
+            ),
+            default=4,
+            ge=1,
+            le=16,
+        ),
+    ]
+
+    metadata_scan_processes: Annotated[
+        int,
+        Field(
+            description=(
+                "Number of worker processes checksumming slides and extracting their metadata "
+                "when preparing the metadata of a run."
+            ),
+            default=4,
+            ge=1,
+            le=64,
+        ),
+    ]
+
+    upload_file_concurrency: Annotated[
+        int,
+        Field(
+            description="Number of files uploaded concurrently when uploading the slides of an application run.",
+            default=4,
+            ge=1,
+            le=16,
+        ),
+    ]
@@ -13,7 +13,7 @@ import typer
 
 from aignostics.utils import console, get_logger, get_user_data_directory
 
-from ._service import DownloadProgress, Service
+from ._service import DownloadProgress, Service, SyncDirection
 
 MESSAGE_NOT_YET_IMPLEMENTED = "NOT YET IMPLEMENTED"
 
@@ -202,17 +202,18 @@ def download(
         BarColumn(),
         TaskProgressColumn(),
         TimeElapsedColumn(),
+        TimeRemainingColumn(),
+        FileSizeColumn(),
+        TotalFileSizeColumn(),
+        TransferSpeedColumn(),
         TextColumn("[progress.description]{task.description}"),
     )
 
     file_progress = Progress(
         BarColumn(),
         TaskProgressColumn(),
-        TimeElapsedColumn(),
-        TimeRemainingColumn(),
         FileSizeColumn(),
         TotalFileSizeColumn(),
-        TransferSpeedColumn(),
         TextColumn("[progress.description]{task.description}"),
     )
 
@@ -222,30 +223,29 @@ def download(
         subtitle=f"Destination '{destination}'",
     )
 
-    current_file_task: TaskID | None = None
-    main_task = main_progress.add_task("", total=len(matched_objects))
+    file_tasks: dict[str, TaskID] = {}
+    main_task = main_progress.add_task("", total=None)
 
     def progress_callback(progress: DownloadProgress) -> None:
-        nonlocal current_file_task
         main_progress.update(
             main_task,
-            completed=progress.overall_processed,
-            description=f"Object {progress.overall_current} of {progress.overall_total}",
+            completed=progress.overall_downloaded_size,
+            total=progress.overall_total_size,
+            description=f"{progress.overall_processed} of {progress.overall_total} objects",
         )
 
-        if progress.current_file_key:
-            file_description = f"{progress.current_file_key}"
-            if current_file_task is None:
-                current_file_task = file_progress.add_task(file_description, total=progress.current_file_size)
+        if progress.current_file_key in progress.active_file_keys:
+            if progress.current_file_key not in file_tasks:
+                file_tasks[progress.current_file_key] = file_progress.add_task(
+                    progress.current_file_key, total=progress.current_file_size
+                )
             file_progress.update(
-                current_file_task,
+                file_tasks[progress.current_file_key],
                 completed=progress.current_file_downloaded,
                 total=progress.current_file_size,
-                description=file_description,
             )
-        elif current_file_task is not None:
-            file_progress.remove_task(current_file_task)
-            current_file_task = None
+        for object_key in set(file_tasks) - set(progress.active_file_keys):
+            file_progress.remove_task(file_tasks.pop(object_key))
 
     try:
         with Live(progress_group, console=console, refresh_per_second=10, transient=True):
@@ -257,7 +257,7 @@ def download(
         sys.exit(2)
 
     for downloaded_path in result.downloaded:
-        console.print(f"[green]✓[/green] Downloaded: {downloaded_path.name}")
+        console.print(f"[green]✓[/green] Downloaded: {downloaded_path.relative_to(destination)}")
 
     for failed_key in result.failed:
         console.print(f"[red]✗[/red] Failed: {failed_key}")
@@ -268,6 +268,93 @@ def download(
     )
 
 
+@cli.command()
+def sync(  # noqa: PLR0913, PLR0917
+    local_directory: Annotated[
+        Path,
+        typer.Argument(
+            help="Local directory to sync.",
+            file_okay=False,
+            dir_okay=True,
+            resolve_path=True,
+        ),
+    ],
+    prefix: Annotated[
+        str,
+        typer.Argument(help='Prefix in the bucket to sync with. Supports {username}. E.g. "{username}/myproject".'),
+    ],
+    direction: Annotated[
+        SyncDirection,
+        typer.Option(help="Upload the local directory to the prefix, or download the prefix to the local directory."),
+    ] = SyncDirection.UPLOAD,
+    delete: Annotated[
+        bool,
+        typer.Option(help="Delete files or objects at the target that do not exist at the source."),
+    ] = False,
+    checksum: Annotated[
+        bool,
+        typer.Option(help="Compare files of equal size by checksum. If disabled, compare by modification time."),
+    ] = True,
+    dry_run: Annotated[
+        bool,
+        typer.Option(help="If set, only prints the transfer plan, without transferring or deleting anything."),
+    ] = False,
+) -> None:
+    """Sync a local directory with a prefix in bucket on Aignostics Platform, transferring only differences."""
+    import psutil  # noqa: PLC0415
+    from rich.progress import (  # noqa: PLC0415
+        BarColumn,
+        FileSizeColumn,
+        Progress,
+        TaskProgressColumn,
+        TimeRemainingColumn,
+        TotalFileSizeColumn,
+        TransferSpeedColumn,
+    )
+
+    if direction == SyncDirection.UPLOAD and not local_directory.is_dir():
+        console.print(f"[red]Error:[/red] Local directory '{local_directory}' does not exist")
+        sys.exit(2)
+    prefix = prefix.format(username=psutil.Process().username().replace("\\", "_"))
+    service = Service()
+
+    plan = service.plan_sync(local_directory, prefix, direction, delete, checksum)
+    for operation in plan.operations:
+        console.print(
+            f"{operation.action:<13} {operation.object_key} "
+            f"({humanize.naturalsize(operation.size)}, {operation.reason})"
+        )
+    console.print(
+        f"[bold]Plan:[/bold] {plan.transfer_count} to {direction} "
+        f"({humanize.naturalsize(plan.transfer_size)}), {plan.delete_count} to delete, "
+        f"{plan.unchanged_count} unchanged"
+    )
+    if dry_run or not plan.operations:
+        return
+
+    with Progress(
+        BarColumn(),
+        TaskProgressColumn(),
+        TimeRemainingColumn(),
+        FileSizeColumn(),
+        TotalFileSizeColumn(),
+        TransferSpeedColumn(),
+        console=console,
+        transient=True,
+    ) as progress:
+        task = progress.add_task("", total=plan.transfer_size)
+        result = service.sync(plan, lambda transferred: progress.advance(task, transferred))
+
+    for operation in result.failed:
+        console.print(f"[red]✗[/red] Failed to {operation.action}: {operation.object_key}")
+    console.print(
+        f"[bold]Summary:[/bold] [success]{result.succeeded_count}[/success] succeeded, "
+        f"[error]{result.failed_count}[/error] failed"
+    )
+    if result.failed:
+        sys.exit(1)
+
+
 @cli.command()
 def delete(
     what: Annotated[
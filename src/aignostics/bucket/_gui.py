@@ -204,9 +204,12 @@ class PageBuilder(BasePageBuilder):
                             progress.overall_processed / progress.overall_total if progress.overall_total > 0 else 0
                         )
                         bucket_form.overall_progress.set_value(overall_percent)
-                        bucket_form.overall_progress_label.set_text(
-                            f"Overall: {progress.overall_processed} / {progress.overall_total} objects"
-                        )
+                        overall_text = f"Overall: {progress.overall_processed} / {progress.overall_total} objects"
+                        if progress.bytes_per_second > 0:
+                            overall_text += f", {humanize.naturalsize(progress.bytes_per_second)}/s"
+                        if progress.eta_seconds is not None:
+                            overall_text += f", {humanize.naturaldelta(progress.eta_seconds)} remaining"
+                        bucket_form.overall_progress_label.set_text(overall_text)
 
                     # Update file progress
                     if bucket_form.file_progress and bucket_form.file_progress_label and progress.current_file_key:
@@ -1,10 +1,19 @@
 """Service of the bucket module."""
 
+import base64
 import hashlib
+import hmac
+import queue
 import re
-from collections.abc import Callable, Generator
+import threading
+import time
+from collections.abc import Callable, Generator, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import UTC, datetime
+from enum import StrEnum
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
+from urllib.parse import quote, urlparse
 
 import humanize
 import requests
@@ -13,7 +22,18 @@ from pydantic import BaseModel, computed_field
 if TYPE_CHECKING:
     from botocore.client import BaseClient
 
-from aignostics.utils import UNHIDE_SENSITIVE_INFO, BaseService, Health, get_logger, get_user_data_directory
+from aignostics.utils import (
+    UNHIDE_SENSITIVE_INFO,
+    BaseService,
+    FileIdentity,
+    Health,
+    calculate_file_crc32c,
+    calculate_file_md5,
+    calculate_file_multipart_etags,
+    get_http_session,
+    get_logger,
+    get_user_data_directory,
+)
 
 from ._settings import Settings
 
@@ -23,10 +43,106 @@ ENDPOINT_URL_DEFAULT = "https://storage.googleapis.com"
 
 UPLOAD_CHUNK_SIZE = 1024 * 1024
 DOWNLOAD_CHUNK_SIZE = 1024 * 1024 * 10
-ETAG_CHUNK_SIZE = 1024 * 1024 * 100
+S3_MAX_POOL_CONNECTIONS = 32
+
+MULTIPART_UPLOAD_MAX_PARTS = 10_000
+MULTIPART_UPLOAD_RETRY_BACKOFF_SECONDS = 1.0
+MULTIPART_UPLOAD_JOURNAL_SCOPE = "upload_journals"
+# Default part sizes of common S3 clients, tried when inferring the part size of a multipart ETag
+MULTIPART_ETAG_COMMON_PART_SIZES = tuple(size * 1024 * 1024 for size in (5, 8, 15, 16, 32, 64, 100, 128))
+MULTIPART_ETAG_PATTERN = re.compile(r"([0-9a-f]{32})-(\d+)")
+
+DELETE_OBJECTS_MAX_KEYS = 1000
+FIND_LISTING_BUFFERED_PAGES = 2  # Pages buffered per listed prefix ahead of the consumer
+FIND_LISTING_PUT_TIMEOUT_SECONDS = 0.1
+
+REGEX_METACHARACTERS = frozenset(".^$*+?{}[]()|")
+REGEX_OPTIONAL_QUANTIFIERS = frozenset("*?{")
 
 logger = get_logger(__name__)
 
+_s3_clients: dict[tuple[str, str, str, str], "BaseClient"] = {}
+_s3_clients_lock = threading.Lock()
+
+
+def _get_literal_prefix(pattern: str) -> str:
+    """Get the longest literal prefix every key matched by a regex pattern from the start must begin with.
+
+    The derivation is conservative: it stops at the first construct that is not a plain or escaped
+    literal, and yields an empty prefix for patterns with alternations.
+
+    Args:
+        pattern (str): The regex pattern.
+
+    Returns:
+        str: The literal prefix, possibly empty.
+    """
+    if "|" in pattern:
+        return ""
+    prefix: list[str] = []
+    index = 1 if pattern.startswith("^") else 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char == "\\":
+            if index + 1 >= len(pattern) or pattern[index + 1].isalnum():
+                break  # Character classes like \d, backreferences and anchors
+            char = pattern[index + 1]
+            index += 2
+        elif char in REGEX_METACHARACTERS:
+            break
+        else:
+            index += 1
+        if index < len(pattern) and pattern[index] in REGEX_OPTIONAL_QUANTIFIERS:
+            break  # The literal itself is optional
+        prefix.append(char)
+    return "".join(prefix)
+
+
+def _get_multipart_part_sizes(size: int, part_count: int, configured_part_size: int) -> list[int]:
+    """Infer candidate part sizes of an object uploaded in parts from its size and number of parts.
+
+    Candidates are the part size chosen by this SDK, default part sizes of common S3 clients and the
+    smallest part size resulting in the number of parts, each rounded up to full MB. Only candidates
+    that split the object into exactly the given number of parts are returned.
+
+    Args:
+        size (int): Size of the object in bytes.
+        part_count (int): Number of parts as given by the suffix of the ETag.
+        configured_part_size (int): Part size configured for multipart uploads of this SDK.
+
+    Returns:
+        list[int]: Candidate part sizes in bytes, possibly empty.
+    """
+    if size <= 0 or part_count <= 0:
+        return []
+    mb = 1024 * 1024
+    smallest = -(-size // part_count)
+    candidates = [
+        max(configured_part_size, -(-size // MULTIPART_UPLOAD_MAX_PARTS)),
+        *MULTIPART_ETAG_COMMON_PART_SIZES,
+        smallest,
+        -(-smallest // mb) * mb,
+    ]
+    return [
+        part_size for part_size in dict.fromkeys(candidates) if part_size > 0 and -(-size // part_size) == part_count
+    ]
+
+
+def _get_covering_prefixes(prefixes: list[str]) -> list[str]:
+    """Reduce prefixes to the sorted minimal set of prefixes covering all of them.
+
+    Args:
+        prefixes (list[str]): The prefixes.
+
+    Returns:
+        list[str]: Sorted prefixes none of which starts with another.
+    """
+    covering: list[str] = []
+    for prefix in sorted(set(prefixes)):
+        if not covering or not prefix.startswith(covering[-1]):
+            covering.append(prefix)
+    return covering
+
 
 class DownloadProgress(BaseModel):
     overall_total: int
@@ -61,6 +177,178 @@ class DownloadProgress(BaseModel):
             return 0.0
         return float(self.current_file_downloaded) / float(self.current_file_size)
 
+    overall_total_size: int = 0
+    overall_downloaded_size: int = 0
+    elapsed_seconds: float = 0.0
+    active_file_keys: list[str] = []
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def bytes_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.overall_downloaded_size / self.elapsed_seconds
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def eta_seconds(self) -> float | None:
+        if self.bytes_per_second <= 0:
+            return None
+        return max(0, self.overall_total_size - self.overall_downloaded_size) / self.bytes_per_second
+
+
+class _DownloadProgressTracker:
+    """Fans in progress of concurrent object download workers into coherent progress updates.
+
+    Updates of workers are serialized and passed on as snapshots carrying the aggregate counters,
+    and the object the reporting worker is downloading as current file.
+    """
+
+    def __init__(
+        self, progress: DownloadProgress, progress_callback: Callable[[DownloadProgress], None] | None
+    ) -> None:
+        """Initialize tracker.
+
+        Args:
+            progress (DownloadProgress): The shared progress holding aggregate counters.
+            progress_callback (Callable[[DownloadProgress], None] | None): Callback for progress updates.
+        """
+        self._lock = threading.Lock()
+        self._progress = progress
+        self._progress_callback = progress_callback
+        self._started_at = time.monotonic()
+
+    def start(self, object_key: str, size: int) -> None:
+        """Register the start of an object download.
+
+        Args:
+            object_key (str): The key of the object.
+            size (int): The size of the object in bytes.
+        """
+        with self._lock:
+            self._progress.active_file_keys.append(object_key)
+            self._emit(object_key, 0, size)
+
+    def update(self, object_key: str, chunk_size: int, downloaded: int, size: int) -> None:
+        """Account for a chunk downloaded by a worker.
+
+        Args:
+            object_key (str): The key of the object.
+            chunk_size (int): Size of the chunk downloaded in bytes.
+            downloaded (int): Size of the object downloaded so far in bytes.
+            size (int): The size of the object in bytes.
+        """
+        with self._lock:
+            self._progress.overall_downloaded_size += chunk_size
+            self._emit(object_key, downloaded, size)
+
+    def finish(self, object_key: str, downloaded: int, size: int, succeeded: bool) -> None:
+        """Register the completion of an object download, including skipped downloads.
+
+        Args:
+            object_key (str): The key of the object.
+            downloaded (int): Size of the object reported as downloaded in bytes.
+            size (int): The size of the object in bytes.
+            succeeded (bool): Whether the object is present at the destination.
+        """
+        with self._lock:
+            self._progress.active_file_keys.remove(object_key)
+            if succeeded:
+                # Objects skipped as up to date count as downloaded
+                self._progress.overall_downloaded_size += max(0, size - downloaded)
+                self._progress.overall_downloaded += 1
+            else:
+                self._progress.overall_failed += 1
+            self._emit("", 0, 0)
+
+    def _emit(self, object_key: str, downloaded: int, size: int) -> None:
+        """Pass on a snapshot of the progress.
+
+        Must be called while holding the lock.
+
+        Args:
+            object_key (str): The key of the object the reporting worker is downloading, if any.
+            downloaded (int): Size of the object downloaded so far in bytes.
+            size (int): The size of the object in bytes.
+        """
+        if self._progress_callback:
+            self._progress_callback(
+                self._progress.model_copy(
+                    update={
+                        "current_file_key": object_key,
+                        "current_file_downloaded": downloaded,
+                        "current_file_size": size,
+                        "elapsed_seconds": time.monotonic() - self._started_at,
+                        "active_file_keys": list(self._progress.active_file_keys),
+                    }
+                )
+            )
+
+
+class SyncDirection(StrEnum):
+    """Direction of a sync between a local directory and a prefix in the bucket."""
+
+    UPLOAD = "upload"
+    DOWNLOAD = "download"
+
+
+class SyncAction(StrEnum):
+    """Action of a single operation of a sync."""
+
+    UPLOAD = "upload"
+    DOWNLOAD = "download"
+    DELETE_OBJECT = "delete object"
+    DELETE_FILE = "delete file"
+
+
+class SyncOperation(BaseModel):
+    action: SyncAction
+    object_key: str
+    local_path: Path
+    size: int
+    reason: str
+
+
+class SyncPlan(BaseModel):
+    direction: SyncDirection
+    local_directory: Path
+    prefix: str
+    operations: list[SyncOperation]
+    unchanged_count: int
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def transfer_count(self) -> int:
+        return sum(1 for operation in self.operations if operation.action in SYNC_TRANSFER_ACTIONS)
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def transfer_size(self) -> int:
+        return sum(operation.size for operation in self.operations if operation.action in SYNC_TRANSFER_ACTIONS)
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def delete_count(self) -> int:
+        return len(self.operations) - self.transfer_count
+
+
+class SyncResult(BaseModel):
+    succeeded: list[SyncOperation]
+    failed: list[SyncOperation]
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def succeeded_count(self) -> int:
+        return len(self.succeeded)
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def failed_count(self) -> int:
+        return len(self.failed)
+
+
+SYNC_TRANSFER_ACTIONS = frozenset({SyncAction.UPLOAD, SyncAction.DOWNLOAD})
+
 
 class DownloadResult(BaseModel):
     downloaded: list[Path]
@@ -81,7 +369,166 @@ class DownloadResult(BaseModel):
         return self.downloaded_count + self.failed_count
 
 
-class Service(BaseService):
+class DeleteResult(BaseModel):
+    deleted: list[str]
+    failed: dict[str, str]
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def deleted_count(self) -> int:
+        return len(self.deleted)
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def failed_count(self) -> int:
+        return len(self.failed)
+
+
+class ObjectChecksums(BaseModel):
+    """Size and checksums of an object in the bucket, as far as provided by the bucket."""
+
+    size: int
+    crc32c_base64: str | None = None
+    md5_hex: str | None = None
+
+
+class MultipartUploadJournal(BaseModel):
+    """Journal of a resumable multipart upload, persisted in the user data directory.
+
+    Records the parts committed to the bucket, so an interrupted upload of the same unchanged
+    file to the same object continues from the last committed part.
+    """
+
+    bucket_name: str
+    object_key: str
+    source: FileIdentity
+    upload_id: str
+    part_size: int
+    parts: dict[int, str] = {}
+
+    @staticmethod
+    def path_for(bucket_name: str, object_key: str) -> Path:
+        """Get the path of the journal of uploads to an object.
+
+        Args:
+            bucket_name (str): Name of the bucket.
+            object_key (str): Key of the object.
+
+        Returns:
+            Path: Path of the journal.
+        """
+        digest = hashlib.sha256(f"{bucket_name}/{object_key}".encode()).hexdigest()
+        return get_user_data_directory(MULTIPART_UPLOAD_JOURNAL_SCOPE) / f"{digest}.json"
+
+    @classmethod
+    def load(
+        cls, journal_path: Path, bucket_name: str, object_key: str, source: FileIdentity
+    ) -> "MultipartUploadJournal | None":
+        """Load the journal of an upload if it can be resumed.
+
+        An upload can be resumed if it targets the same object and the source file did not change since.
+
+        Args:
+            journal_path (Path): Path of the journal.
+            bucket_name (str): Name of the bucket.
+            object_key (str): Key of the object.
+            source (FileIdentity): The current identity of the source file.
+
+        Returns:
+            MultipartUploadJournal | None: The journal, or None if there is no upload to resume.
+        """
+        try:
+            journal = cls.model_validate_json(journal_path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        if (journal.bucket_name, journal.object_key, journal.source) != (bucket_name, object_key, source):
+            return None
+        return journal
+
+    def save(self, journal_path: Path) -> None:
+        """Persist the journal atomically.
+
+        Args:
+            journal_path (Path): Path of the journal.
+        """
+        temporary_path = journal_path.with_suffix(".tmp")
+        temporary_path.write_text(self.model_dump_json(), encoding="utf-8")
+        temporary_path.replace(journal_path)
+
+
+class SigV4Presigner:
+    """Presigns path-style S3 URLs locally with AWS Signature Version 4 query authentication.
+
+    The signing key and credential scope are derived once, so presigning many objects only costs
+    two hashes and an HMAC per URL. Produces the same URLs as botocore's generate_presigned_url
+    for clients configured with signature_version s3v4 and a custom endpoint.
+    """
+
+    ALGORITHM = "AWS4-HMAC-SHA256"
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        access_key_id: str,
+        secret_access_key: str,
+        region_name: str,
+        endpoint_url: str = ENDPOINT_URL_DEFAULT,
+        expires_in: int = 3600,
+        now: datetime | None = None,
+    ) -> None:
+        """Initialize presigner.
+
+        Args:
+            access_key_id (str): HMAC access key ID.
+            secret_access_key (str): HMAC secret access key.
+            region_name (str): Region of the bucket.
+            endpoint_url (str): The endpoint URL for the S3 service.
+            expires_in (int): Expiration of the presigned URLs in seconds.
+            now (datetime | None): Time the presigned URLs are valid from, defaults to now.
+        """
+        now = now or datetime.now(tz=UTC)
+        date = now.strftime("%Y%m%d")
+        endpoint = urlparse(endpoint_url)
+        self._base_url = f"{endpoint.scheme}://{endpoint.netloc}"
+        self._canonical_headers = f"host:{endpoint.netloc}\n"
+        self._amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+        self._scope = f"{date}/{region_name}/s3/aws4_request"
+        self._query = "&".join(
+            f"{name}={quote(value, safe='-_.~')}"
+            for name, value in (
+                ("X-Amz-Algorithm", self.ALGORITHM),
+                ("X-Amz-Credential", f"{access_key_id}/{self._scope}"),
+                ("X-Amz-Date", self._amz_date),
+                ("X-Amz-Expires", str(expires_in)),
+                ("X-Amz-SignedHeaders", "host"),
+            )
+        )
+        signing_key = f"AWS4{secret_access_key}".encode()
+        for part in (date, region_name, "s3", "aws4_request"):
+            signing_key = hmac.digest(signing_key, part.encode(), "sha256")
+        self._signing_key = signing_key
+
+    def presign(self, method: str, bucket_name: str, object_key: str) -> str:
+        """Presign a URL for an object.
+
+        Args:
+            method (str): HTTP method, e.g. GET or PUT.
+            bucket_name (str): Name of the bucket.
+            object_key (str): Key of the object.
+
+        Returns:
+            str: The presigned URL.
+        """
+        path = f"/{bucket_name}/{quote(object_key, safe='/~')}"
+        canonical_request = f"{method}\n{path}\n{self._query}\n{self._canonical_headers}\nhost\nUNSIGNED-PAYLOAD"
+        string_to_sign = (
+            f"{self.ALGORITHM}\n{self._amz_date}\n{self._scope}\n"
+            f"{hashlib.sha256(canonical_request.encode()).hexdigest()}"
+        )
+        signature = hmac.new(self._signing_key, string_to_sign.encode(), "sha256").hexdigest()
+        return f"{self._base_url}{path}?{self._query}&X-Amz-Signature={signature}"
+
+
+class Service(BaseService):  # noqa: PLR0904
     """Service of the bucket module."""
 
     _settings: Settings
@@ -115,22 +562,60 @@ class Service(BaseService):
     def _get_s3_client(self, endpoint_url: str = ENDPOINT_URL_DEFAULT) -> "BaseClient":
         """Get a Boto3 S3 client instance for cloud bucket on Aignostics Platform.
 
+        Clients are created lazily and cached per endpoint, region and credentials for the lifetime
+        of the process, as clients, unlike sessions, are thread-safe and expensive to create.
+
         Args:
             endpoint_url (str): The endpoint URL for the S3 service.
 
         Returns:
             BaseClient: A Boto3 S3 client instance.
         """
-        from boto3 import Session  # noqa: PLC0415
-        from botocore.client import Config  # noqa: PLC0415
+        access_key_id = self._settings.hmac_access_key_id.get_secret_value()
+        secret_access_key = self._settings.hmac_secret_access_key.get_secret_value()
+        cache_key = (
+            endpoint_url,
+            self._settings.region_name,
+            access_key_id,
+            hashlib.sha256(secret_access_key.encode()).hexdigest(),
+        )
+        with _s3_clients_lock:
+            client = _s3_clients.get(cache_key)
+            if client is None:
+                from boto3 import Session  # noqa: PLC0415
+                from botocore.client import Config  # noqa: PLC0415
+
+                # https://www.kmp.tw/post/accessgcsusepythonboto3/
+                session = Session(
+                    aws_access_key_id=access_key_id,
+                    aws_secret_access_key=secret_access_key,
+                    region_name=self._settings.region_name,
+                )
+                client = session.client(
+                    "s3",
+                    endpoint_url=endpoint_url,
+                    config=Config(signature_version=SIGNATURE_VERSION, max_pool_connections=S3_MAX_POOL_CONNECTIONS),
+                )
+                _s3_clients[cache_key] = client
+            return client
+
+    def _get_presigner(self, expires_in: int, endpoint_url: str = ENDPOINT_URL_DEFAULT) -> SigV4Presigner:
+        """Get a presigner for bulk presigning of URLs valid from now.
 
-        # https://www.kmp.tw/post/accessgcsusepythonboto3/
-        session = Session(
-            aws_access_key_id=self._settings.hmac_access_key_id.get_secret_value(),
-            aws_secret_access_key=self._settings.hmac_secret_access_key.get_secret_value(),
+        Args:
+            expires_in (int): Expiration of the presigned URLs in seconds.
+            endpoint_url (str): The endpoint URL for the S3 service.
+
+        Returns:
+            SigV4Presigner: The presigner.
+        """
+        return SigV4Presigner(
+            access_key_id=self._settings.hmac_access_key_id.get_secret_value(),
+            secret_access_key=self._settings.hmac_secret_access_key.get_secret_value(),
             region_name=self._settings.region_name,
+            endpoint_url=endpoint_url,
+            expires_in=expires_in,
         )
-        return session.client("s3", endpoint_url=endpoint_url, config=Config(signature_version=SIGNATURE_VERSION))
 
     @staticmethod
     def get_bucket_protocol() -> str:
@@ -167,6 +652,257 @@ class Service(BaseService):
         )
         return cast("str", url)
 
+    def get_object_checksums(self, object_key: str, bucket_name: str | None = None) -> ObjectChecksums | None:
+        """Get size and checksums of an object in the bucket with a single HEAD request.
+
+        The CRC32C and MD5 checksums are taken from the x-goog-hash header of Google Cloud Storage.
+        The MD5 checksum is further taken from the ETag, unless the object was uploaded in parts.
+
+        Args:
+            object_key (str): The key of the object.
+            bucket_name (str | None): The name of the bucket. If None, use the default bucket.
+
+        Returns:
+            ObjectChecksums | None: Size and checksums of the object, or None if the object does not exist.
+
+        Raises:
+            botocore.exceptions.ClientError: If the HEAD request fails for other reasons than a missing object.
+        """
+        from botocore.exceptions import ClientError  # noqa: PLC0415
+
+        try:
+            response = self._get_s3_client().head_object(
+                Bucket=self._settings.name if bucket_name is None else bucket_name, Key=object_key
+            )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in {"404", "NoSuchKey", "NotFound"}:
+                return None
+            raise
+        checksums = ObjectChecksums(size=response["ContentLength"])
+        etag = response.get("ETag", "").strip('"')
+        if re.fullmatch(r"[0-9a-f]{32}", etag):
+            checksums.md5_hex = etag
+        goog_hash = response.get("ResponseMetadata", {}).get("HTTPHeaders", {}).get("x-goog-hash", "")
+        for entry in goog_hash.split(","):
+            algorithm, _, value = entry.strip().partition("=")
+            if algorithm == "crc32c":
+                checksums.crc32c_base64 = value
+            elif algorithm == "md5":
+                checksums.md5_hex = base64.b64decode(value).hex()
+        return checksums
+
+    def is_object_unchanged(self, source_path: Path, object_key: str, bucket_name: str | None = None) -> bool:
+        """Check if an object in the bucket has the same content as a local file.
+
+        Compares the size first, then the CRC32C checksum if provided by the bucket, else the MD5 checksum.
+        Checksums of the local file are looked up in and stored to the persistent checksum cache.
+
+        Args:
+            source_path (Path): Path of the local file.
+            object_key (str): The key of the object.
+            bucket_name (str | None): The name of the bucket. If None, use the default bucket.
+
+        Returns:
+            bool: True if the object exists with identical content, False otherwise.
+        """
+        remote = self.get_object_checksums(object_key, bucket_name)
+        if remote is None or remote.size != source_path.stat().st_size:
+            return False
+        if remote.crc32c_base64:
+            return calculate_file_crc32c(source_path, use_cache=True) == remote.crc32c_base64
+        if remote.md5_hex:
+            return calculate_file_md5(source_path, use_cache=True) == remote.md5_hex
+        return False
+
+    def is_multipart_upload(self, size: int) -> bool:
+        """Check if a file is uploaded as resumable multipart upload.
+
+        Args:
+            size (int): Size of the file in bytes.
+
+        Returns:
+            bool: True if the file is uploaded in parts, False if via a single signed URL request.
+        """
+        return size >= self._settings.multipart_upload_threshold
+
+    def upload_file_multipart(
+        self,
+        source_path: Path,
+        object_key: str,
+        callback: Callable[[int, Path], None] | None = None,
+        bucket_name: str | None = None,
+    ) -> None:
+        """Upload a file to the bucket as a resumable multipart upload.
+
+        Parts are uploaded concurrently and retried individually with exponential backoff.
+        Committed parts are recorded in a journal, so an interrupted upload of the unchanged file
+        to the same object continues from the last committed part.
+
+        Args:
+            source_path (Path): Path of the local file to upload.
+            object_key (str): Key to use for the uploaded object.
+            callback (Callable[[int, Path], None] | None): Optional callback function for upload progress.
+                Function receives the number of bytes uploaded since the last call and the source path.
+                Calls are serialized; parts already committed by a previous attempt are reported up front.
+            bucket_name (str | None): The name of the bucket to upload to. If None, use the default bucket.
+
+        Raises:
+            botocore.exceptions.BotoCoreError: If the upload fails after all attempts.
+            botocore.exceptions.ClientError: If the upload fails after all attempts.
+            OSError: If the source file cannot be read.
+        """
+        bucket_name = self._settings.name if bucket_name is None else bucket_name
+        s3 = self._get_s3_client()
+        source = FileIdentity.of(source_path)
+        journal_path = MultipartUploadJournal.path_for(bucket_name, object_key)
+        journal = self._resume_multipart_upload(journal_path, bucket_name, object_key, source)
+        if journal is None:
+            part_size = max(self._settings.multipart_upload_part_size, -(-source.size // MULTIPART_UPLOAD_MAX_PARTS))
+            response = s3.create_multipart_upload(Bucket=bucket_name, Key=object_key)
+            journal = MultipartUploadJournal(
+                bucket_name=bucket_name,
+                object_key=object_key,
+                source=source,
+                upload_id=response["UploadId"],
+                part_size=part_size,
+            )
+            journal.save(journal_path)
+            logger.debug("Started multipart upload '%s' of '%s' to '%s'", journal.upload_id, source_path, object_key)
+
+        part_count = max(1, -(-source.size // journal.part_size))
+        lock = threading.Lock()
+        if callback and journal.parts:
+            callback(sum(self._get_part_length(journal, part_number) for part_number in journal.parts), source_path)
+
+        def upload_part(part_number: int) -> None:
+            etag = self._upload_part(source_path, journal, part_number)
+            with lock:
+                journal.parts[part_number] = etag
+                journal.save(journal_path)
+                if callback:
+                    callback(self._get_part_length(journal, part_number), source_path)
+
+        missing_part_numbers = [number for number in range(1, part_count + 1) if number not in journal.parts]
+        if missing_part_numbers:
+            with ThreadPoolExecutor(
+                max_workers=min(self._settings.multipart_upload_concurrency, len(missing_part_numbers)),
+                thread_name_prefix="upload-part",
+            ) as executor:
+                futures = [executor.submit(upload_part, part_number) for part_number in missing_part_numbers]
+                try:
+                    for future in as_completed(futures):
+                        future.result()
+                except BaseException:
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    raise
+
+        s3.complete_multipart_upload(
+            Bucket=bucket_name,
+            Key=object_key,
+            UploadId=journal.upload_id,
+            MultipartUpload={
+                "Parts": [{"PartNumber": number, "ETag": etag} for number, etag in sorted(journal.parts.items())]
+            },
+        )
+        journal_path.unlink(missing_ok=True)
+        logger.info("Successfully uploaded '%s' to object key '%s' in %d parts", source_path, object_key, part_count)
+
+    def _resume_multipart_upload(
+        self, journal_path: Path, bucket_name: str, object_key: str, source: FileIdentity
+    ) -> MultipartUploadJournal | None:
+        """Load the journal of an interrupted multipart upload and reconcile it with the parts in the bucket.
+
+        Only parts listed by the bucket with the ETag recorded in the journal are considered committed.
+
+        Args:
+            journal_path (Path): Path of the journal.
+            bucket_name (str): Name of the bucket.
+            object_key (str): Key of the object.
+            source (FileIdentity): The current identity of the source file.
+
+        Returns:
+            MultipartUploadJournal | None: The journal to continue from, or None to start a new upload.
+        """
+        from botocore.exceptions import ClientError  # noqa: PLC0415
+
+        journal = MultipartUploadJournal.load(journal_path, bucket_name, object_key, source)
+        if journal is None:
+            return None
+        committed: dict[int, str] = {}
+        try:
+            paginator = self._get_s3_client().get_paginator("list_parts")
+            for page in paginator.paginate(Bucket=bucket_name, Key=object_key, UploadId=journal.upload_id):
+                for part in page.get("Parts", []):
+                    committed[part["PartNumber"]] = part["ETag"]
+        except ClientError:
+            logger.warning("Multipart upload '%s' can no longer be resumed, restarting", journal.upload_id)
+            journal_path.unlink(missing_ok=True)
+            return None
+        journal.parts = {number: etag for number, etag in journal.parts.items() if committed.get(number) == etag}
+        logger.debug("Resuming multipart upload '%s' with %d committed parts", journal.upload_id, len(journal.parts))
+        return journal
+
+    @staticmethod
+    def _get_part_length(journal: MultipartUploadJournal, part_number: int) -> int:
+        """Get the length of a part of a multipart upload.
+
+        Args:
+            journal (MultipartUploadJournal): Journal of the upload.
+            part_number (int): Number of the part, starting at 1.
+
+        Returns:
+            int: Length of the part in bytes.
+        """
+        return max(0, min(journal.part_size, journal.source.size - (part_number - 1) * journal.part_size))
+
+    def _upload_part(self, source_path: Path, journal: MultipartUploadJournal, part_number: int) -> str:
+        """Upload a part of a multipart upload, retrying with exponential backoff.
+
+        Args:
+            source_path (Path): Path of the local file to upload.
+            journal (MultipartUploadJournal): Journal of the upload.
+            part_number (int): Number of the part, starting at 1.
+
+        Returns:
+            str: The ETag of the committed part.
+
+        Raises:
+            botocore.exceptions.BotoCoreError: If the part fails to upload in all attempts.
+            botocore.exceptions.ClientError: If the part fails to upload in all attempts.
+        """
+        from botocore.exceptions import BotoCoreError, ClientError  # noqa: PLC0415
+
+        with source_path.open("rb") as f:
+            f.seek((part_number - 1) * journal.part_size)
+            body = f.read(journal.part_size)
+        attempts = self._settings.multipart_upload_part_attempts
+        attempt = 1
+        while True:
+            try:
+                response = self._get_s3_client().upload_part(
+                    Bucket=journal.bucket_name,
+                    Key=journal.object_key,
+                    UploadId=journal.upload_id,
+                    PartNumber=part_number,
+                    Body=body,
+                )
+                return cast("str", response["ETag"])
+            except (BotoCoreError, ClientError) as e:
+                if attempt >= attempts:
+                    raise
+                backoff_seconds = MULTIPART_UPLOAD_RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1)
+                logger.warning(
+                    "Attempt %d of %d to upload part %d of '%s' failed, retrying in %.1fs: %s",
+                    attempt,
+                    attempts,
+                    part_number,
+                    source_path,
+                    backoff_seconds,
+                    e,
+                )
+                time.sleep(backoff_seconds)
+                attempt += 1
+
     def _upload_file(
         self, source_path: Path, object_key: str, callback: Callable[[int, Path], None] | None = None
     ) -> bool:
@@ -186,6 +922,16 @@ class Service(BaseService):
             logger.error("Source path '%s' is not a file", source_path)
             return False
 
+        if self.is_multipart_upload(source_path.stat().st_size):
+            from botocore.exceptions import BotoCoreError, ClientError  # noqa: PLC0415
+
+            try:
+                self.upload_file_multipart(source_path, object_key, callback)
+            except (OSError, BotoCoreError, ClientError):
+                logger.exception("Error uploading file '%s' to object key '%s'", source_path, object_key)
+                return False
+            return True
+
         signed_url = self.create_signed_upload_url(object_key)
 
         try:
@@ -200,11 +946,10 @@ class Service(BaseService):
                             callback(len(chunk), source_path)
                         yield chunk
 
-                response = requests.put(
+                response = get_http_session().put(
                     signed_url,
                     data=read_in_chunks(),
                     headers={"Content-Type": "application/octet-stream"},
-                    timeout=60,
                 )
                 response.raise_for_status()
 
@@ -281,7 +1026,7 @@ class Service(BaseService):
         """
         return Service().find(what, what_is_key, detail, include_signed_urls)
 
-    def find(  # noqa: C901
+    def find(
         self,
         what: list[str] | None,
         what_is_key: bool = False,
@@ -299,19 +1044,46 @@ class Service(BaseService):
         Returns:
             list[Union[str, dict[str, Any]]]: List of objects in the bucket with optional detail.
 
+        Raises:
+            ValueError: If any provided regex pattern is invalid.
+        """
+        return list(self.find_iter(what, what_is_key, detail, include_signed_urls))
+
+    def find_iter(
+        self,
+        what: list[str] | None,
+        what_is_key: bool = False,
+        detail: bool = False,
+        include_signed_urls: bool = False,
+    ) -> Iterator[str | dict[str, Any]]:
+        """Stream objects in the bucket matching patterns or keys, listing only what can match.
+
+        Exact keys are looked up with a HEAD request each. Patterns are matched from the start of the key,
+        so only objects below the longest literal prefix of each pattern are listed, with the listings
+        of multiple prefixes running concurrently. Objects are yielded in lexicographic order of their keys
+        for patterns, and in the given order for keys.
+
+        Args:
+            what (list[str] | None): Patterns or keys to match object keys against - all if not specified.
+            what_is_key (bool): If True, treat entries in what as exact keys, else as regex patterns.
+            detail (bool): If True, return detailed information including object type, else return only paths.
+            include_signed_urls (bool): If True, include signed download URLs in the results.
+
+        Yields:
+            str | dict[str, Any]: The key of the next matching object, or its details.
+
         Raises:
             ValueError: If any provided regex pattern is invalid.
         """
         if not what:
             what = [".*"]  # Default to match all objects if no patterns provided
 
-        # Normalize keys by removing bucket prefix if present (when treating as exact keys)
+        compiled_patterns: list[re.Pattern[str]] = []
         if what_is_key:
+            # Normalize keys by removing bucket prefix if present
             bucket_prefix = f"{self._settings.name}/"
-            what = [key.removeprefix(bucket_prefix) for key in what]
-
-        compiled_patterns: list[re.Pattern[str]] = []
-        if not what_is_key:
+            pages = self._head_objects([key.removeprefix(bucket_prefix) for key in what])
+        else:
             for pattern in what:
                 try:
                     compiled_patterns.append(re.compile(pattern))
@@ -319,26 +1091,20 @@ class Service(BaseService):
                     msg = f"Invalid regex pattern '{pattern}': {e}"
                     logger.warning(msg)
                     raise ValueError(msg) from e
+            pages = self._list_objects(_get_covering_prefixes([_get_literal_prefix(pattern) for pattern in what]))
+
+        for contents in pages:
+            matched_items = [
+                item
+                for item in contents
+                if what_is_key or any(pattern.match(item["Key"]) for pattern in compiled_patterns)
+            ]
+            signed_download_urls = (
+                self.create_signed_download_urls(item["Key"] for item in matched_items) if include_signed_urls else {}
+            )
 
-        s3c = self._get_s3_client()
-        paginator = s3c.get_paginator("list_objects_v2")
-        pages = paginator.paginate(Bucket=self._settings.name)
-
-        result: list[str | dict[str, Any]] = []
-
-        for page in pages:
-            contents = page.get("Contents", [])
-
-            for item in contents:
+            for item in matched_items:
                 item_key = item["Key"]
-
-                # Check if item matches criteria
-                matches = (
-                    item_key in what if what_is_key else any(pattern.match(item_key) for pattern in compiled_patterns)
-                )
-                if not matches:
-                    continue
-
                 if detail:
                     size_bytes = item.get("Size", 0)
                     item_data = {
@@ -350,17 +1116,118 @@ class Service(BaseService):
                         "storage_class": item.get("StorageClass", ""),
                     }
                     if include_signed_urls:
-                        item_data["signed_download_url"] = self.create_signed_download_url(item_key)
-                    result.append(item_data)
+                        item_data["signed_download_url"] = signed_download_urls[item_key]
+                    yield item_data
                 elif include_signed_urls:
-                    result.append({
+                    yield {
                         "key": item_key,
-                        "signed_download_url": self.create_signed_download_url(item_key),
-                    })
+                        "signed_download_url": signed_download_urls[item_key],
+                    }
                 else:
-                    result.append(item_key)
+                    yield item_key
 
-        return result
+    def _list_objects(self, prefixes: list[str]) -> Iterator[list[dict[str, Any]]]:  # noqa: C901
+        """Stream the pages of listings of objects below prefixes.
+
+        Listings of multiple prefixes run concurrently and buffer up to FIND_LISTING_BUFFERED_PAGES pages
+        each, waiting for the consumer once their buffer is full, while pages are yielded in the order of
+        the prefixes. Closing the iterator stops pending listings after their current page.
+
+        Args:
+            prefixes (list[str]): Prefixes to list, yielded in this order.
+
+        Yields:
+            list[dict[str, Any]]: The objects of the next page of a listing.
+
+        Raises:
+            botocore.exceptions.ClientError: If a listing fails.
+        """
+        paginator = self._get_s3_client().get_paginator("list_objects_v2")
+        if len(prefixes) == 1:
+            for page in paginator.paginate(Bucket=self._settings.name, Prefix=prefixes[0]):
+                yield page.get("Contents", [])
+            return
+
+        stopped = threading.Event()
+        page_queues: list[queue.Queue[list[dict[str, Any]] | BaseException | None]] = [
+            queue.Queue(maxsize=FIND_LISTING_BUFFERED_PAGES) for _ in prefixes
+        ]
+
+        def put(
+            page_queue: queue.Queue[list[dict[str, Any]] | BaseException | None],
+            contents: list[dict[str, Any]] | BaseException | None,
+        ) -> bool:
+            # Wait for the consumer to make room, unless it stopped consuming
+            while not stopped.is_set():
+                try:
+                    page_queue.put(contents, timeout=FIND_LISTING_PUT_TIMEOUT_SECONDS)
+                except queue.Full:
+                    continue
+                return True
+            return False
+
+        def list_prefix(prefix: str, page_queue: queue.Queue[list[dict[str, Any]] | BaseException | None]) -> None:
+            try:
+                for page in paginator.paginate(Bucket=self._settings.name, Prefix=prefix):
+                    if not put(page_queue, page.get("Contents", [])):
+                        return
+                put(page_queue, None)
+            except Exception as e:  # noqa: BLE001
+                put(page_queue, e)
+
+        with ThreadPoolExecutor(
+            max_workers=min(self._settings.find_listing_concurrency, len(prefixes)), thread_name_prefix="find"
+        ) as executor:
+            for prefix, page_queue in zip(prefixes, page_queues, strict=True):
+                executor.submit(list_prefix, prefix, page_queue)
+            try:
+                for page_queue in page_queues:
+                    while (contents := page_queue.get()) is not None:
+                        if isinstance(contents, BaseException):
+                            raise contents
+                        yield contents
+            finally:
+                stopped.set()
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    def _head_objects(self, object_keys: list[str]) -> Iterator[list[dict[str, Any]]]:
+        """Look up objects by their exact keys with concurrent HEAD requests.
+
+        Args:
+            object_keys (list[str]): Keys of the objects.
+
+        Yields:
+            list[dict[str, Any]]: The existing objects, in the form of listed objects, one per page.
+
+        Raises:
+            botocore.exceptions.ClientError: If a HEAD request fails for other reasons than a missing object.
+        """
+        from botocore.exceptions import ClientError  # noqa: PLC0415
+
+        s3c = self._get_s3_client()
+
+        def head_object(object_key: str) -> list[dict[str, Any]]:
+            try:
+                response = s3c.head_object(Bucket=self._settings.name, Key=object_key)
+            except ClientError as e:
+                if e.response.get("Error", {}).get("Code") in {"404", "NoSuchKey", "NotFound"}:
+                    return []
+                raise
+            return [
+                {
+                    "Key": object_key,
+                    "Size": response.get("ContentLength", 0),
+                    "LastModified": response.get("LastModified"),
+                    "ETag": response.get("ETag", ""),
+                    "StorageClass": response.get("StorageClass", ""),
+                }
+            ]
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(self._settings.find_listing_concurrency, len(object_keys))),
+            thread_name_prefix="find",
+        ) as executor:
+            yield from executor.map(head_object, dict.fromkeys(object_keys))
 
     def create_signed_download_url(self, object_key: str, bucket_name: str | None = None) -> str:
         """Generates a signed URL to download a Google Cloud Storage object.
@@ -380,53 +1247,101 @@ class Service(BaseService):
         )
         return cast("str", url)
 
+    def create_signed_download_urls(self, object_keys: Iterable[str], bucket_name: str | None = None) -> dict[str, str]:
+        """Generates signed URLs to download many Google Cloud Storage objects.
+
+        Signs the URLs locally with a signing key derived once, instead of going through the Boto3 client
+        per object, so presigning thousands of objects takes milliseconds.
+
+        Args:
+            object_keys (Iterable[str]): The keys of the objects to generate signed URLs for.
+            bucket_name (str | None): The name of the bucket to generate signed URLs for.
+                If None, use the default bucket.
+
+        Returns:
+            dict[str, str]: Mapping of object keys to signed URLs to download them.
+        """
+        bucket_name = self._settings.name if bucket_name is None else bucket_name
+        presigner = self._get_presigner(self._settings.download_signed_url_expiration_seconds)
+        return {object_key: presigner.presign("GET", bucket_name, object_key) for object_key in object_keys}
+
+    def _is_file_identical_to_object(
+        self, local_path: Path, object_key: str, size: int, etag: str | None = None, bucket_name: str | None = None
+    ) -> bool:
+        """Check if a local file has the same content as an object in the bucket.
+
+        Compares the size first. For ETags that are plain MD5 checksums, compares the MD5 of the file.
+        For ETags of objects uploaded in parts, i.e. "<md5>-<number of parts>", infers candidate part
+        sizes and compares the multipart ETags of the file, falling back to comparing the CRC32C
+        checksum provided by the bucket with a single HEAD request.
+        Checksums of the file are looked up in and stored to the persistent checksum cache, so checking
+        an unchanged file again reads neither the file nor the object.
+
+        Args:
+            local_path (Path): Path of the local file.
+            object_key (str): The key of the object.
+            size (int): Size of the object in bytes, as listed.
+            etag (str | None): ETag of the object, as listed.
+            bucket_name (str | None): The name of the bucket. If None, use the default bucket.
+
+        Returns:
+            bool: True if the file exists with identical content, False otherwise.
+        """
+        from botocore.exceptions import BotoCoreError, ClientError  # noqa: PLC0415
+
+        try:
+            if not local_path.is_file() or local_path.stat().st_size != size:
+                return False
+            etag = (etag or "").strip('"')
+            if re.fullmatch(r"[0-9a-f]{32}", etag):
+                return calculate_file_md5(local_path, use_cache=True) == etag
+            if match := MULTIPART_ETAG_PATTERN.fullmatch(etag):
+                part_sizes = _get_multipart_part_sizes(
+                    size, int(match.group(2)), self._settings.multipart_upload_part_size
+                )
+                if (
+                    part_sizes
+                    and etag in calculate_file_multipart_etags(local_path, part_sizes, use_cache=True).values()
+                ):
+                    return True
+            remote = self.get_object_checksums(object_key, bucket_name)
+            if remote is None or remote.size != size or not remote.crc32c_base64:
+                return False
+            return calculate_file_crc32c(local_path, use_cache=True) == remote.crc32c_base64
+        except (OSError, BotoCoreError, ClientError) as e:
+            logger.debug("Failed to check if '%s' is up to date with '%s': %s", local_path, object_key, e)
+            return False
+
     @staticmethod
     def _download_object_from_signed_url(
         object_key: str,
         signed_url: str,
         destination: Path,
-        etag: str | None = None,
         progress_callback: Callable[[int], None] | None = None,
     ) -> Path | None:
-        """Download a single file from the bucket with content-based caching.
+        """Download a single file from the bucket.
+
+        The file is saved at the path of the object key below the destination directory.
 
         Args:
             object_key (str): The key of the object to download.
             signed_url (str): The signed URL for downloading the object.
             destination (Path): The directory where the file should be saved.
-            etag (str | None): The ETag of the object for cache validation.
             progress_callback (Callable[[int], None] | None): Optional callback for download progress.
 
         Returns:
             Path | None: The path to the downloaded file if successful, None otherwise.
         """
-        filename = object_key.rsplit("/", 1)[-1]
-        output_path = destination / filename
-
-        # Check if we should download based on ETag comparison
-        if etag:
-            should_download = True
-            if output_path.exists():
-                try:
-                    # Calculate hash of existing file and compare with ETag
-                    hash_md5 = hashlib.md5()  # noqa: S324
-                    with open(output_path, "rb") as f:
-                        for chunk in iter(lambda: f.read(ETAG_CHUNK_SIZE), b""):
-                            hash_md5.update(chunk)
-                    file_hash = hash_md5.hexdigest()
-                    should_download = file_hash != etag
-                except OSError:
-                    # If we can't read the file, download it
-                    should_download = True
-
-            if not should_download:
-                logger.debug("File %s is up to date (ETag: %s), skipping download", output_path, etag)
-                return output_path
+        output_path = destination / object_key
+        if not output_path.resolve().is_relative_to(destination.resolve()):
+            logger.error("Object key '%s' points outside of destination '%s'", object_key, destination)
+            return None
 
         try:
-            response = requests.get(signed_url, stream=True, timeout=60)
+            response = get_http_session().get(signed_url, stream=True)
             response.raise_for_status()
 
+            output_path.parent.mkdir(parents=True, exist_ok=True)
             with open(output_path, "wb") as f:
                 for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                     if chunk:  # filter out keep-alive new chunks
@@ -487,7 +1402,10 @@ class Service(BaseService):
         """
         destination.mkdir(parents=True, exist_ok=True)
 
-        matched_objects = self.find(what, what_is_key, detail=True, include_signed_urls=True)
+        matched_objects = [
+            cast("dict[str, Any]", obj)
+            for obj in self.find_iter(what, what_is_key, detail=True, include_signed_urls=True)
+        ]
 
         if not matched_objects:
             return DownloadResult(downloaded=[], failed=[])
@@ -499,76 +1417,77 @@ class Service(BaseService):
             destination,
         )
 
-        progress = DownloadProgress(
-            overall_total=len(matched_objects),
-            overall_downloaded=0,
-            overall_failed=0,
-            current_file_key="",
-            current_file_downloaded=0,
-            current_file_size=0,
+        tracker = _DownloadProgressTracker(
+            DownloadProgress(
+                overall_total=len(matched_objects),
+                overall_downloaded=0,
+                overall_failed=0,
+                current_file_key="",
+                current_file_downloaded=0,
+                current_file_size=0,
+                overall_total_size=sum(obj["size"] for obj in matched_objects),
+            ),
+            progress_callback,
         )
 
-        successful_downloads: list[Path] = []
-        failed_downloads: list[str] = []
-
-        for obj in matched_objects:
-            obj_dict = cast("dict[str, str]", obj)
-            object_key = obj_dict["key"]
-            signed_url = obj_dict["signed_download_url"]
-
-            progress = progress.model_copy(
-                update={
-                    "current_file_key": object_key,
-                    "current_file_downloaded": 0,
-                }
-            )
-
+        concurrency = min(self._settings.download_concurrency, len(matched_objects))
+        result_paths: dict[str, Path | None] = {}
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="download") as executor:
+            futures = {
+                executor.submit(self._download_object, obj, destination, tracker): obj["key"] for obj in matched_objects
+            }
             try:
-                head_response = requests.head(signed_url, timeout=30)
-                head_response.raise_for_status()
-                file_size = int(head_response.headers.get("content-length", 0))
-            except requests.RequestException:
-                file_size = 0
+                for future in as_completed(futures):
+                    result_paths[futures[future]] = future.result()
+            except BaseException:
+                executor.shutdown(wait=True, cancel_futures=True)
+                raise
 
-            progress = progress.model_copy(update={"current_file_size": file_size})
+        return DownloadResult(
+            downloaded=[path for obj in matched_objects if (path := result_paths[obj["key"]])],
+            failed=[obj["key"] for obj in matched_objects if result_paths[obj["key"]] is None],
+        )
 
-            if progress_callback:
-                progress_callback(progress)
+    def _download_object(
+        self, obj: dict[str, Any], destination: Path, tracker: _DownloadProgressTracker
+    ) -> Path | None:
+        """Download a single listed object, reporting progress to the tracker.
 
-            def file_progress_callback(bytes_downloaded: int) -> None:
-                nonlocal progress
-                progress = progress.model_copy(
-                    update={"current_file_downloaded": progress.current_file_downloaded + bytes_downloaded}
-                )
-                if progress_callback:
-                    progress_callback(progress)
+        Args:
+            obj (dict[str, Any]): The object as found with details and signed download URL.
+            destination (Path): Destination directory for downloaded files.
+            tracker (_DownloadProgressTracker): Tracker aggregating the progress of all download workers.
 
-            result_path = self._download_object_from_signed_url(
-                object_key, signed_url, destination, obj_dict.get("etag"), file_progress_callback
-            )
+        Returns:
+            Path | None: The path to the downloaded file if successful, None otherwise.
+        """
+        object_key = obj["key"]
+        size = obj["size"]
+        downloaded = 0
+        tracker.start(object_key, size)
+
+        def file_progress_callback(bytes_downloaded: int) -> None:
+            nonlocal downloaded
+            downloaded += bytes_downloaded
+            tracker.update(object_key, bytes_downloaded, downloaded, size)
+
+        output_path: Path = destination / object_key
+        if output_path.resolve().is_relative_to(destination.resolve()) and self._is_file_identical_to_object(
+            output_path, object_key, size, obj.get("etag")
+        ):
+            logger.debug("File %s is up to date (ETag: %s), skipping download", output_path, obj.get("etag"))
+            tracker.finish(object_key, downloaded, size, succeeded=True)
+            return output_path
 
-            if result_path:
-                successful_downloads.append(result_path)
-                progress = progress.model_copy(update={"overall_downloaded": progress.overall_downloaded + 1})
-            else:
-                failed_downloads.append(object_key)
-                progress = progress.model_copy(update={"overall_failed": progress.overall_failed + 1})
-
-            progress = progress.model_copy(
-                update={
-                    "current_file_key": "",
-                    "current_file_downloaded": 0,
-                    "current_file_size": 0,
-                }
+        result_path = None
+        try:
+            result_path = self._download_object_from_signed_url(
+                object_key, obj["signed_download_url"], destination, file_progress_callback
             )
-
-            if progress_callback:
-                progress_callback(progress)
-
-        return DownloadResult(
-            downloaded=successful_downloads,
-            failed=failed_downloads,
-        )
+        except OSError:
+            logger.exception("Failed to save object with key '%s' to '%s'", object_key, destination)
+        tracker.finish(object_key, downloaded, size, succeeded=result_path is not None)
+        return result_path
 
     @staticmethod
     def delete_static(what: list[str] | None, what_is_key: bool = False, dry_run: bool = True) -> int:
@@ -601,10 +1520,9 @@ class Service(BaseService):
         Raises:
             ValueError: If any provided regex pattern is invalid.
         """
-        from botocore.exceptions import ClientError  # noqa: PLC0415
-
-        matched_objects = self.find(what, what_is_key=what_is_key, detail=False)
-        object_keys_to_delete = [obj for obj in matched_objects if isinstance(obj, str)]
+        object_keys_to_delete = [
+            obj for obj in self.find_iter(what, what_is_key=what_is_key, detail=False) if isinstance(obj, str)
+        ]
 
         if not object_keys_to_delete:
             logger.warning("No objects found to delete")
@@ -614,18 +1532,357 @@ class Service(BaseService):
             logger.info("Would delete %d objects", len(object_keys_to_delete))
             return len(object_keys_to_delete)
 
+        result = self.delete_objects(object_keys_to_delete)
+        for object_key, error in result.failed.items():
+            logger.warning("Failed to delete object with key '%s': %s", object_key, error)
+        logger.info("Deleted %d objects, failed to delete %d objects", result.deleted_count, result.failed_count)
+        return result.deleted_count
+
+    def delete_objects(self, object_keys: list[str], bucket_name: str | None = None) -> DeleteResult:
+        """Delete objects by key in batches of up to 1000 keys per request, running batches concurrently.
+
+        Falls back to concurrent single delete requests if the bucket rejects deleting multiple objects
+        per request, as the XML API of Google Cloud Storage does. If a request of a later batch fails as a
+        whole, e.g. when throttled, all keys of that batch are reported as failed with the error.
+
+        Args:
+            object_keys (list[str]): The keys of the objects to delete.
+            bucket_name (str | None): The name of the bucket. If None, use the default bucket.
+
+        Returns:
+            DeleteResult: The keys deleted, and the keys that failed to delete with the error per key.
+
+        Raises:
+            BaseException: If deleting is interrupted, after cancelling pending requests.
+        """
+        from botocore.exceptions import ClientError  # noqa: PLC0415
+
+        result = DeleteResult(deleted=[], failed={})
+        if not object_keys:
+            return result
+        bucket_name = self._settings.name if bucket_name is None else bucket_name
         s3c = self._get_s3_client()
-        deleted_count = 0
-        for object_key in object_keys_to_delete:
-            logger.debug("Deleting object with key: %s", object_key)
+        batches = [
+            object_keys[index : index + DELETE_OBJECTS_MAX_KEYS]
+            for index in range(0, len(object_keys), DELETE_OBJECTS_MAX_KEYS)
+        ]
+
+        # The first batch tells whether the bucket supports deleting multiple objects per request
+        tasks: list[tuple[Callable[..., tuple[list[str], dict[str, str]]], Any]]
+        try:
+            deleted, failed = self._delete_batch(s3c, bucket_name, batches[0])
+            result.deleted.extend(deleted)
+            result.failed.update(failed)
+            tasks = [(self._delete_batch, batch) for batch in batches[1:]]
+        except ClientError as e:
+            logger.debug("Deleting multiple objects per request failed, deleting objects one by one: %s", e)
+            tasks = [(self._delete_key, object_key) for object_key in object_keys]
+
+        if not tasks:
+            return result
+        with ThreadPoolExecutor(
+            max_workers=min(self._settings.delete_concurrency, len(tasks)), thread_name_prefix="delete"
+        ) as executor:
+            futures = {executor.submit(function, s3c, bucket_name, argument): argument for function, argument in tasks}
             try:
-                s3c.delete_object(Bucket=self._settings.name, Key=object_key)
-                deleted_count += 1
-            except ClientError as e:
-                if e.response["Error"]["Code"] == "NoSuchKey":
-                    logger.warning("Object with key '%s' not found", object_key)
+                for future in as_completed(futures):
+                    try:
+                        deleted, failed = future.result()
+                    except ClientError as e:
+                        # A failed request, e.g. throttled, fails all keys of its batch, not the whole delete
+                        error = e.response.get("Error", {})
+                        keys = futures[future] if isinstance(futures[future], list) else [futures[future]]
+                        deleted, failed = (
+                            [],
+                            dict.fromkeys(keys, f"{error.get('Code', 'Error')}: {error.get('Message', e)}"),
+                        )
+                    result.deleted.extend(deleted)
+                    result.failed.update(failed)
+            except BaseException:
+                executor.shutdown(wait=True, cancel_futures=True)
+                raise
+        return result
+
+    @staticmethod
+    def _delete_batch(s3c: "BaseClient", bucket_name: str, object_keys: list[str]) -> tuple[list[str], dict[str, str]]:
+        """Delete up to 1000 objects with a single DeleteObjects request.
+
+        Args:
+            s3c (BaseClient): The S3 client.
+            bucket_name (str): The name of the bucket.
+            object_keys (list[str]): The keys of the objects to delete.
+
+        Returns:
+            tuple[list[str], dict[str, str]]: The keys deleted, and the keys that failed with their error.
+
+        Raises:
+            botocore.exceptions.ClientError: If the request as a whole fails.
+        """
+        logger.debug("Deleting batch of %d objects", len(object_keys))
+        response = s3c.delete_objects(
+            Bucket=bucket_name,
+            Delete={"Objects": [{"Key": object_key} for object_key in object_keys], "Quiet": True},
+        )
+        failed = {
+            error["Key"]: f"{error.get('Code', 'Error')}: {error.get('Message', '')}".rstrip(": ")
+            for error in response.get("Errors", [])
+        }
+        return [object_key for object_key in object_keys if object_key not in failed], failed
+
+    @staticmethod
+    def _delete_key(s3c: "BaseClient", bucket_name: str, object_key: str) -> tuple[list[str], dict[str, str]]:
+        """Delete a single object.
+
+        Args:
+            s3c (BaseClient): The S3 client.
+            bucket_name (str): The name of the bucket.
+            object_key (str): The key of the object to delete.
+
+        Returns:
+            tuple[list[str], dict[str, str]]: The key if deleted, else the key with its error.
+        """
+        from botocore.exceptions import ClientError  # noqa: PLC0415
+
+        logger.debug("Deleting object with key: %s", object_key)
+        try:
+            s3c.delete_object(Bucket=bucket_name, Key=object_key)
+        except ClientError as e:
+            error = e.response.get("Error", {})
+            if error.get("Code") == "NoSuchKey":
+                return [], {object_key: "NoSuchKey: Object not found"}
+            return [], {object_key: f"{error.get('Code', 'Error')}: {error.get('Message', e)}"}
+        return [object_key], {}
+
+    def plan_sync(
+        self,
+        local_directory: Path,
+        prefix: str,
+        direction: SyncDirection = SyncDirection.UPLOAD,
+        delete: bool = False,
+        checksum: bool = True,
+    ) -> SyncPlan:
+        """Plan a sync between a local directory and a prefix in the bucket by diffing both manifests.
+
+        The manifest of the bucket is listed once, the manifest of the local directory is read from the
+        file system. Files are transferred if missing at the target or if their size differs. Files of
+        equal size are compared by checksum, taken from the persistent checksum cache for unchanged local
+        files, or, if checksum is False, transferred only if newer at the source, as rsync does by default.
+
+        Args:
+            local_directory (Path): The local directory.
+            prefix (str): The prefix in the bucket, object keys below it map to paths below the directory.
+            direction (SyncDirection): Whether to upload the local directory or download the prefix.
+            delete (bool): If True, plan to delete files or objects missing at the source from the target.
+            checksum (bool): If True, compare files of equal size by checksum, else by modification time.
+
+        Returns:
+            SyncPlan: The operations to bring the target in sync with the source.
+        """
+        prefix = prefix.strip("/")
+        key_prefix = f"{prefix}/" if prefix else ""
+        remote = {
+            obj["key"].removeprefix(key_prefix): obj
+            for obj in cast(
+                "Iterator[dict[str, Any]]",
+                self.find_iter([re.escape(key_prefix)] if key_prefix else None, detail=True),
+            )
+            if not obj["key"].endswith("/")
+        }
+        local = (
+            {
+                path.relative_to(local_directory).as_posix(): path
+                for path in local_directory.rglob("*")
+                if path.is_file()
+            }
+            if local_directory.is_dir()
+            else {}
+        )
+        uploading = direction == SyncDirection.UPLOAD
+        sources, targets = (local.keys(), remote.keys()) if uploading else (remote.keys(), local.keys())
+
+        def operation(action: SyncAction, relative_path: str, reason: str) -> SyncOperation:
+            from_local = action in {SyncAction.UPLOAD, SyncAction.DELETE_FILE}
+            return SyncOperation(
+                action=action,
+                object_key=key_prefix + relative_path,
+                local_path=local_directory / relative_path,
+                size=local[relative_path].stat().st_size if from_local else remote[relative_path]["size"],
+                reason=reason,
+            )
+
+        transfer_action = SyncAction.UPLOAD if uploading else SyncAction.DOWNLOAD
+        operations: list[SyncOperation] = []
+        candidates: list[str] = []
+        for relative_path in sorted(sources):
+            reason = self._get_sync_reason(
+                local.get(relative_path), remote.get(relative_path), uploading, compare_mtime=not checksum
+            )
+            if reason:
+                operations.append(operation(transfer_action, relative_path, reason))
+            elif checksum:
+                candidates.append(relative_path)
+        unchanged_count = len(sources) - len(operations)
+
+        if candidates:
+            with ThreadPoolExecutor(
+                max_workers=min(self._settings.sync_concurrency, len(candidates)), thread_name_prefix="sync-compare"
+            ) as executor:
+                identical = list(
+                    executor.map(
+                        lambda relative_path: self._is_file_identical_to_object(
+                            local[relative_path],
+                            remote[relative_path]["key"],
+                            remote[relative_path]["size"],
+                            remote[relative_path].get("etag"),
+                        ),
+                        candidates,
+                    )
+                )
+            operations.extend(
+                operation(transfer_action, relative_path, "checksum differs")
+                for relative_path, is_identical in zip(candidates, identical, strict=True)
+                if not is_identical
+            )
+            unchanged_count -= identical.count(False)
+            operations.sort(key=lambda sync_operation: sync_operation.object_key)
+
+        if delete:
+            delete_action = SyncAction.DELETE_OBJECT if uploading else SyncAction.DELETE_FILE
+            operations.extend(
+                operation(delete_action, relative_path, "extra") for relative_path in sorted(targets - sources)
+            )
+
+        return SyncPlan(
+            direction=direction,
+            local_directory=local_directory,
+            prefix=prefix,
+            operations=operations,
+            unchanged_count=unchanged_count,
+        )
+
+    @staticmethod
+    def _get_sync_reason(
+        local_path: Path | None, obj: dict[str, Any] | None, uploading: bool, compare_mtime: bool
+    ) -> str | None:
+        """Determine why a file present at the source of a sync is transferred, without comparing content.
+
+        Args:
+            local_path (Path | None): The local file, None if missing.
+            obj (dict[str, Any] | None): The object as found with details, None if missing.
+            uploading (bool): Whether the local file is the source, else the object.
+            compare_mtime (bool): Whether to transfer files of equal size if newer at the source.
+
+        Returns:
+            str | None: The reason to transfer the file, or None if it is in sync as far as determined.
+        """
+        if local_path is None or obj is None:
+            return "missing"
+        local_stat = local_path.stat()
+        if local_stat.st_size != obj["size"]:
+            return "size differs"
+        if compare_mtime:
+            local_mtime = datetime.fromtimestamp(local_stat.st_mtime, tz=UTC)
+            remote_mtime = obj.get("last_modified")
+            if remote_mtime is None or (local_mtime > remote_mtime if uploading else remote_mtime > local_mtime):
+                return "newer"
+        return None
+
+    def sync(self, plan: SyncPlan, progress_callback: Callable[[int], None] | None = None) -> SyncResult:
+        """Execute a sync plan, transferring files concurrently and deleting extra files or objects afterwards.
+
+        Args:
+            plan (SyncPlan): The plan as returned by plan_sync.
+            progress_callback (Callable[[int], None] | None): Optional callback receiving the number of bytes
+                transferred since the last call, called from concurrent transfers.
+
+        Returns:
+            SyncResult: The operations that succeeded and failed.
+
+        Raises:
+            BaseException: If the sync is interrupted, after cancelling pending transfers.
+        """
+        result = SyncResult(succeeded=[], failed=[])
+        transfers = [operation for operation in plan.operations if operation.action in SYNC_TRANSFER_ACTIONS]
+        if transfers:
+            signed_download_urls = self.create_signed_download_urls([
+                operation.object_key for operation in transfers if operation.action == SyncAction.DOWNLOAD
+            ])
+            concurrency = min(self._settings.sync_concurrency, len(transfers))
+            with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="sync") as executor:
+                futures = {
+                    executor.submit(
+                        self._sync_transfer,
+                        operation,
+                        plan.local_directory,
+                        signed_download_urls.get(operation.object_key),
+                        progress_callback,
+                    ): operation
+                    for operation in transfers
+                }
+                try:
+                    for future in as_completed(futures):
+                        (result.succeeded if future.result() else result.failed).append(futures[future])
+                except BaseException:
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    raise
+
+        object_deletes = [operation for operation in plan.operations if operation.action == SyncAction.DELETE_OBJECT]
+        if object_deletes:
+            delete_result = self.delete_objects([operation.object_key for operation in object_deletes])
+            for operation in object_deletes:
+                if operation.object_key in delete_result.failed:
+                    logger.warning(
+                        "Failed to delete object with key '%s': %s",
+                        operation.object_key,
+                        delete_result.failed[operation.object_key],
+                    )
+                    result.failed.append(operation)
                 else:
-                    logger.exception("Error deleting object with key '%s'", object_key)
+                    result.succeeded.append(operation)
+
+        for operation in plan.operations:
+            if operation.action != SyncAction.DELETE_FILE:
+                continue
+            try:
+                operation.local_path.unlink()
+                result.succeeded.append(operation)
+            except OSError:
+                logger.exception("Failed to delete file '%s'", operation.local_path)
+                result.failed.append(operation)
+        return result
 
-        logger.info("Deleted %d objects", deleted_count)
-        return deleted_count
+    def _sync_transfer(
+        self,
+        operation: SyncOperation,
+        local_directory: Path,
+        signed_download_url: str | None,
+        progress_callback: Callable[[int], None] | None,
+    ) -> bool:
+        """Transfer a single file of a sync.
+
+        Args:
+            operation (SyncOperation): The upload or download to execute.
+            local_directory (Path): The local directory of the sync.
+            signed_download_url (str | None): Signed URL of the object, if downloading.
+            progress_callback (Callable[[int], None] | None): Optional callback for transferred bytes.
+
+        Returns:
+            bool: True if the transfer succeeded, False otherwise.
+        """
+        if operation.action == SyncAction.UPLOAD:
+            return self._upload_file(
+                operation.local_path,
+                operation.object_key,
+                (lambda bytes_uploaded, _: progress_callback(bytes_uploaded)) if progress_callback else None,
+            )
+        if signed_download_url is None:
+            return False
+        relative_path = operation.local_path.relative_to(local_directory).as_posix()
+        try:
+            downloaded_path = self._download_object_from_signed_url(
+                relative_path, signed_download_url, local_directory, progress_callback
+            )
+        except OSError:
+            logger.exception("Failed to save object with key '%s' to '%s'", operation.object_key, local_directory)
+            return False
+        return downloaded_path is not None
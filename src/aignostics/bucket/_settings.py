@@ -84,3 +84,91 @@ class Settings(OpaqueSettings):
             * 60,  # Limit to 7 days as this is the max e.g. at AWS, see https://docs.aws.amazon.com/AmazonS3/latest/userguide/using-presigned-url.html
         ),
     ]
+
+    multipart_upload_threshold: Annotated[
+        int,
+        Field(
+            description=(
+                "Files of at least this size in bytes are uploaded as resumable multipart uploads "
+                "instead of a single signed URL request."
+            ),
+            default=64 * 1024 * 1024,  # 64MB
+            ge=5 * 1024 * 1024,  # Minimum part size of S3 compatible multipart uploads
+        ),
+    ]
+
+    multipart_upload_part_size: Annotated[
+        int,
+        Field(
+            description="Size of the parts of multipart uploads in bytes.",
+            default=32 * 1024 * 1024,  # 32MB
+            ge=5 * 1024 * 1024,  # Minimum part size of S3 compatible multipart uploads
+            le=5 * 1024 * 1024 * 1024,  # Maximum part size of S3 compatible multipart uploads
+        ),
+    ]
+
+    multipart_upload_concurrency: Annotated[
+        int,
+        Field(
+            description="Number of parts of a single multipart upload uploaded concurrently.",
+            default=4,
+            ge=1,
+            le=16,
+        ),
+    ]
+
+    multipart_upload_part_attempts: Annotated[
+        int,
+        Field(
+            description="Number of attempts to upload a single part of a multipart upload before giving up.",
+            default=4,
+            ge=1,
+            le=10,
+        ),
+    ]
+
+    find_listing_concurrency: Annotated[
+        int,
+        Field(
+            description=(
+                "Number of prefix listings and HEAD requests run concurrently when finding objects "
+                "matching multiple patterns or keys."
+            ),
+            default=8,
+            ge=1,
+            le=32,
+        ),
+    ]
+
+    download_concurrency: Annotated[
+        int,
+        Field(
+            description="Number of objects downloaded concurrently.",
+            default=4,
+            ge=1,
+            le=32,
+        ),
+    ]
+
+    sync_concurrency: Annotated[
+        int,
+        Field(
+            description="Number of files compared by checksum or transferred concurrently when syncing.",
+            default=4,
+            ge=1,
+            le=32,
+        ),
+    ]
+
+    delete_concurrency: Annotated[
+        int,
+        Field(
+            description=(
+                "Number of batched delete requests run concurrently, or of single delete requests "
+                "if the bucket does not support deleting multiple objects per request."
+            ),
+            default=4,
+            ge=1,
+            le=32,
+        ),
+    ]
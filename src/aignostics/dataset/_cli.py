@@ -4,11 +4,10 @@ import webbrowser
 from pathlib import Path
 from typing import Annotated
 
-import requests
 import typer
 
 from aignostics.platform import generate_signed_url as platform_generate_signed_url
-from aignostics.utils import console, get_logger, get_user_data_directory
+from aignostics.utils import console, get_http_session, get_logger, get_user_data_directory
 
 logger = get_logger(__name__)
 
@@ -240,7 +239,7 @@ def aignostics_download(
     Path(destination_directory).mkdir(parents=True, exist_ok=True)
 
     # Start the request to get content length
-    response = requests.get(source_url_signed, stream=True, timeout=60)
+    response = get_http_session().get(source_url_signed, stream=True)
     total_size = int(response.headers.get("content-length", 0))
 
     with Progress(
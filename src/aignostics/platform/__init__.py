@@ -22,8 +22,10 @@ from aignx.codegen.models import OutputArtifactReadResponse as OutputArtifactDat
 from aignx.codegen.models import OutputArtifactResultReadResponse as OutputArtifactElement
 from aignx.codegen.models import RunReadResponse as ApplicationRunData
 
+from ._async_api import AsyncPublicApi
+from ._catalog_cache import CatalogCache, CatalogCacheSettings, get_catalog_cache, invalidate_catalog_cache
 from ._cli import cli
-from ._client import Client
+from ._client import AsyncClient, Client
 from ._constants import (
     API_ROOT_DEV,
     API_ROOT_PRODUCTION,
@@ -50,14 +52,31 @@ from ._constants import (
 from ._messages import AUTHENTICATION_FAILED, NOT_YET_IMPLEMENTED, UNKNOWN_ENDPOINT_URL
 from ._service import Service, TokenInfo, UserInfo
 from ._settings import Settings, settings
+from ._token_provider import TokenProvider, get_token_provider, invalidate_token_providers
 from ._utils import (
+    DownloadSegment,
     calculate_file_crc32c,
+    crc32c_combine,
     download_file,
+    download_file_async,
+    download_file_segmented,
     generate_signed_url,
+    get_download_size_if_ranges_supported,
     get_mime_type_for_artifact,
+    get_segment_count,
     mime_type_to_file_ending,
 )
-from .resources.runs import LIST_APPLICATION_RUNS_MAX_PAGE_SIZE, LIST_APPLICATION_RUNS_MIN_PAGE_SIZE, ApplicationRun
+from .resources.runs import (
+    LIST_APPLICATION_RUNS_MAX_PAGE_SIZE,
+    LIST_APPLICATION_RUNS_MIN_PAGE_SIZE,
+    ApplicationRun,
+    AsyncApplicationRun,
+    InputItemValidator,
+    ItemResultPoll,
+    ItemResultSummary,
+    ItemResultTracker,
+    RunSubmissionJournal,
+)
 
 __all__ = [
     "API_ROOT_DEV",
@@ -94,24 +113,45 @@ __all__ = [
     "ApplicationRunStatus",
     "ApplicationRunStatus",
     "ApplicationVersion",
+    "AsyncApplicationRun",
+    "AsyncClient",
+    "AsyncPublicApi",
+    "CatalogCache",
+    "CatalogCacheSettings",
     "Client",
+    "DownloadSegment",
     "InputArtifact",
     "InputArtifactData",
     "InputItem",
+    "InputItemValidator",
     "ItemResult",
+    "ItemResultPoll",
+    "ItemResultSummary",
+    "ItemResultTracker",
     "ItemStatus",
     "NotFoundException",
     "OutputArtifactData",
     "OutputArtifactElement",
+    "RunSubmissionJournal",
     "Service",
     "Settings",
     "TokenInfo",
+    "TokenProvider",
     "UserInfo",
     "calculate_file_crc32c",
     "cli",
+    "crc32c_combine",
     "download_file",
+    "download_file_async",
+    "download_file_segmented",
     "generate_signed_url",
+    "get_catalog_cache",
+    "get_download_size_if_ranges_supported",
     "get_mime_type_for_artifact",
+    "get_segment_count",
+    "get_token_provider",
+    "invalidate_catalog_cache",
+    "invalidate_token_providers",
     "mime_type_to_file_ending",
     "settings",
 ]
@@ -0,0 +1,336 @@
+"""Asynchronous counterpart of the generated PublicApi of the Aignostics Platform.
+
+Covers the endpoints used by the async resources. Requests are sent via a shared httpx.AsyncClient,
+responses are deserialized into the models of the codegen package in a single pass, and errors are raised as the
+exceptions of the codegen package, so sync and async clients can be used interchangeably.
+"""
+
+from enum import Enum
+from typing import Annotated, Any
+
+import httpx
+from aignx.codegen.exceptions import (
+    ApiException,
+    BadRequestException,
+    ForbiddenException,
+    NotFoundException,
+    ServiceException,
+    UnauthorizedException,
+)
+from aignx.codegen.models import (
+    ApplicationReadResponse,
+    ApplicationVersionReadResponse,
+    ItemResultReadResponse,
+    ItemStatus,
+    RunCreationRequest,
+    RunCreationResponse,
+    RunReadResponse,
+)
+from pydantic import Field
+
+from aignostics.platform._token_provider import TokenProvider
+from aignostics.platform.resources.utils import deserialize_list
+
+# Bounds of the page size as declared by the generated client, read by paginate
+PageSize = Annotated[int, Field(le=100, strict=True, ge=5)]
+
+API_EXCEPTIONS: dict[int, type[ApiException]] = {
+    400: BadRequestException,
+    401: UnauthorizedException,
+    403: ForbiddenException,
+    404: NotFoundException,
+}
+
+
+def _query_params(**values: Any) -> httpx.QueryParams:  # noqa: ANN401
+    """Build query parameters, skipping unset values and repeating the parameter per list element.
+
+    Args:
+        **values: The values of the query parameters.
+
+    Returns:
+        httpx.QueryParams: The query parameters.
+    """
+    params: list[tuple[str, Any]] = []
+    for name, value in values.items():
+        if value is None:
+            continue
+        params.extend(
+            (name, element.value if isinstance(element, Enum) else element)
+            for element in (value if isinstance(value, list) else [value])
+        )
+    return httpx.QueryParams(params)
+
+
+class AsyncPublicApi:
+    """Asynchronous client of the public API of the Aignostics Platform."""
+
+    def __init__(self, http_client: httpx.AsyncClient, api_root: str, token_provider: TokenProvider) -> None:
+        """Initializes the API.
+
+        Args:
+            http_client (httpx.AsyncClient): The HTTP client, shared with transfers via signed URLs.
+            api_root (str): The root URL of the API.
+            token_provider (TokenProvider): The provider of the access token, only sent to the API.
+        """
+        self.http_client = http_client
+        self._api_root = api_root.rstrip("/")
+        self._token_provider = token_provider
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        params: httpx.QueryParams | None = None,
+        content: str | None = None,
+    ) -> httpx.Response:
+        """Send a request to the API.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The path of the endpoint relative to the API root.
+            params (httpx.QueryParams | None): The query parameters.
+            content (str | None): The JSON body.
+
+        Returns:
+            httpx.Response: The successful response.
+
+        Raises:
+            ApiException: If the API responds with an error, as the subclass matching the status code.
+        """
+        headers = {
+            "Authorization": f"Bearer {await self._token_provider.get_token_async()}",
+            "Accept": "application/json",
+        }
+        if content is not None:
+            headers["Content-Type"] = "application/json"
+        response = await self.http_client.request(
+            method, f"{self._api_root}{path}", params=params, content=content, headers=headers
+        )
+        if response.is_error:
+            exception = API_EXCEPTIONS.get(
+                response.status_code, ServiceException if response.is_server_error else ApiException
+            )
+            raise exception(status=response.status_code, reason=response.reason_phrase, body=response.text)
+        return response
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: httpx.QueryParams | None = None,
+        content: str | None = None,
+    ) -> Any:  # noqa: ANN401
+        """Send a request to the API and decode the JSON response.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The path of the endpoint relative to the API root.
+            params (httpx.QueryParams | None): The query parameters.
+            content (str | None): The JSON body.
+
+        Returns:
+            Any: The decoded JSON response, or None if the response has no body.
+
+        Raises:
+            ApiException: If the API responds with an error, as the subclass matching the status code.
+        """
+        response = await self._send(method, path, params, content)
+        return response.json() if response.content else None
+
+    async def list_applications_v1_applications_get(
+        self,
+        page: int | None = None,
+        page_size: PageSize | None = None,
+        sort: list[str] | None = None,
+    ) -> list[ApplicationReadResponse]:
+        """List applications.
+
+        Args:
+            page (int | None): The page to list.
+            page_size (PageSize | None): The number of applications per page.
+            sort (list[str] | None): Fields to sort by, prefixed with '-' for descending order.
+
+        Returns:
+            list[ApplicationReadResponse]: The applications.
+        """
+        response = await self._send("GET", "/v1/applications", _query_params(page=page, page_size=page_size, sort=sort))
+        return deserialize_list(response.content, ApplicationReadResponse)
+
+    async def list_versions_by_application_id_v1_applications_application_id_versions_get(  # noqa: PLR0913
+        self,
+        application_id: str,
+        *,
+        page: int | None = None,
+        page_size: PageSize | None = None,
+        version: str | None = None,
+        include: list[Any] | None = None,
+        sort: list[str] | None = None,
+    ) -> list[ApplicationVersionReadResponse]:
+        """List versions of an application.
+
+        Args:
+            application_id (str): The ID of the application.
+            page (int | None): The page to list.
+            page_size (PageSize | None): The number of versions per page.
+            version (str | None): Only list the given version.
+            include (list[Any] | None): Optional output values to include.
+            sort (list[str] | None): Fields to sort by, prefixed with '-' for descending order.
+
+        Returns:
+            list[ApplicationVersionReadResponse]: The versions.
+        """
+        response = await self._send(
+            "GET",
+            f"/v1/applications/{application_id}/versions",
+            _query_params(page=page, page_size=page_size, version=version, include=include, sort=sort),
+        )
+        return deserialize_list(response.content, ApplicationVersionReadResponse)
+
+    async def list_application_runs_v1_runs_get(  # noqa: PLR0913
+        self,
+        *,
+        application_id: str | None = None,
+        application_version: str | None = None,
+        include: list[Any] | None = None,
+        page: int | None = None,
+        page_size: PageSize | None = None,
+        sort: list[str] | None = None,
+    ) -> list[RunReadResponse]:
+        """List application runs.
+
+        Args:
+            application_id (str | None): Only list runs of the given application.
+            application_version (str | None): Only list runs of the given application version.
+            include (list[Any] | None): Optional output values to include.
+            page (int | None): The page to list.
+            page_size (PageSize | None): The number of runs per page.
+            sort (list[str] | None): Fields to sort by, prefixed with '-' for descending order.
+
+        Returns:
+            list[RunReadResponse]: The runs.
+        """
+        response = await self._send(
+            "GET",
+            "/v1/runs",
+            _query_params(
+                application_id=application_id,
+                application_version=application_version,
+                include=include,
+                page=page,
+                page_size=page_size,
+                sort=sort,
+            ),
+        )
+        return deserialize_list(response.content, RunReadResponse)
+
+    async def create_application_run_v1_runs_post(
+        self, run_creation_request: RunCreationRequest
+    ) -> RunCreationResponse:
+        """Create an application run.
+
+        Args:
+            run_creation_request (RunCreationRequest): The run to create.
+
+        Returns:
+            RunCreationResponse: The ID of the created run.
+        """
+        data = await self._request("POST", "/v1/runs", content=run_creation_request.to_json())
+        return RunCreationResponse.from_dict(data)
+
+    async def get_run_v1_runs_application_run_id_get(
+        self, application_run_id: str, include: list[Any] | None = None
+    ) -> RunReadResponse:
+        """Get an application run.
+
+        Args:
+            application_run_id (str): The ID of the run.
+            include (list[Any] | None): Optional output values to include.
+
+        Returns:
+            RunReadResponse: The run.
+        """
+        data = await self._request("GET", f"/v1/runs/{application_run_id}", _query_params(include=include))
+        return RunReadResponse.from_dict(data)
+
+    async def cancel_application_run_v1_runs_application_run_id_cancel_post(self, application_run_id: str) -> None:
+        """Cancel an application run.
+
+        Args:
+            application_run_id (str): The ID of the run.
+        """
+        await self._request("POST", f"/v1/runs/{application_run_id}/cancel")
+
+    async def list_run_results_v1_runs_application_run_id_results_get(  # noqa: PLR0913
+        self,
+        application_run_id: str,
+        *,
+        item_id__in: list[str] | None = None,
+        reference__in: list[str] | None = None,
+        status__in: list[ItemStatus] | None = None,
+        page: int | None = None,
+        page_size: PageSize | None = None,
+        sort: list[str] | None = None,
+    ) -> list[ItemResultReadResponse]:
+        """List the item results of an application run.
+
+        Args:
+            application_run_id (str): The ID of the run.
+            item_id__in (list[str] | None): Only list results of the items with the given IDs.
+            reference__in (list[str] | None): Only list results of the items with the given references.
+            status__in (list[ItemStatus] | None): Only list results of items in the given statuses.
+            page (int | None): The page to list.
+            page_size (PageSize | None): The number of results per page.
+            sort (list[str] | None): Fields to sort by, prefixed with '-' for descending order.
+
+        Returns:
+            list[ItemResultReadResponse]: The item results.
+        """
+        response = await self.list_run_results_v1_runs_application_run_id_results_get_without_preload_content(
+            application_run_id,
+            item_id__in=item_id__in,
+            reference__in=reference__in,
+            status__in=status__in,
+            page=page,
+            page_size=page_size,
+            sort=sort,
+        )
+        return deserialize_list(response.content, ItemResultReadResponse)
+
+    async def list_run_results_v1_runs_application_run_id_results_get_without_preload_content(  # noqa: PLR0913
+        self,
+        application_run_id: str,
+        *,
+        item_id__in: list[str] | None = None,
+        reference__in: list[str] | None = None,
+        status__in: list[ItemStatus] | None = None,
+        page: int | None = None,
+        page_size: PageSize | None = None,
+        sort: list[str] | None = None,
+    ) -> httpx.Response:
+        """List the item results of an application run, returning the raw response.
+
+        Args:
+            application_run_id (str): The ID of the run.
+            item_id__in (list[str] | None): Only list results of the items with the given IDs.
+            reference__in (list[str] | None): Only list results of the items with the given references.
+            status__in (list[ItemStatus] | None): Only list results of items in the given statuses.
+            page (int | None): The page to list.
+            page_size (PageSize | None): The number of results per page.
+            sort (list[str] | None): Fields to sort by, prefixed with '-' for descending order.
+
+        Returns:
+            httpx.Response: The successful response.
+        """
+        return await self._send(
+            "GET",
+            f"/v1/runs/{application_run_id}/results",
+            _query_params(
+                item_id__in=item_id__in,
+                reference__in=reference__in,
+                status__in=status__in,
+                page=page,
+                page_size=page_size,
+                sort=sort,
+            ),
+        )
@@ -1,5 +1,9 @@
 import errno
+import hashlib
+import json
+import os
 import socket
+import threading
 import time
 import typing as t
 import webbrowser
@@ -17,6 +21,9 @@ from requests_oauthlib import OAuth2Session
 
 from aignostics.platform._messages import AUTHENTICATION_FAILED, INVALID_REDIRECT_URI
 from aignostics.platform._settings import settings
+from aignostics.utils import get_logger
+
+logger = get_logger(__name__)
 
 CALLBACK_PORT_RETRY_COUNT = 10
 CLAIM_ROLE = "https://aignostics-platform-samia/role"
@@ -109,9 +116,7 @@ def get_token(use_cache: bool = True, use_device_flow: bool = False) -> str:
 
         # Store new token with expiry
         if use_cache:
-            timestamp = claims["exp"]
-            settings().token_file.parent.mkdir(parents=True, exist_ok=True)
-            Path(settings().token_file).write_text(f"{token}:{timestamp}", encoding="utf-8")
+            store_cached_token(token, int(claims["exp"]))
 
     # Inform Sentry about the authenticated user (regardless of token source)
     _inform_sentry_about_user(token)
@@ -119,6 +124,17 @@ def get_token(use_cache: bool = True, use_device_flow: bool = False) -> str:
     return token
 
 
+def store_cached_token(token: str, expiry: int) -> None:
+    """Stores an authentication token in the token file, for reuse by later processes.
+
+    Args:
+        token (str): The JWT access token.
+        expiry (int): The expiry of the token as Unix timestamp.
+    """
+    settings().token_file.parent.mkdir(parents=True, exist_ok=True)
+    Path(settings().token_file).write_text(f"{token}:{expiry}", encoding="utf-8")
+
+
 def remove_cached_token() -> bool:
     """Removes the cached authentication token.
 
@@ -160,10 +176,116 @@ def _authenticate(use_device_flow: bool) -> str:
     return token
 
 
+class _PersistentPyJWKClient(jwt.PyJWKClient):
+    """JWK client caching the key set in memory and in the cache directory, shared across processes.
+
+    The key set is fetched from the network only if neither cache holds a key set younger than the time
+    to live, or if a token is signed with a key not in the cached key set, e.g. after key rotation.
+    """
+
+    def __init__(self, uri: str, cache_file: Path, lifespan: int) -> None:
+        """Initialize the client.
+
+        Args:
+            uri (str): The URL of the JWS key set.
+            cache_file (Path): The file to persist the key set in.
+            lifespan (int): Time to live of the cached key set in seconds.
+        """
+        super().__init__(uri, lifespan=lifespan, timeout=settings().request_timeout_seconds)
+        self._cache_file = cache_file
+        self._lifespan = lifespan
+        # Monotonic deadline of a key set loaded from the cache file, which expires with the age of the file
+        self._loaded_expires_at: float | None = None
+
+    def get_jwk_set(self, refresh: bool = False) -> jwt.PyJWKSet:
+        """Get the key set, loading it from the cache file if not cached in memory.
+
+        A key set loaded from the cache file is kept in memory only for the remainder of its time to live.
+
+        Args:
+            refresh (bool): Fetch the key set from the network, bypassing both caches.
+
+        Returns:
+            jwt.PyJWKSet: The key set.
+        """
+        if not refresh and self.jwk_set_cache is not None:
+            if self._loaded_expires_at is not None and time.monotonic() >= self._loaded_expires_at:
+                self.jwk_set_cache.put(None)
+                self._loaded_expires_at = None
+            if self.jwk_set_cache.get() is None:
+                cached = self._read_cache_file()
+                if cached is not None:
+                    jwk_set, remaining_lifespan = cached
+                    self.jwk_set_cache.put(jwk_set)
+                    self._loaded_expires_at = time.monotonic() + remaining_lifespan
+        return super().get_jwk_set(refresh)
+
+    def fetch_data(self) -> t.Any:  # noqa: ANN401
+        """Fetch the key set from the network and persist it in the cache file.
+
+        Returns:
+            Any: The key set as fetched.
+        """
+        jwk_set = super().fetch_data()
+        self._loaded_expires_at = None  # Cached in memory for the full time to live
+        try:
+            self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temporary_file = self._cache_file.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            temporary_file.write_text(
+                json.dumps({"uri": self.uri, "fetched_at": time.time(), "jwk_set": jwk_set}), encoding="utf-8"
+            )
+            temporary_file.replace(self._cache_file)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning("Failed to cache JWS key set in '%s': %s", self._cache_file, e)
+        return jwk_set
+
+    def _read_cache_file(self) -> tuple[dict[str, t.Any], float] | None:
+        """Read the key set from the cache file.
+
+        Returns:
+            tuple[dict[str, Any], float] | None: The key set and the remainder of its time to live in seconds,
+                or None if not cached, expired or cached for another URL.
+        """
+        try:
+            cached = json.loads(self._cache_file.read_text(encoding="utf-8"))
+            remaining_lifespan = self._lifespan - (time.time() - cached["fetched_at"])
+            if cached["uri"] != self.uri or remaining_lifespan <= 0:
+                return None
+            return t.cast("dict[str, t.Any]", cached["jwk_set"]), remaining_lifespan
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug("Failed to read cached JWS key set from '%s': %s", self._cache_file, e)
+            return None
+
+
+_jwk_clients: dict[str, jwt.PyJWKClient] = {}
+_jwk_clients_lock = threading.Lock()
+
+
+def _get_jwk_client() -> jwt.PyJWKClient:
+    """Get the JWK client of the configured JWS key set URL, shared within the process.
+
+    Returns:
+        jwt.PyJWKClient: The JWK client.
+    """
+    jws_json_url = settings().jws_json_url
+    with _jwk_clients_lock:
+        if jws_json_url not in _jwk_clients:
+            cache_file = Path(settings().cache_dir) / f".jwks-{hashlib.sha256(jws_json_url.encode()).hexdigest()[:16]}"
+            _jwk_clients[jws_json_url] = _PersistentPyJWKClient(
+                jws_json_url, cache_file, settings().jwks_cache_ttl_seconds
+            )
+        return _jwk_clients[jws_json_url]
+
+
 def verify_and_decode_token(token: str) -> dict[str, str]:
     """
     Verifies and decodes the JWT token using the public key from JWS JSON URL.
 
+    The key set is cached, so verification does not require network access unless the cache expired
+    or the token is signed with a key not cached yet.
+
     Args:
         token (str): The JWT token to verify and decode.
 
@@ -173,10 +295,9 @@ def verify_and_decode_token(token: str) -> dict[str, str]:
     Raises:
         RuntimeError: If token verification or decoding fails.
     """
-    jwk_client = jwt.PyJWKClient(settings().jws_json_url)
     try:
         # Get the public key from the JWK client
-        key = jwk_client.get_signing_key_from_jwt(token).key
+        key = _get_jwk_client().get_signing_key_from_jwt(token).key
 
         # Verify and decode the token using the public key
         # Reg. disabling verify_iat see https://github.com/jpadilla/pyjwt/issues/814,
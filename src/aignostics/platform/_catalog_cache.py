@@ -0,0 +1,213 @@
+"""Cache of application catalog lookups with a time to live.
+
+Applications, application versions and the input artifact schemas they carry rarely change, yet are
+looked up on every run submission. Lookups are cached in memory per API root and, if enabled, on disk,
+so the cache is shared across processes. Entries expire after the configured time to live, and can be
+invalidated explicitly.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Annotated, Any, TypeVar
+
+from pydantic import BaseModel, Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from aignostics.utils import __env_file__, __project_name__, get_logger, get_user_data_directory
+
+logger = get_logger(__name__)
+
+M = TypeVar("M", bound=BaseModel)
+
+CATALOG_CACHE_KEY_APPLICATIONS = "applications"
+CATALOG_CACHE_KEY_VERSIONS = "versions:{application_id}"
+CATALOG_CACHE_KEY_VERSION = "version:{application_version_id}"
+
+
+class CatalogCacheSettings(BaseSettings):
+    """Settings for the cache of application catalog lookups."""
+
+    model_config = SettingsConfigDict(
+        env_prefix=f"{__project_name__.upper()}_CATALOG_CACHE_",
+        extra="ignore",
+        env_file=__env_file__,
+        env_file_encoding="utf-8",
+    )
+
+    enabled: Annotated[
+        bool,
+        Field(description="Cache applications, application versions and their input artifact schemas", default=True),
+    ]
+    ttl_seconds: Annotated[
+        int,
+        Field(description="Time to live of cached lookups in seconds", default=300, ge=1),
+    ]
+    persistent: Annotated[
+        bool,
+        Field(description="Additionally cache lookups on disk, shared across processes", default=False),
+    ]
+
+
+class CatalogCache:
+    """Cache of application catalog lookups, kept in memory and optionally on disk.
+
+    Values are lists of models, stored as JSON on disk. Read and write errors of the disk cache are
+    logged and treated as cache misses, so the cache never breaks the caller.
+    """
+
+    def __init__(self, ttl_seconds: int, directory: Path | None = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl_seconds (int): Time to live of entries in seconds.
+            directory (Path | None): Directory to persist entries in, or None to only cache in memory.
+        """
+        self.ttl_seconds = ttl_seconds
+        self.directory = directory
+        self._entries: dict[str, tuple[float, list[Any]]] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path | None:
+        """Get the path an entry is persisted at.
+
+        Args:
+            key (str): The key of the entry.
+
+        Returns:
+            Path | None: The path, or None if the cache is not persistent.
+        """
+        if self.directory is None:
+            return None
+        return self.directory / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    def get(self, key: str, model: type[M]) -> list[M] | None:
+        """Get a cached value.
+
+        Args:
+            key (str): The key of the entry.
+            model (type[M]): The model of the elements of the value.
+
+        Returns:
+            list[M] | None: The cached value, or None if not cached or expired.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[0] > now:
+            return [model.model_validate(element) for element in entry[1]]
+        path = self._path(key)
+        if path is None or not path.is_file():
+            return None
+        try:
+            stored = json.loads(path.read_text(encoding="utf-8"))
+            if stored["key"] != key or stored["expires_at"] <= now:
+                return None
+            values = [model.model_validate(element) for element in stored["values"]]
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug("Failed to read catalog cache entry '%s': %s", key, e)
+            return None
+        with self._lock:
+            self._entries[key] = (stored["expires_at"], stored["values"])
+        return values
+
+    def put(self, key: str, values: list[M]) -> None:
+        """Cache a value.
+
+        Args:
+            key (str): The key of the entry.
+            values (list[M]): The value.
+        """
+        expires_at = time.time() + self.ttl_seconds
+        serialized = [value.model_dump(mode="json", by_alias=True) for value in values]
+        with self._lock:
+            self._entries[key] = (expires_at, serialized)
+        path = self._path(key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temporary_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            temporary_path.write_text(
+                json.dumps({"key": key, "expires_at": expires_at, "values": serialized}), encoding="utf-8"
+            )
+            temporary_path.replace(path)
+        except OSError as e:
+            logger.warning("Failed to write catalog cache entry '%s': %s", key, e)
+
+    def invalidate(self, key_prefix: str = "") -> int:
+        """Remove entries from the cache.
+
+        Args:
+            key_prefix (str): Only remove entries whose key starts with this prefix, all entries by default.
+
+        Returns:
+            int: The number of entries removed from memory and disk.
+        """
+        removed_keys: set[str] = set()
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(key_prefix)]:
+                del self._entries[key]
+                removed_keys.add(key)
+        if self.directory is not None and self.directory.is_dir():
+            for path in self.directory.glob("*.json"):
+                try:
+                    key = json.loads(path.read_text(encoding="utf-8"))["key"]
+                    if key.startswith(key_prefix):
+                        path.unlink()
+                        removed_keys.add(key)
+                except (OSError, ValueError, KeyError, TypeError) as e:
+                    logger.debug("Failed to invalidate catalog cache entry '%s': %s", path, e)
+        return len(removed_keys)
+
+
+_catalog_caches: dict[str, CatalogCache] = {}
+_catalog_caches_lock = threading.Lock()
+
+
+def get_catalog_cache(api_root: str) -> CatalogCache | None:
+    """Get the catalog cache of the given API root.
+
+    Args:
+        api_root (str): The root URL of the API, as catalogs differ per environment.
+
+    Returns:
+        CatalogCache | None: The cache, or None if disabled.
+    """
+    settings = CatalogCacheSettings()
+    if not settings.enabled:
+        return None
+    with _catalog_caches_lock:
+        if api_root not in _catalog_caches:
+            directory = (
+                get_user_data_directory("cache") / "catalog" / hashlib.sha256(api_root.encode()).hexdigest()[:16]
+                if settings.persistent
+                else None
+            )
+            _catalog_caches[api_root] = CatalogCache(settings.ttl_seconds, directory)
+        return _catalog_caches[api_root]
+
+
+def invalidate_catalog_cache(key_prefix: str = "") -> int:
+    """Remove entries from the catalog caches of all API roots, including entries persisted by other processes.
+
+    Args:
+        key_prefix (str): Only remove entries whose key starts with this prefix, all entries by default.
+
+    Returns:
+        int: The number of entries removed.
+    """
+    with _catalog_caches_lock:
+        caches = list(_catalog_caches.values())
+    directories = {cache.directory for cache in caches}
+    root = get_user_data_directory("cache") / "catalog"
+    if root.is_dir():
+        caches += [
+            CatalogCache(CatalogCacheSettings().ttl_seconds, directory)
+            for directory in root.iterdir()
+            if directory.is_dir() and directory not in directories
+        ]
+    return sum(cache.invalidate(key_prefix) for cache in caches)
@@ -1,22 +1,66 @@
 import os
+import ssl
+from types import TracebackType
+from typing import Any
 from urllib.request import getproxies
 
+import httpx
 from aignx.codegen.api.public_api import PublicApi
 from aignx.codegen.api_client import ApiClient
 from aignx.codegen.configuration import Configuration
 from aignx.codegen.exceptions import NotFoundException
 from aignx.codegen.models import ApplicationReadResponse as Application
+from aignx.codegen.rest import RESTResponse
 
-from aignostics.platform._authentication import get_token
-from aignostics.platform.resources.applications import Applications, Versions
-from aignostics.platform.resources.runs import ApplicationRun, Runs
-from aignostics.utils import get_logger
+from aignostics.platform._async_api import AsyncPublicApi
+from aignostics.platform._catalog_cache import get_catalog_cache
+from aignostics.platform._token_provider import TokenProvider, get_token_provider
+from aignostics.platform.resources.applications import Applications, AsyncApplications, AsyncVersions, Versions
+from aignostics.platform.resources.runs import ApplicationRun, AsyncApplicationRun, AsyncRuns, Runs
+from aignostics.utils import HttpSettings, get_logger
 
 from ._settings import settings
 
 logger = get_logger(__name__)
 
 
+class _AuthenticatedApiClient(ApiClient):
+    """API client injecting the current access token of a token provider into each request."""
+
+    def __init__(self, configuration: Configuration, token_provider: TokenProvider) -> None:
+        """Initializes the API client.
+
+        Args:
+            configuration (Configuration): The configuration of the API client.
+            token_provider (TokenProvider): The provider of the access token.
+        """
+        super().__init__(configuration)
+        self._token_provider = token_provider
+
+    def call_api(
+        self,
+        method: str,
+        url: str,
+        header_params: dict[str, Any] | None = None,
+        *args: Any,  # noqa: ANN401
+        **kwargs: Any,  # noqa: ANN401
+    ) -> RESTResponse:
+        """Makes the HTTP request with the current access token.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The URL of the endpoint.
+            header_params (dict[str, Any] | None): The headers of the request.
+            *args: Further positional arguments of ApiClient.call_api.
+            **kwargs: Further keyword arguments of ApiClient.call_api.
+
+        Returns:
+            RESTResponse: The response.
+        """
+        header_params = {**(header_params or {}), "Authorization": f"Bearer {self._token_provider.get_token()}"}
+        return super().call_api(method, url, header_params, *args, **kwargs)
+
+
 class Client:
     """Main client for interacting with the Aignostics Platform API.
 
@@ -28,20 +72,23 @@ class Client:
     runs: Runs
     versions: Versions
 
-    def __init__(self, cache_token: bool = True) -> None:
+    def __init__(self, cache_token: bool = True, use_catalog_cache: bool = True) -> None:
         """Initializes a client instance with authenticated API access.
 
         Args:
             cache_token (bool): If True, caches the authentication token.
                 Defaults to True.
+            use_catalog_cache (bool): If True, serves lookups of applications and versions from the
+                catalog cache if enabled in settings. Defaults to True.
 
         Sets up resource accessors for applications, versions, and runs.
         """
         try:
             logger.debug("Initializing client with cache_token=%s", cache_token)
             self._api = Client.get_api_client(cache_token=cache_token)
-            self.applications: Applications = Applications(self._api)
-            self.runs: Runs = Runs(self._api)
+            cache = get_catalog_cache(settings().api_root) if use_catalog_cache else None
+            self.applications: Applications = Applications(self._api, cache)
+            self.runs: Runs = Runs(self._api, cache)
             logger.debug("Client initialized successfully.")
         except Exception:
             logger.exception("Failed to initialize client.")
@@ -86,21 +133,142 @@ class Client:
             cache_token (bool): If True, caches the authentication token.
                 Defaults to True.
 
+        The access token is obtained from the token provider shared by all clients of the process
+        and injected into each request, so the API client outlives the lifetime of a single token.
+
         Returns:
             ExternalsApi: Configured API client with authentication token.
 
         Raises:
             RuntimeError: If authentication fails.
         """
-        token = get_token(use_cache=cache_token)
+        token_provider = get_token_provider(use_cache=cache_token)
+        token_provider.get_token()  # Authenticate upfront, so failures surface when creating the client
         config = Configuration(
             host=settings().api_root,
             ssl_ca_cert=os.getenv("REQUESTS_CA_BUNDLE"),  # point to .cer file of proxy if defined
         )
         config.proxy = getproxies().get("https")  # use system proxy
-        client = ApiClient(
-            config,
-            header_name="Authorization",
-            header_value=f"Bearer {token}",
+        return PublicApi(_AuthenticatedApiClient(config, token_provider))
+
+
+class AsyncClient:
+    """Asynchronous client for interacting with the Aignostics Platform API.
+
+    Provides the resources of Client as coroutines, built on httpx, so a single event loop can
+    monitor many runs and download their results concurrently. Models and exceptions are shared
+    with the sync client. Use as async context manager, or call aclose when done.
+
+    Example:
+        >>> async with AsyncClient() as client:
+        ...     runs = [run async for run in client.runs.list()]
+        ...     await asyncio.gather(*(run.download_to_folder(base) for run in runs))
+    """
+
+    applications: AsyncApplications
+    runs: AsyncRuns
+    versions: AsyncVersions
+
+    def __init__(
+        self, cache_token: bool = True, use_catalog_cache: bool = True, http_client: httpx.AsyncClient | None = None
+    ) -> None:
+        """Initializes a client instance with authenticated API access.
+
+        Args:
+            cache_token (bool): If True, caches the authentication token.
+                Defaults to True.
+            use_catalog_cache (bool): If True, serves lookups of applications and versions from the
+                catalog cache if enabled in settings. Defaults to True.
+            http_client (httpx.AsyncClient | None): The HTTP client to use for API requests and downloads,
+                defaults to a client configured like the shared HTTP session.
+
+        Sets up resource accessors for applications, versions, and runs.
+        """
+        try:
+            logger.debug("Initializing async client with cache_token=%s", cache_token)
+            self._http_client = http_client or AsyncClient.get_http_client()
+            token_provider = get_token_provider(use_cache=cache_token)
+            token_provider.get_token()  # Authenticate upfront, so failures surface when creating the client
+            self._api = AsyncPublicApi(self._http_client, settings().api_root, token_provider)
+            cache = get_catalog_cache(settings().api_root) if use_catalog_cache else None
+            self.applications: AsyncApplications = AsyncApplications(self._api, cache)
+            self.versions: AsyncVersions = self.applications.versions
+            self.runs: AsyncRuns = AsyncRuns(self._api, cache)
+            logger.debug("Async client initialized successfully.")
+        except Exception:
+            logger.exception("Failed to initialize async client.")
+            raise
+
+    async def __aenter__(self) -> "AsyncClient":
+        """Enters the client context.
+
+        Returns:
+            AsyncClient: The client.
+        """
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Exits the client context, closing pooled connections."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Closes pooled connections of the HTTP client."""
+        await self._http_client.aclose()
+
+    def run(self, application_run_id: str) -> AsyncApplicationRun:
+        """Finds a specific run by id.
+
+        Args:
+            application_run_id (str): The ID of the application run.
+
+        Returns:
+            AsyncApplicationRun: The run object.
+        """
+        return AsyncApplicationRun(self._api, application_run_id)
+
+    async def application(self, application_id: str) -> Application:
+        """Finds a specific application by id.
+
+        Args:
+            application_id (str): The ID of the application.
+
+        Raises:
+            NotFoundException: If the application with the given ID is not found.
+
+        Returns:
+            Application: The application object.
+        """
+        async for application in self.applications.list():
+            if application.application_id == application_id:
+                return application
+        logger.warning("Application with ID '%s' not found.", application_id)
+        raise NotFoundException
+
+    @staticmethod
+    def get_http_client() -> httpx.AsyncClient:
+        """Creates an HTTP client with pooled connections, configured like the shared HTTP session.
+
+        Proxies configured via the environment are honored, and the CA bundle of a proxy if defined.
+
+        Returns:
+            httpx.AsyncClient: The HTTP client.
+        """
+        http_settings = HttpSettings()
+        ca_bundle = os.getenv("REQUESTS_CA_BUNDLE")  # point to .cer file of proxy if defined
+        verify: ssl.SSLContext | bool = ssl.create_default_context(cafile=ca_bundle) if ca_bundle else True
+        limits = httpx.Limits(
+            max_connections=http_settings.pool_maxsize, max_keepalive_connections=http_settings.pool_maxsize
+        )
+        return httpx.AsyncClient(
+            verify=verify,
+            limits=limits,
+            timeout=httpx.Timeout(http_settings.read_timeout, connect=http_settings.connect_timeout),
+            # Failed connection attempts are retried; a custom transport does not inherit verify and limits
+            transport=httpx.AsyncHTTPTransport(verify=verify, limits=limits, retries=http_settings.retries),
+            follow_redirects=True,
         )
-        return PublicApi(client)
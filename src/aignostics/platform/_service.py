@@ -13,6 +13,7 @@ from aignostics.utils import UNHIDE_SENSITIVE_INFO, BaseService, Health, __versi
 from ._authentication import CLAIM_ROLE, get_token, remove_cached_token, userinfo, verify_and_decode_token
 from ._client import Client
 from ._settings import Settings
+from ._token_provider import invalidate_token_providers
 
 logger = get_logger(__name__)
 
@@ -244,6 +245,7 @@ class Service(BaseService):
         """
         logger.debug("Logging out...")
         rtn = remove_cached_token()
+        invalidate_token_providers()
         logger.debug("Logout successful: %s", rtn)
         return rtn
 
@@ -65,6 +65,7 @@ class Settings(OpaqueSettings):
         client_id_interactive (SecretStr): Client ID for interactive authorization flow.
         device_url (str): Device authorization endpoint for device flow.
         jws_json_url (str): URL for JWS key set.
+        jwks_cache_ttl_seconds (int): Time to live of the cached JWS key set in seconds.
         redirect_uri (str): Redirect URI for OAuth authorization code flow.
         refresh_token (SecretStr | None): OAuth refresh token if available.
         request_timeout_seconds (int): Timeout for API requests in seconds.
@@ -200,6 +201,7 @@ class Settings(OpaqueSettings):
 
     request_timeout_seconds: int = 30
     authorization_backoff_seconds: int = 3
+    jwks_cache_ttl_seconds: int = 60 * 60
 
     @model_validator(mode="before")
     def pre_init(cls, values: dict) -> dict:  # type: ignore[type-arg] # noqa: N805
@@ -0,0 +1,181 @@
+"""In-process provider of access tokens, shared by all clients of a process.
+
+Tokens are kept in memory, so creating a client does not re-read the token file, and are injected
+into each request instead of being fixed when the client is created. If a refresh token is configured,
+tokens are refreshed in the background before they expire, so long-running jobs such as downloading
+the results of large runs outlive the lifetime of a single token.
+"""
+
+import asyncio
+import os
+import threading
+import time
+
+import jwt
+
+from aignostics.utils import get_logger
+
+from ._authentication import _token_from_refresh_token, get_token, store_cached_token, verify_and_decode_token
+from ._settings import settings
+
+logger = get_logger(__name__)
+
+# Tokens expiring within the margin are renewed on demand, matching the buffer of the token file
+TOKEN_REFRESH_MARGIN_SECONDS = 5 * 60
+
+
+class TokenProvider:
+    """Provider of a valid access token, safe to use from multiple threads and event loops.
+
+    The token is obtained via get_token on first use, and again when it is about to expire. If a refresh
+    token is configured, the token is additionally refreshed on a background thread a margin before
+    on-demand renewal would kick in, so requests never wait for a refresh.
+    """
+
+    def __init__(self, use_cache: bool = True, refresh_margin_seconds: int = TOKEN_REFRESH_MARGIN_SECONDS) -> None:
+        """Initialize the provider.
+
+        Args:
+            use_cache (bool): Whether to read and store the token from and in the token file.
+            refresh_margin_seconds (int): Renew tokens expiring within this number of seconds.
+        """
+        self._use_cache = use_cache
+        self._refresh_margin_seconds = refresh_margin_seconds
+        self._lock = threading.Lock()
+        # Token and expiry are replaced together, so they can be read without holding the lock
+        self._current: tuple[str, float] | None = None
+        self._refresh_timer: threading.Timer | None = None
+
+    def _valid_token(self) -> str | None:
+        """Get the current token if not about to expire.
+
+        Returns:
+            str | None: The token, or None if no token was obtained yet or it is about to expire.
+        """
+        current = self._current
+        if current is None or time.time() + self._refresh_margin_seconds >= current[1]:
+            return None
+        return current[0]
+
+    def get_token(self) -> str:
+        """Get a valid access token, authenticating if required.
+
+        Returns:
+            str: The JWT access token.
+
+        Raises:
+            RuntimeError: If authentication fails.
+        """
+        if token := self._valid_token():
+            return token
+        with self._lock:
+            if token := self._valid_token():
+                return token  # Renewed by another thread while waiting for the lock
+            token = get_token(use_cache=self._use_cache)
+            self._set_token(token)
+            return token
+
+    async def get_token_async(self) -> str:
+        """Get a valid access token without blocking the event loop, authenticating if required.
+
+        Returns:
+            str: The JWT access token.
+
+        Raises:
+            RuntimeError: If authentication fails.
+        """
+        if token := self._valid_token():
+            return token
+        return await asyncio.to_thread(self.get_token)
+
+    def invalidate(self) -> None:
+        """Forget the current token and stop refreshing it in the background, e.g. on logout."""
+        with self._lock:
+            self._current = None
+            if self._refresh_timer is not None:
+                self._refresh_timer.cancel()
+                self._refresh_timer = None
+
+    def _set_token(self, token: str, expiry: int | None = None) -> int:
+        """Set the current token and schedule its refresh. Must be called while holding the lock.
+
+        Args:
+            token (str): The JWT access token, as returned by get_token, or verified by the caller.
+            expiry (int | None): The expiry of the token as Unix timestamp, read from the token if None.
+
+        Returns:
+            int: The expiry of the token as Unix timestamp.
+        """
+        if expiry is None:
+            expiry = int(jwt.decode(token, options={"verify_signature": False})["exp"])
+        self._current = (token, float(expiry))
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+        delay = expiry - 2 * self._refresh_margin_seconds - time.time()
+        # Tokens too short-lived to refresh ahead of on-demand renewal are only renewed on demand,
+        # as refreshing them right away would request tokens from the identity provider in a loop
+        if settings().refresh_token is not None and delay > 0:
+            self._refresh_timer = threading.Timer(delay, self._refresh)
+            self._refresh_timer.name = "token-refresh"
+            self._refresh_timer.daemon = True
+            self._refresh_timer.start()
+        return expiry
+
+    def _refresh(self) -> None:
+        """Refresh the current token using the configured refresh token.
+
+        The refreshed token is verified before it is used and stored. Failures are logged only, as the token
+        is renewed on demand once it is about to expire.
+        """
+        refresh_token = settings().refresh_token
+        if refresh_token is None:
+            return
+        try:
+            token = _token_from_refresh_token(refresh_token)
+            if not token:
+                return
+            expiry = int(verify_and_decode_token(token)["exp"])
+        except Exception as e:  # noqa: BLE001
+            logger.warning("Failed to refresh access token in the background, renewing on demand: %s", e)
+            return
+        with self._lock:
+            if self._current is None or self._refresh_timer is not threading.current_thread():
+                return  # Invalidated or renewed on demand while refreshing
+            self._set_token(token, expiry)
+        if self._use_cache:
+            store_cached_token(token, expiry)
+        logger.debug("Refreshed access token in the background.")
+
+
+_token_providers: dict[bool, TokenProvider] = {}
+_token_providers_pid: int | None = None
+_token_providers_lock = threading.Lock()
+
+
+def get_token_provider(use_cache: bool = True) -> TokenProvider:
+    """Get the token provider shared by all clients of this process.
+
+    Args:
+        use_cache (bool): Whether the provider reads and stores the token from and in the token file.
+
+    Returns:
+        TokenProvider: The token provider.
+    """
+    global _token_providers, _token_providers_pid  # noqa: PLW0603
+    with _token_providers_lock:
+        if _token_providers_pid != os.getpid():
+            # Refresh threads do not survive forking, so forked processes start afresh
+            _token_providers = {}
+            _token_providers_pid = os.getpid()
+        if use_cache not in _token_providers:
+            _token_providers[use_cache] = TokenProvider(use_cache=use_cache)
+        return _token_providers[use_cache]
+
+
+def invalidate_token_providers() -> None:
+    """Forget the tokens of all token providers of this process, e.g. on logout."""
+    with _token_providers_lock:
+        providers = list(_token_providers.values()) if _token_providers_pid == os.getpid() else []
+    for provider in providers:
+        provider.invalidate()
@@ -8,25 +8,33 @@ These utilities primarily handle file operations, data integrity, and cloud stor
 interactions to support the main client functionality.
 """
 
-import base64
+import asyncio
 import contextlib
 import datetime
 import re
 import tempfile
+import threading
 import typing as t
-from collections.abc import Generator
+from collections.abc import Callable, Generator
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
 from pathlib import Path
 from typing import IO, Any
 
-import google_crc32c
-import requests
+import httpx
 from aignx.codegen.models import InputArtifactReadResponse as InputArtifactData
 from aignx.codegen.models import OutputArtifactReadResponse as OutputArtifactData
 from aignx.codegen.models import OutputArtifactResultReadResponse as OutputArtifactElement
+from pydantic import BaseModel
 from tqdm.auto import tqdm
 
+from aignostics.utils import StreamingChecksum, get_http_session
+from aignostics.utils import calculate_file_crc32c as utils_calculate_file_crc32c
+
 EIGHT_MB = 8_388_608
 SIGNED_DOWNLOAD_URL_EXPIRES_SECONDS_DEFAULT = 6 * 60 * 60  # 6 hours
+SEGMENTED_DOWNLOAD_MIN_SEGMENT_SIZE = 4 * EIGHT_MB  # 32MB
+CRC32C_POLYNOMIAL_REFLECTED = 0x82F63B78
 
 
 def mime_type_to_file_ending(mime_type: str) -> str:
@@ -72,31 +80,362 @@ def get_mime_type_for_artifact(artifact: OutputArtifactData | InputArtifactData
     return str(metadata.get("media_type", metadata.get("mime_type", "application/octet-stream")))
 
 
-def download_file(signed_url: str, file_path: str, verify_checksum: str) -> None:
+def _gf2_matrix_times(matrix: list[int], vector: int) -> int:
+    """Multiplies a 32x32 matrix over GF(2) with a vector.
+
+    Args:
+        matrix (list[int]): The matrix, one column per bit of the vector.
+        vector (int): The vector.
+
+    Returns:
+        int: The product.
+    """
+    result = 0
+    index = 0
+    while vector:
+        if vector & 1:
+            result ^= matrix[index]
+        vector >>= 1
+        index += 1
+    return result
+
+
+def _gf2_matrix_square(matrix: list[int]) -> list[int]:
+    """Squares a 32x32 matrix over GF(2).
+
+    Args:
+        matrix (list[int]): The matrix to square.
+
+    Returns:
+        list[int]: The squared matrix.
+    """
+    return [_gf2_matrix_times(matrix, column) for column in matrix]
+
+
+def crc32c_combine(crc1: int, crc2: int, length2: int) -> int:
+    """Combines the CRC32C checksums of two consecutive blocks of data.
+
+    Computes the checksum of the concatenation of both blocks from their individual checksums
+    without touching the data again, following the approach of zlib's crc32_combine.
+
+    Args:
+        crc1 (int): CRC32C checksum of the first block.
+        crc2 (int): CRC32C checksum of the second block.
+        length2 (int): Length of the second block in bytes.
+
+    Returns:
+        int: CRC32C checksum of the first block followed by the second block.
+    """
+    if length2 <= 0:
+        return crc1
+
+    # Operator for one zero bit, then two and four zero bits
+    odd = [CRC32C_POLYNOMIAL_REFLECTED] + [1 << n for n in range(31)]
+    even = _gf2_matrix_square(odd)
+    odd = _gf2_matrix_square(even)
+
+    # Apply length2 zero bytes to crc1, squaring the operator for each bit of length2
+    while True:
+        even = _gf2_matrix_square(odd)
+        if length2 & 1:
+            crc1 = _gf2_matrix_times(even, crc1)
+        length2 >>= 1
+        if not length2:
+            break
+        odd = _gf2_matrix_square(even)
+        if length2 & 1:
+            crc1 = _gf2_matrix_times(odd, crc1)
+        length2 >>= 1
+        if not length2:
+            break
+    return crc1 ^ crc2
+
+
+def get_download_size_if_ranges_supported(signed_url: str) -> int | None:
+    """Determines the size of a download if the server supports range requests.
+
+    Args:
+        signed_url (str): The signed URL to probe.
+
+    Returns:
+        int | None: The total size in bytes, or None if the server does not serve byte ranges.
+
+    Raises:
+        requests.HTTPError: If the probe request fails.
+    """
+    with get_http_session().get(signed_url, headers={"Range": "bytes=0-0"}, stream=True) as response:
+        response.raise_for_status()
+        if response.status_code != HTTPStatus.PARTIAL_CONTENT:
+            return None
+        _, _, total_size = response.headers.get("content-range", "").rpartition("/")
+        return int(total_size) if total_size.isdigit() else None
+
+
+def get_segment_count(size: int, max_segment_count: int) -> int:
+    """Determines into how many segments a download of the given size should be split.
+
+    Segments are at least SEGMENTED_DOWNLOAD_MIN_SEGMENT_SIZE large, so small files are never split.
+
+    Args:
+        size (int): Size of the download in bytes.
+        max_segment_count (int): Maximum number of segments.
+
+    Returns:
+        int: Number of segments, 1 if the download should not be split.
+    """
+    return max(1, min(max_segment_count, size // SEGMENTED_DOWNLOAD_MIN_SEGMENT_SIZE))
+
+
+class DownloadSegment(BaseModel):
+    """Byte range of a segmented download and the progress made on it."""
+
+    start: int
+    end: int  # Inclusive
+    offset: int = 0  # Number of bytes of the range downloaded
+    crc32c: int = 0  # CRC32C checksum of the downloaded bytes of the range
+
+    @property
+    def size(self) -> int:
+        """Size of the byte range.
+
+        Returns:
+            int: The size in bytes.
+        """
+        return self.end - self.start + 1
+
+
+def _download_segment(  # noqa: PLR0913, PLR0917
+    signed_url: str,
+    file_path: Path,
+    segment: DownloadSegment,
+    chunk_size: int,
+    progress_callback: Callable[[int], None] | None,
+    checkpoint_callback: Callable[[], None] | None = None,
+    checkpoint_size: int = EIGHT_MB,
+) -> None:
+    """Downloads the remainder of a byte range into the given region of a preallocated file.
+
+    Args:
+        signed_url (str): The signed URL to download from.
+        file_path (Path): The preallocated file to write to.
+        segment (DownloadSegment): The byte range, continued at its offset and updated in place.
+        chunk_size (int): Size of the chunks to stream.
+        progress_callback (Callable[[int], None] | None): Called with the size of each written chunk.
+        checkpoint_callback (Callable[[], None] | None): Called once written data is flushed,
+            after every checkpoint_size bytes and when the download of the range ends, including on errors.
+        checkpoint_size (int): Number of bytes between checkpoints.
+
+    Raises:
+        ValueError: If the server does not serve the requested range completely.
+        requests.HTTPError: If the download request fails.
+    """
+    if segment.offset >= segment.size:
+        return
+    start = segment.start + segment.offset
+    headers = {"Range": f"bytes={start}-{segment.end}"}
+    with get_http_session().get(signed_url, headers=headers, stream=True) as stream:
+        stream.raise_for_status()
+        if stream.status_code != HTTPStatus.PARTIAL_CONTENT:
+            msg = f"Server did not serve byte range {start}-{segment.end}: HTTP {stream.status_code}"
+            raise ValueError(msg)
+        # Each segment writes through its own handle, positioned at its region of the file
+        with open(file_path, mode="r+b") as file:
+            file.seek(start)
+            checksum = StreamingChecksum(crc32c=segment.crc32c)
+            checkpointed_offset = segment.offset
+            try:
+                for chunk in stream.iter_content(chunk_size=chunk_size):
+                    if not chunk:
+                        continue
+                    file.write(chunk)
+                    checksum.update(chunk)
+                    segment.offset, segment.crc32c = segment.offset + len(chunk), checksum.crc32c
+                    if checkpoint_callback and segment.offset - checkpointed_offset >= checkpoint_size:
+                        file.flush()
+                        checkpoint_callback()
+                        checkpointed_offset = segment.offset
+                    if progress_callback:
+                        progress_callback(len(chunk))
+            finally:
+                if checkpoint_callback:
+                    file.flush()
+                    checkpoint_callback()
+    if segment.offset != segment.size:
+        msg = f"Incomplete byte range {segment.start}-{segment.end}: received {segment.offset} bytes"
+        raise ValueError(msg)
+
+
+def _plan_download_segments(size: int, segment_count: int) -> list[DownloadSegment]:
+    """Splits a download into byte ranges of about equal size.
+
+    Args:
+        size (int): Total size of the file in bytes.
+        segment_count (int): Number of segments.
+
+    Returns:
+        list[DownloadSegment]: The byte ranges, none of them downloaded yet.
+    """
+    segment_count = max(1, min(segment_count, size))
+    segment_size = -(-size // segment_count)
+    return [
+        DownloadSegment(start=start, end=min(start + segment_size, size) - 1) for start in range(0, size, segment_size)
+    ]
+
+
+def download_file_segmented(  # noqa: PLR0913, PLR0917
+    signed_url: str,
+    file_path: Path,
+    size: int,
+    segment_count: int,
+    progress_callback: Callable[[int], None] | None = None,
+    chunk_size: int = EIGHT_MB,
+    segments: list[DownloadSegment] | None = None,
+    checkpoint_callback: Callable[[list[DownloadSegment]], None] | None = None,
+    checkpoint_size: int = EIGHT_MB,
+) -> str:
+    """Downloads a file with concurrent range requests into a preallocated file.
+
+    The checksums of the segments are combined into the checksum of the full file,
+    so no second pass over the downloaded data is required.
+
+    If segments are given, e.g. as checkpointed by an interrupted download, the file is expected to be
+    preallocated already and each segment is continued at its offset.
+
+    Args:
+        signed_url (str): The signed URL to download from, must support range requests.
+        file_path (Path): The local path where the file should be saved.
+        size (int): Total size of the file in bytes.
+        segment_count (int): Number of segments downloaded concurrently, if no segments are given.
+        progress_callback (Callable[[int], None] | None): Called with the size of each written chunk.
+            Called from worker threads, serialized by this function.
+        chunk_size (int): Size of the chunks to stream per segment.
+        segments (list[DownloadSegment] | None): Segments to continue, updated in place,
+            or None to start a new download.
+        checkpoint_callback (Callable[[list[DownloadSegment]], None] | None): Called with the segments once
+            their written data is flushed, so their progress can be persisted. Called from worker threads,
+            serialized by this function.
+        checkpoint_size (int): Number of bytes per segment between checkpoints.
+
+    Returns:
+        str: The CRC32C checksum of the downloaded file in base64 encoding.
+
+    Raises:
+        ValueError: If the server does not serve the requested ranges.
+        requests.HTTPError: If a download request fails.
+    """
+    if segments is None:
+        segments = _plan_download_segments(size, segment_count)
+        with open(file_path, mode="wb") as file:
+            file.truncate(size)
+
+    lock = threading.Lock()
+
+    def report(chunk_size: int) -> None:
+        if progress_callback:
+            with lock:
+                progress_callback(chunk_size)
+
+    def checkpoint() -> None:
+        if checkpoint_callback:
+            with lock:
+                checkpoint_callback(segments)
+
+    pending = [segment for segment in segments if segment.offset < segment.size]
+    with ThreadPoolExecutor(max_workers=max(1, len(pending)), thread_name_prefix="download-segment") as executor:
+        futures = [
+            executor.submit(
+                _download_segment,
+                signed_url,
+                file_path,
+                segment,
+                chunk_size,
+                report,
+                checkpoint if checkpoint_callback else None,
+                checkpoint_size,
+            )
+            for segment in pending
+        ]
+        try:
+            for future in futures:
+                future.result()
+        except BaseException:
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
+
+    crc = segments[0].crc32c if segments else 0
+    for segment in segments[1:]:
+        crc = crc32c_combine(crc, segment.crc32c, segment.size)
+    return StreamingChecksum(crc32c=crc).crc32c_base64()
+
+
+def download_file(signed_url: str, file_path: str, verify_checksum: str, segment_count: int = 1) -> None:
     """Downloads a file from a signed URL and verifies its integrity.
 
     Args:
         signed_url (str): The signed URL to download the file from.
         file_path (str): The local path where the file should be saved.
         verify_checksum (str): The expected CRC32C checksum in base64 encoding.
+        segment_count (int): Maximum number of byte ranges of a large file downloaded concurrently.
+            Falls back to a single stream for small files or servers not supporting range requests.
 
     Raises:
         ValueError: If the downloaded file's checksum doesn't match the expected value.
         requests.HTTPError: If the download request fails.
     """
-    checksum = google_crc32c.Checksum()  # type: ignore[no-untyped-call]
-    with requests.get(signed_url, stream=True, timeout=60) as stream:
-        stream.raise_for_status()
-        with open(file_path, mode="wb") as file:
-            total_size = int(stream.headers.get("content-length", 0))
-            progress_bar = tqdm(total=total_size, unit="B", unit_scale=True)
-            for chunk in stream.iter_content(chunk_size=EIGHT_MB):
-                if chunk:
-                    file.write(chunk)
-                    checksum.update(chunk)  # type: ignore[no-untyped-call]
-                    progress_bar.update(len(chunk))
+    size = get_download_size_if_ranges_supported(signed_url) if segment_count > 1 else None
+    if size is not None and get_segment_count(size, segment_count) > 1:
+        progress_bar = tqdm(total=size, unit="B", unit_scale=True)
+        try:
+            downloaded_file = download_file_segmented(
+                signed_url, Path(file_path), size, get_segment_count(size, segment_count), progress_bar.update
+            )
+        finally:
             progress_bar.close()
-    downloaded_file = base64.b64encode(checksum.digest()).decode("ascii")  # type: ignore[no-untyped-call]
+    else:
+        checksum = StreamingChecksum()
+        with get_http_session().get(signed_url, stream=True) as stream:
+            stream.raise_for_status()
+            with open(file_path, mode="wb") as file:
+                total_size = int(stream.headers.get("content-length", 0))
+                progress_bar = tqdm(total=total_size, unit="B", unit_scale=True)
+                for chunk in stream.iter_content(chunk_size=EIGHT_MB):
+                    if chunk:
+                        file.write(chunk)
+                        checksum.update(chunk)
+                        progress_bar.update(len(chunk))
+                progress_bar.close()
+        downloaded_file = checksum.crc32c_base64()
+    if downloaded_file != verify_checksum:
+        msg = f"Checksum mismatch: {downloaded_file} != {verify_checksum}"
+        raise ValueError(msg)
+
+
+async def download_file_async(
+    http_client: httpx.AsyncClient, signed_url: str, file_path: Path, verify_checksum: str, chunk_size: int = EIGHT_MB
+) -> None:
+    """Downloads a file from a signed URL without blocking the event loop and verifies its integrity.
+
+    Chunks are written to the file in a worker thread, while the download is streamed by the event loop.
+
+    Args:
+        http_client (httpx.AsyncClient): The client to download with, must not send API credentials.
+        signed_url (str): The signed URL to download the file from.
+        file_path (Path): The local path where the file should be saved.
+        verify_checksum (str): The expected CRC32C checksum in base64 encoding.
+        chunk_size (int): Size of the chunks to stream.
+
+    Raises:
+        ValueError: If the downloaded file's checksum doesn't match the expected value.
+        httpx.HTTPStatusError: If the download request fails.
+    """
+    checksum = StreamingChecksum()
+    async with http_client.stream("GET", signed_url) as stream:
+        stream.raise_for_status()
+        with open(file_path, mode="wb") as file:  # noqa: ASYNC230
+            async for chunk in stream.aiter_bytes(chunk_size=chunk_size):
+                await asyncio.to_thread(file.write, chunk)
+                checksum.update(chunk)
+    downloaded_file = checksum.crc32c_base64()
     if downloaded_file != verify_checksum:
         msg = f"Checksum mismatch: {downloaded_file} != {verify_checksum}"
         raise ValueError(msg)
@@ -147,11 +486,7 @@ def calculate_file_crc32c(file: Path) -> str:
     Returns:
         str: The CRC32C checksum in base64 encoding.
     """
-    checksum = google_crc32c.Checksum()  # type: ignore[no-untyped-call]
-    with open(file, mode="rb") as f:
-        for _ in checksum.consume(f, EIGHT_MB):  # type: ignore[no-untyped-call]
-            pass
-    return base64.b64encode(checksum.digest()).decode("ascii")  # type: ignore[no-untyped-call]
+    return utils_calculate_file_crc32c(file)
 
 
 @contextlib.contextmanager
@@ -14,7 +14,48 @@ from aignx.codegen.api.public_api import PublicApi
 from aignx.codegen.models import ApplicationReadResponse as Application
 from aignx.codegen.models import ApplicationVersionReadResponse as ApplicationVersion
 
-from aignostics.platform.resources.utils import paginate
+from aignostics.platform._async_api import AsyncPublicApi
+from aignostics.platform._catalog_cache import (
+    CATALOG_CACHE_KEY_APPLICATIONS,
+    CATALOG_CACHE_KEY_VERSION,
+    CATALOG_CACHE_KEY_VERSIONS,
+    CatalogCache,
+)
+from aignostics.platform.resources.utils import async_paginate, paginate, with_fast_deserialization
+
+
+def sort_versions_by_semver(versions: list[ApplicationVersion]) -> list[ApplicationVersion]:
+    """Sort application versions by semver, descending.
+
+    Args:
+        versions (list[ApplicationVersion]): The versions to sort.
+
+    Returns:
+        list[ApplicationVersion]: The versions sorted by semantic versioning (latest first),
+            skipping versions that cannot be parsed, or all versions as is if none can be parsed
+    """
+    # If no versions available
+    if not versions:
+        return []
+
+    # Extract semantic versions using proper semver parsing
+    versions_with_semver = []
+    for v in versions:
+        try:
+            parsed_version = semver.Version.parse(v.version)
+            versions_with_semver.append((v, parsed_version))
+        except (ValueError, AttributeError):
+            # If we can't parse the version or version attribute doesn't exist, skip it
+            continue
+
+    # Sort by semantic version (semver objects have built-in comparison)
+    if versions_with_semver:
+        versions_with_semver.sort(key=itemgetter(1), reverse=True)
+        # Return just the version objects, not the tuples
+        return [item[0] for item in versions_with_semver]
+
+    # If we couldn't parse any versions, return all versions as is
+    return versions
 
 
 class Versions:
@@ -25,13 +66,15 @@ class Versions:
 
     APPLICATION_VERSION_REGEX = re.compile(r"^(?P<application_id>[^:]+):v(?P<version>[^:].+)$")
 
-    def __init__(self, api: PublicApi) -> None:
+    def __init__(self, api: PublicApi, cache: CatalogCache | None = None) -> None:
         """Initializes the Versions resource with the API platform.
 
         Args:
             api (PublicApi): The configured API platform.
+            cache (CatalogCache | None): Cache of catalog lookups, or None to always query the API.
         """
         self._api = api
+        self._cache = cache
 
     def list(self, application: Application | str) -> t.Iterator[ApplicationVersion]:
         """Find all versions for a specific application.
@@ -48,7 +91,10 @@ class Versions:
         application_id = application.application_id if isinstance(application, Application) else application
 
         return paginate(
-            self._api.list_versions_by_application_id_v1_applications_application_id_versions_get,
+            with_fast_deserialization(
+                self._api.list_versions_by_application_id_v1_applications_application_id_versions_get,
+                ApplicationVersion,
+            ),
             application_id=application_id,
         )
 
@@ -78,6 +124,10 @@ class Versions:
             application_id = match.group("application_id")
             version = match.group("version")
 
+        cache_key = CATALOG_CACHE_KEY_VERSION.format(application_version_id=f"{application_id}:v{version}")
+        cached = self._cache.get(cache_key, ApplicationVersion) if self._cache else None
+        if cached:
+            return cached[0]
         application_versions = self._api.list_versions_by_application_id_v1_applications_application_id_versions_get(
             application_id=application_id,
             version=version,
@@ -86,6 +136,8 @@ class Versions:
             # this invariance is enforced by the system. If that error occurs, we have an internal error
             msg = "Internal server error. Please contact Aignostics support."
             raise RuntimeError(msg)
+        if self._cache:
+            self._cache.put(cache_key, application_versions)
         return application_versions[0]
 
     # TODO(Andreas): Remove when supported in backend
@@ -99,29 +151,14 @@ class Versions:
             list[ApplicationVersion]: List of version objects sorted by semantic versioning (latest first),
                 or empty list if no versions are found
         """
-        versions = builtins.list(self.list(application=application))
-
-        # If no versions available
-        if not versions:
-            return []
-
-        # Extract semantic versions using proper semver parsing
-        versions_with_semver = []
-        for v in versions:
-            try:
-                parsed_version = semver.Version.parse(v.version)
-                versions_with_semver.append((v, parsed_version))
-            except (ValueError, AttributeError):
-                # If we can't parse the version or version attribute doesn't exist, skip it
-                continue
-
-        # Sort by semantic version (semver objects have built-in comparison)
-        if versions_with_semver:
-            versions_with_semver.sort(key=itemgetter(1), reverse=True)
-            # Return just the version objects, not the tuples
-            return [item[0] for item in versions_with_semver]
-
-        # If we couldn't parse any versions, return all versions as is
+        application_id = application.application_id if isinstance(application, Application) else application
+        cache_key = CATALOG_CACHE_KEY_VERSIONS.format(application_id=application_id)
+        cached = self._cache.get(cache_key, ApplicationVersion) if self._cache else None
+        if cached is not None:
+            return cached
+        versions = sort_versions_by_semver(builtins.list(self.list(application=application)))
+        if self._cache:
+            self._cache.put(cache_key, versions)
         return versions
 
     def latest(self, application: Application | str) -> ApplicationVersion | None:
@@ -143,14 +180,16 @@ class Applications:
     Provides operations to list applications and access version resources.
     """
 
-    def __init__(self, api: PublicApi) -> None:
+    def __init__(self, api: PublicApi, cache: CatalogCache | None = None) -> None:
         """Initializes the Applications resource with the API platform.
 
         Args:
             api (PublicApi): The configured API platform.
+            cache (CatalogCache | None): Cache of catalog lookups, or None to always query the API.
         """
         self._api = api
-        self.versions: Versions = Versions(self._api)
+        self._cache = cache
+        self.versions: Versions = Versions(self._api, cache)
 
     def list(self) -> t.Iterator[Application]:
         """Find all available applications.
@@ -161,4 +200,174 @@ class Applications:
         Raises:
             Exception: If the API request fails.
         """
-        return paginate(self._api.list_applications_v1_applications_get)
+        if self._cache is None:
+            return paginate(with_fast_deserialization(self._api.list_applications_v1_applications_get, Application))
+        applications = self._cache.get(CATALOG_CACHE_KEY_APPLICATIONS, Application)
+        if applications is None:
+            applications = builtins.list(
+                paginate(with_fast_deserialization(self._api.list_applications_v1_applications_get, Application))
+            )
+            self._cache.put(CATALOG_CACHE_KEY_APPLICATIONS, applications)
+        return iter(applications)
+
+
+class AsyncVersions:
+    """Asynchronous resource class for managing application versions.
+
+    Provides the operations of Versions as coroutines.
+    """
+
+    APPLICATION_VERSION_REGEX = Versions.APPLICATION_VERSION_REGEX
+
+    def __init__(self, api: AsyncPublicApi, cache: CatalogCache | None = None) -> None:
+        """Initializes the AsyncVersions resource with the async API.
+
+        Args:
+            api (AsyncPublicApi): The configured async API.
+            cache (CatalogCache | None): Cache of catalog lookups, or None to always query the API.
+        """
+        self._api = api
+        self._cache = cache
+
+    def list(self, application: Application | str) -> t.AsyncIterator[ApplicationVersion]:
+        """Find all versions for a specific application.
+
+        Args:
+            application (Application | str): The application to find versions for, either object or id
+
+        Returns:
+            AsyncIterator[ApplicationVersion]: An async iterator over the available application versions.
+
+        Raises:
+            Exception: If the API request fails.
+        """
+        application_id = application.application_id if isinstance(application, Application) else application
+
+        return async_paginate(
+            self._api.list_versions_by_application_id_v1_applications_application_id_versions_get,
+            application_id=application_id,
+        )
+
+    async def details(self, application_version: ApplicationVersion | str) -> ApplicationVersion:
+        """Retrieves details for a specific application version.
+
+        Args:
+            application_version (ApplicationVersion | str): The ID of the application version.
+
+        Returns:
+            ApplicationVersion: The version details.
+
+        Raises:
+            RuntimeError: If the application version ID is invalid or if the API request fails.
+            Exception: If the API request fails.
+        """
+        if isinstance(application_version, ApplicationVersion):
+            application_id = application_version.application_id
+            version = application_version.version
+        else:
+            match = self.APPLICATION_VERSION_REGEX.match(application_version)
+            if not match:
+                msg = f"Invalid application_version_id: {application_version}"
+                raise RuntimeError(msg)
+
+            application_id = match.group("application_id")
+            version = match.group("version")
+
+        cache_key = CATALOG_CACHE_KEY_VERSION.format(application_version_id=f"{application_id}:v{version}")
+        cached = self._cache.get(cache_key, ApplicationVersion) if self._cache else None
+        if cached:
+            return cached[0]
+        application_versions = (
+            await self._api.list_versions_by_application_id_v1_applications_application_id_versions_get(
+                application_id=application_id,
+                version=version,
+            )
+        )
+        if len(application_versions) != 1:
+            # this invariance is enforced by the system. If that error occurs, we have an internal error
+            msg = "Internal server error. Please contact Aignostics support."
+            raise RuntimeError(msg)
+        if self._cache:
+            self._cache.put(cache_key, application_versions)
+        return application_versions[0]
+
+    async def list_sorted(self, application: Application | str) -> builtins.list[ApplicationVersion]:
+        """Get application versions sorted by semver, descending.
+
+        Args:
+            application (Application | str): The application to find versions for, either object or id
+
+        Returns:
+            list[ApplicationVersion]: List of version objects sorted by semantic versioning (latest first),
+                or empty list if no versions are found
+        """
+        application_id = application.application_id if isinstance(application, Application) else application
+        cache_key = CATALOG_CACHE_KEY_VERSIONS.format(application_id=application_id)
+        cached = self._cache.get(cache_key, ApplicationVersion) if self._cache else None
+        if cached is not None:
+            return cached
+        versions = sort_versions_by_semver([version async for version in self.list(application=application)])
+        if self._cache:
+            self._cache.put(cache_key, versions)
+        return versions
+
+    async def latest(self, application: Application | str) -> ApplicationVersion | None:
+        """Get latest version.
+
+        Args:
+            application (Application | str): The application to find versions for, either object or id
+
+        Returns:
+            ApplicationVersion | None: The latest version id, or None if no versions found.
+        """
+        sorted_versions = await self.list_sorted(application=application)
+        return sorted_versions[0] if sorted_versions else None
+
+
+class AsyncApplications:
+    """Asynchronous resource class for managing applications.
+
+    Provides the operations of Applications as coroutines.
+    """
+
+    def __init__(self, api: AsyncPublicApi, cache: CatalogCache | None = None) -> None:
+        """Initializes the AsyncApplications resource with the async API.
+
+        Args:
+            api (AsyncPublicApi): The configured async API.
+            cache (CatalogCache | None): Cache of catalog lookups, or None to always query the API.
+        """
+        self._api = api
+        self._cache = cache
+        self.versions: AsyncVersions = AsyncVersions(self._api, cache)
+
+    def list(self) -> t.AsyncIterator[Application]:
+        """Find all available applications.
+
+        Returns:
+            AsyncIterator[Application]: An async iterator over the available applications.
+
+        Raises:
+            Exception: If the API request fails.
+        """
+        if self._cache is None:
+            return async_paginate(self._api.list_applications_v1_applications_get)
+        return self._list_cached(self._cache)
+
+    async def _list_cached(self, cache: CatalogCache) -> t.AsyncIterator[Application]:
+        """Find all available applications, served from the cache if cached before.
+
+        Args:
+            cache (CatalogCache): The cache of catalog lookups.
+
+        Yields:
+            Application: The available applications.
+        """
+        applications = cache.get(CATALOG_CACHE_KEY_APPLICATIONS, Application)
+        if applications is None:
+            applications = [
+                application async for application in async_paginate(self._api.list_applications_v1_applications_get)
+            ]
+            cache.put(CATALOG_CACHE_KEY_APPLICATIONS, applications)
+        for application in applications:
+            yield application
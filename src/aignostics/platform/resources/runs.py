@@ -4,11 +4,17 @@ This module provides classes for creating and managing application runs on the A
 It includes functionality for starting runs, monitoring status, and downloading results.
 """
 
+import asyncio
+import contextlib
+import hashlib
+import json
+import threading
 import typing as t
 from collections.abc import Generator
+from dataclasses import dataclass
 from pathlib import Path
 from time import sleep
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from aignx.codegen.api.public_api import PublicApi
 from aignx.codegen.models import (
@@ -16,29 +22,76 @@ from aignx.codegen.models import (
     ItemCreationRequest,
     ItemResultReadResponse,
     ItemStatus,
+    OutputArtifactResultReadResponse,
     RunCreationRequest,
     RunCreationResponse,
 )
+from aignx.codegen.models import (
+    ApplicationVersionReadResponse as ApplicationVersion,
+)
 from aignx.codegen.models import (
     ItemResultReadResponse as ItemResultData,
 )
 from aignx.codegen.models import (
     RunReadResponse as ApplicationRunData,
 )
-from jsonschema.exceptions import ValidationError
-from jsonschema.validators import validate
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
+from pydantic import BaseModel
 
+from aignostics.platform._async_api import AsyncPublicApi
+from aignostics.platform._catalog_cache import CatalogCache
 from aignostics.platform._utils import (
     calculate_file_crc32c,
     download_file,
+    download_file_async,
     get_mime_type_for_artifact,
     mime_type_to_file_ending,
 )
-from aignostics.platform.resources.applications import Versions
-from aignostics.platform.resources.utils import paginate
+from aignostics.platform.resources.applications import AsyncVersions, Versions
+from aignostics.platform.resources.utils import (
+    async_paginate,
+    async_with_fast_deserialization,
+    paginate,
+    with_fast_deserialization,
+)
+from aignostics.utils import get_logger, get_user_data_directory
+
+if TYPE_CHECKING:
+    from jsonschema.protocols import Validator
+
+logger = get_logger(__name__)
+
+T = t.TypeVar("T")
 
 LIST_APPLICATION_RUNS_MAX_PAGE_SIZE = 100
 LIST_APPLICATION_RUNS_MIN_PAGE_SIZE = 5
+LIST_RUN_RESULTS_ITEM_ID_FILTER_SIZE = 50
+ITEM_RESULT_POLL_MIN_INTERVAL_SECONDS = 1.0
+ITEM_RESULT_POLL_MAX_INTERVAL_SECONDS = 30.0
+ITEM_RESULT_POLL_BACKOFF_FACTOR = 2.0
+ASYNC_DOWNLOAD_CONCURRENCY = 8
+RUN_SUBMISSION_JOURNAL_SCOPE = "run_submission_journals"
+TERMINAL_ITEM_STATUSES = frozenset({
+    ItemStatus.SUCCEEDED,
+    ItemStatus.ERROR_USER,
+    ItemStatus.ERROR_SYSTEM,
+    ItemStatus.CANCELED_USER,
+    ItemStatus.CANCELED_SYSTEM,
+})
+
+
+@dataclass(frozen=True, slots=True)
+class ItemResultSummary:
+    """Compact projection of an item result, without its output artifacts.
+
+    Deserialized directly from the JSON of the response, skipping the output artifacts with their
+    signed URLs and metadata, for callers such as status summaries only interested in the status.
+    """
+
+    item_id: str
+    reference: str
+    status: ItemStatus
 
 
 class ApplicationRun:
@@ -103,7 +156,7 @@ class ApplicationRun:
         Raises:
             Exception: If the API request fails.
         """
-        return {item.reference: item.status for item in self.results()}
+        return {item.reference: item.status for item in self.result_summaries()}
 
     # TODO(Andreas): Fails with Internal Server Error if run canceled; don't throw generic exceptions
     def cancel(self) -> None:
@@ -114,8 +167,18 @@ class ApplicationRun:
         """
         self._api.cancel_application_run_v1_runs_application_run_id_cancel_post(self.application_run_id)
 
-    def results(self) -> t.Iterator[ItemResultData]:
-        """Retrieves the results of all items in the run.
+    def results(
+        self,
+        status__in: list[ItemStatus] | None = None,
+        item_id__in: list[str] | None = None,
+        page_size: int | None = None,
+    ) -> t.Iterator[ItemResultData]:
+        """Retrieves the results of the items in the run.
+
+        Args:
+            status__in (list[ItemStatus] | None): Only retrieve results of items in the given statuses.
+            item_id__in (list[str] | None): Only retrieve results of the items with the given IDs.
+            page_size (int | None): Number of results per page, defaults to the maximum page size of the endpoint.
 
         Returns:
             list[ItemResultData]: A list of item results.
@@ -123,9 +186,58 @@ class ApplicationRun:
         Raises:
             Exception: If the API request fails.
         """
+        return self._paginate_results(ItemResultData, status__in, item_id__in, page_size)
+
+    def result_summaries(
+        self,
+        status__in: list[ItemStatus] | None = None,
+        item_id__in: list[str] | None = None,
+        page_size: int | None = None,
+    ) -> t.Iterator[ItemResultSummary]:
+        """Retrieves compact summaries of the results of the items in the run, without output artifacts.
+
+        Args:
+            status__in (list[ItemStatus] | None): Only retrieve results of items in the given statuses.
+            item_id__in (list[str] | None): Only retrieve results of the items with the given IDs.
+            page_size (int | None): Number of results per page, defaults to the maximum page size of the endpoint.
+
+        Returns:
+            Iterator[ItemResultSummary]: An iterator over the ID, reference and status of the items.
+
+        Raises:
+            Exception: If the API request fails.
+        """
+        return self._paginate_results(ItemResultSummary, status__in, item_id__in, page_size)
+
+    def _paginate_results(
+        self,
+        model: type[T],
+        status__in: list[ItemStatus] | None,
+        item_id__in: list[str] | None,
+        page_size: int | None,
+    ) -> t.Iterator[T]:
+        """Paginates the results of the items in the run, deserialized into the given model.
+
+        Args:
+            model (type[T]): The model to deserialize the item results into.
+            status__in (list[ItemStatus] | None): Only retrieve results of items in the given statuses.
+            item_id__in (list[str] | None): Only retrieve results of the items with the given IDs.
+            page_size (int | None): Number of results per page, defaults to the maximum page size of the endpoint.
+
+        Returns:
+            Iterator[T]: An iterator over the item results.
+        """
+        filters: dict[str, Any] = {}
+        if status__in is not None:
+            filters["status__in"] = status__in
+        if item_id__in is not None:
+            filters["item_id__in"] = item_id__in
+        if page_size is not None:
+            filters["page_size"] = page_size
         return paginate(
-            self._api.list_run_results_v1_runs_application_run_id_results_get,
+            with_fast_deserialization(self._api.list_run_results_v1_runs_application_run_id_results_get, model),
             application_run_id=self.application_run_id,
+            **filters,
         )
 
     def download_to_folder(
@@ -150,23 +262,25 @@ class ApplicationRun:
             raise ValueError(msg)
         application_run_dir = Path(download_base) / self.application_run_id
 
-        # incrementally check for available results
+        # incrementally check for available results, only polling items not yet finished
+        tracker = ItemResultTracker(self)
         application_run_status = self.details().status
         while application_run_status == ApplicationRunStatus.RUNNING:
-            for item in self.results():
+            poll = tracker.poll()
+            for item in poll.finished:
                 if item.status == ItemStatus.SUCCEEDED:
                     self.ensure_artifacts_downloaded(application_run_dir, item, checksum_attribute_key)
-            sleep(5)
+            sleep(poll.next_poll_in_seconds)
             application_run_status = self.details().status
             print(self)
 
         # check if last results have been downloaded yet and report on errors
-        for item in self.results():
-            match item.status:
-                case ItemStatus.SUCCEEDED:
-                    self.ensure_artifacts_downloaded(application_run_dir, item, checksum_attribute_key)
-                case ItemStatus.ERROR_SYSTEM | ItemStatus.ERROR_USER:
-                    print(f"{item.reference} failed with {item.status.value}: {item.error}")
+        for item in tracker.poll().finished:
+            if item.status == ItemStatus.SUCCEEDED:
+                self.ensure_artifacts_downloaded(application_run_dir, item, checksum_attribute_key)
+        for item in tracker.items.values():
+            if item.status in {ItemStatus.ERROR_SYSTEM, ItemStatus.ERROR_USER}:
+                print(f"{item.reference} failed with {item.status.value}: {item.error}")
 
     @staticmethod
     def ensure_artifacts_downloaded(
@@ -237,19 +351,139 @@ class ApplicationRun:
         return f"Application run `{self.application_run_id}`: {app_status}, {items}"
 
 
+class ItemResultPoll(BaseModel):
+    """Outcome of one poll cycle of an ItemResultTracker."""
+
+    finished: list[ItemResultData]
+    pending_count: int
+    request_count: int
+    next_poll_in_seconds: float
+
+
+class ItemResultTracker:
+    """Incrementally tracks the item results of an application run.
+
+    The first poll lists the results of all items. Subsequent polls only list items not yet
+    in a terminal status and fetch the results of items that finished since the previous poll
+    by their IDs, so items already finished are neither re-fetched nor re-validated.
+
+    The suggested interval until the next poll adapts: it is reset to the minimum whenever
+    items finished, and grows by the backoff factor up to the maximum while the run is idle.
+    """
+
+    def __init__(
+        self,
+        application_run: ApplicationRun,
+        min_interval_seconds: float = ITEM_RESULT_POLL_MIN_INTERVAL_SECONDS,
+        max_interval_seconds: float = ITEM_RESULT_POLL_MAX_INTERVAL_SECONDS,
+        backoff_factor: float = ITEM_RESULT_POLL_BACKOFF_FACTOR,
+    ) -> None:
+        """Initializes the tracker.
+
+        Args:
+            application_run (ApplicationRun): The application run to track.
+            min_interval_seconds (float): Interval suggested after a poll in which items finished.
+            max_interval_seconds (float): Upper bound of the interval suggested while idle.
+            backoff_factor (float): Factor the interval grows by after each poll in which no item finished.
+        """
+        self._application_run = application_run
+        self._min_interval_seconds = min_interval_seconds
+        self._max_interval_seconds = max_interval_seconds
+        self._backoff_factor = backoff_factor
+        self._interval_seconds = min_interval_seconds
+        self._initialized = False
+        self.items: dict[str, ItemResultData] = {}
+        self.request_count = 0
+
+    @property
+    def pending_item_ids(self) -> list[str]:
+        """IDs of the items not yet in a terminal status.
+
+        Returns:
+            list[str]: The item IDs.
+        """
+        return [item_id for item_id, item in self.items.items() if item.status not in TERMINAL_ITEM_STATUSES]
+
+    def poll(self) -> ItemResultPoll:
+        """Fetches the results of items that finished since the previous poll.
+
+        Returns:
+            ItemResultPoll: The newly finished items, the number of pending items, the number of
+                API requests this poll cost and the suggested interval until the next poll.
+
+        Raises:
+            Exception: If the API request fails.
+        """
+        request_count = 0
+        if not self._initialized:
+            results, request_count = self._list(page_size=LIST_APPLICATION_RUNS_MAX_PAGE_SIZE)
+            finished = [item for item in results if item.status in TERMINAL_ITEM_STATUSES]
+            self._initialized = True
+        else:
+            previously_pending = self.pending_item_ids
+            finished = []
+            if previously_pending:
+                still_pending, request_count = self._list(
+                    status__in=[status for status in ItemStatus if status not in TERMINAL_ITEM_STATUSES],
+                    page_size=LIST_APPLICATION_RUNS_MAX_PAGE_SIZE,
+                )
+                still_pending_ids = {str(item.item_id) for item in still_pending}
+                results = still_pending
+                finished_ids = [item_id for item_id in previously_pending if item_id not in still_pending_ids]
+                for start in range(0, len(finished_ids), LIST_RUN_RESULTS_ITEM_ID_FILTER_SIZE):
+                    batch, batch_request_count = self._list(
+                        item_id__in=finished_ids[start : start + LIST_RUN_RESULTS_ITEM_ID_FILTER_SIZE],
+                        page_size=LIST_APPLICATION_RUNS_MAX_PAGE_SIZE,
+                    )
+                    request_count += batch_request_count
+                    results += batch
+                    finished += [item for item in batch if item.status in TERMINAL_ITEM_STATUSES]
+            else:
+                results = []
+
+        self.items.update({str(item.item_id): item for item in results})
+        self.request_count += request_count
+        if finished:
+            self._interval_seconds = self._min_interval_seconds
+        else:
+            self._interval_seconds = min(self._interval_seconds * self._backoff_factor, self._max_interval_seconds)
+        return ItemResultPoll(
+            finished=finished,
+            pending_count=len(self.pending_item_ids),
+            request_count=request_count,
+            next_poll_in_seconds=self._interval_seconds,
+        )
+
+    def _list(self, page_size: int, **filters: Any) -> tuple[list[ItemResultData], int]:  # noqa: ANN401
+        """Lists item results and counts the requests needed.
+
+        Args:
+            page_size (int): Number of results per page.
+            **filters: Filters passed to ApplicationRun.results.
+
+        Returns:
+            tuple[list[ItemResultData], int]: The item results and the number of requests made.
+        """
+        results = list(self._application_run.results(page_size=page_size, **filters))
+        # paginate requests pages until one is not full
+        return results, len(results) // page_size + 1
+
+
 class Runs:
     """Resource class for managing application runs.
 
     Provides operations to create, find, and retrieve runs.
     """
 
-    def __init__(self, api: PublicApi) -> None:
+    def __init__(self, api: PublicApi, cache: CatalogCache | None = None) -> None:
         """Initializes the Runs resource with the API client.
 
         Args:
             api (PublicApi): The configured API client.
+            cache (CatalogCache | None): Cache of catalog lookups, or None to always query the API.
         """
         self._api = api
+        self._cache = cache
 
     def __call__(self, application_run_id: str) -> ApplicationRun:
         """Retrieves an ApplicationRun instance for an existing run.
@@ -284,6 +518,66 @@ class Runs:
         res: RunCreationResponse = self._api.create_application_run_v1_runs_post(payload)
         return ApplicationRun(self._api, str(res.application_run_id))
 
+    def create_batched(
+        self,
+        application_version: str,
+        items: list[ItemCreationRequest],
+        batch_size: int | None = None,
+        journal_path: Path | None = None,
+    ) -> list[ApplicationRun]:
+        """Creates application runs for a large cohort of items, submitted in batches.
+
+        All items are validated before the first run is created, with validators compiled once per input artifact.
+        The cohort is then submitted as one run per batch. Created runs are recorded in a journal after
+        each batch, so repeating an interrupted submission of the same cohort with the same batch size
+        only submits the remaining batches. The journal is removed once all batches are submitted.
+
+        Args:
+            application_version (str): The ID of the application version.
+            items (list[ItemCreationRequest]): The items of the cohort.
+            batch_size (int | None): Maximum number of items per run, or None to create a single run.
+            journal_path (Path | None): Path of the submission journal,
+                defaults to a path in the user data directory identifying the submission.
+
+        Returns:
+            list[ApplicationRun]: The runs created, one per batch, including runs of an interrupted submission.
+
+        Raises:
+            ValueError: If there are no items, the batch size is not positive, or the items are invalid.
+            Exception: If the API request fails.
+        """
+        if not items:
+            msg = "No items to submit."
+            raise ValueError(msg)
+        if batch_size is None:
+            batch_size = len(items)
+        if batch_size < 1:
+            msg = f"batch_size must be positive, but got {batch_size}"
+            raise ValueError(msg)
+        app_version = Versions(self._api, self._cache).details(application_version=application_version)
+        InputItemValidator.for_application_version(app_version).validate(items)
+
+        digest = RunSubmissionJournal.digest_for(application_version, batch_size, items)
+        if journal_path is None:
+            journal_path = RunSubmissionJournal.path_for(digest)
+        journal = RunSubmissionJournal.load(journal_path, digest)
+        if journal is None:
+            journal = RunSubmissionJournal(
+                application_version_id=application_version, batch_size=batch_size, digest=digest
+            )
+        elif journal.application_run_ids:
+            logger.info(
+                "Resuming submission of %d items after %d submitted runs.", len(items), len(journal.application_run_ids)
+            )
+        for start in range(len(journal.application_run_ids) * batch_size, len(items), batch_size):
+            res = self._api.create_application_run_v1_runs_post(
+                RunCreationRequest(application_version_id=application_version, items=items[start : start + batch_size])
+            )
+            journal.application_run_ids.append(str(res.application_run_id))
+            journal.save(journal_path)
+        journal_path.unlink(missing_ok=True)
+        return [ApplicationRun(self._api, application_run_id) for application_run_id in journal.application_run_ids]
+
     def list(self, for_application_version: str | None = None) -> Generator[ApplicationRun, Any, None]:
         """Find application runs, optionally filtered by application version.
 
@@ -297,9 +591,12 @@ class Runs:
             Exception: If the API request fails.
         """
         if not for_application_version:
-            res = paginate(self._api.list_application_runs_v1_runs_get)
+            res = paginate(with_fast_deserialization(self._api.list_application_runs_v1_runs_get, ApplicationRunData))
         else:
-            res = paginate(self._api.list_application_runs_v1_runs_get, application_version_id=for_application_version)
+            res = paginate(
+                with_fast_deserialization(self._api.list_application_runs_v1_runs_get, ApplicationRunData),
+                application_version_id=for_application_version,
+            )
         return (ApplicationRun(self._api, response.application_run_id) for response in res)
 
     # TODO(Andreas): Think about merging by having list(...) above return active records that as well hold data
@@ -330,13 +627,13 @@ class Runs:
             raise ValueError(message)
         if not for_application_version:
             res = paginate(
-                self._api.list_application_runs_v1_runs_get,
+                with_fast_deserialization(self._api.list_application_runs_v1_runs_get, ApplicationRunData),
                 page_size=page_size,
                 sort=[sort] if sort else None,
             )
         else:
             res = paginate(
-                self._api.list_application_runs_v1_runs_get,
+                with_fast_deserialization(self._api.list_application_runs_v1_runs_get, ApplicationRunData),
                 page_size=page_size,
                 application_version_id=for_application_version,
                 sort=[sort] if sort else None,
@@ -356,33 +653,491 @@ class Runs:
             ValueError: If validation fails.
             Exception: If the API request fails.
         """
-        # validate metadata based on schema of application version
-        app_version = Versions(self._api).details(application_version=payload.application_version_id)
-        schema_idx = {
-            input_artifact.name: input_artifact.metadata_schema for input_artifact in app_version.input_artifacts
+        app_version = Versions(self._api, self._cache).details(application_version=payload.application_version_id)
+        validate_input_items(payload, app_version)
+
+
+class AsyncApplicationRun:
+    """Asynchronous counterpart of ApplicationRun.
+
+    Provides operations to check status, retrieve results, and download artifacts as coroutines,
+    so many runs can be monitored concurrently by a single event loop.
+    """
+
+    def __init__(self, api: AsyncPublicApi, application_run_id: str) -> None:
+        """Initializes an AsyncApplicationRun instance.
+
+        Args:
+            api (AsyncPublicApi): The configured async API.
+            application_run_id (str): The ID of the application run.
+        """
+        self._api = api
+        self.application_run_id = application_run_id
+
+    async def details(self) -> ApplicationRunData:
+        """Retrieves the current status of the application run.
+
+        Returns:
+            ApplicationRunData: The run data.
+
+        Raises:
+            Exception: If the API request fails.
+        """
+        return await self._api.get_run_v1_runs_application_run_id_get(self.application_run_id, include=None)
+
+    async def item_status(self) -> dict[str, ItemStatus]:
+        """Retrieves the status of all items in the run.
+
+        Returns:
+            dict[str, ItemStatus]: A dictionary mapping item references to their status.
+
+        Raises:
+            Exception: If the API request fails.
+        """
+        return {
+            item.reference: item.status
+            async for item in async_paginate(
+                async_with_fast_deserialization(
+                    self._api.list_run_results_v1_runs_application_run_id_results_get, ItemResultSummary
+                ),
+                application_run_id=self.application_run_id,
+            )
         }
-        references = set()
-        for item in payload.items:
-            # verify references are unique
+
+    async def cancel(self) -> None:
+        """Cancels the application run.
+
+        Raises:
+            Exception: If the API request fails.
+        """
+        await self._api.cancel_application_run_v1_runs_application_run_id_cancel_post(self.application_run_id)
+
+    def results(
+        self,
+        status__in: list[ItemStatus] | None = None,
+        item_id__in: list[str] | None = None,
+        page_size: int | None = None,
+        total_count: int | None = None,
+    ) -> t.AsyncIterator[ItemResultData]:
+        """Retrieves the results of the items in the run.
+
+        Args:
+            status__in (list[ItemStatus] | None): Only retrieve results of items in the given statuses.
+            item_id__in (list[str] | None): Only retrieve results of the items with the given IDs.
+            page_size (int | None): Number of results per page, defaults to the maximum page size of the endpoint.
+            total_count (int | None): The number of results if known, to fetch pages concurrently.
+
+        Returns:
+            AsyncIterator[ItemResultData]: An async iterator over the item results.
+
+        Raises:
+            Exception: If the API request fails.
+        """
+        return async_paginate(
+            self._api.list_run_results_v1_runs_application_run_id_results_get,
+            application_run_id=self.application_run_id,
+            status__in=status__in,
+            item_id__in=item_id__in,
+            page_size=page_size,
+            total_count=total_count,
+        )
+
+    async def download_to_folder(
+        self,
+        download_base: Path | str,
+        checksum_attribute_key: str = "checksum_base64_crc32c",
+        max_concurrent_downloads: int = ASYNC_DOWNLOAD_CONCURRENCY,
+    ) -> None:
+        """Downloads all result artifacts to a folder.
+
+        Monitors run progress and downloads results as they become available, like
+        ApplicationRun.download_to_folder, downloading artifacts concurrently.
+
+        Args:
+            download_base (Path | str): Base directory to download results to.
+            checksum_attribute_key (str): The key used to validate the checksum of the output artifacts.
+            max_concurrent_downloads (int): Maximum number of artifacts downloaded concurrently.
+
+        Raises:
+            ValueError: If the provided path is not a directory.
+            Exception: If downloads or API requests fail.
+        """
+        download_base = Path(download_base)
+        if not download_base.is_dir():
+            msg = f"{download_base} is not a directory"
+            raise ValueError(msg)
+        application_run_dir = download_base / self.application_run_id
+        semaphore = asyncio.Semaphore(max_concurrent_downloads)
+        items: dict[str, ItemResultData] = {}
+
+        async def collect(results: t.AsyncIterator[ItemResultData]) -> list[ItemResultData]:
+            return [item async for item in results]
+
+        async def poll() -> list[ItemResultData]:
+            # Like ItemResultTracker, only items not yet finished are polled after the first poll
+            if not items:
+                results = await collect(self.results())
+                finished_ids = {str(item.item_id) for item in results}
+            else:
+                pending_ids = [item_id for item_id, item in items.items() if item.status not in TERMINAL_ITEM_STATUSES]
+                results = await collect(
+                    self.results(status__in=[status for status in ItemStatus if status not in TERMINAL_ITEM_STATUSES])
+                )
+                finished_ids = set(pending_ids) - {str(item.item_id) for item in results}
+                sorted_ids = sorted(finished_ids)
+                batches = await asyncio.gather(
+                    *(
+                        collect(
+                            self.results(item_id__in=sorted_ids[start : start + LIST_RUN_RESULTS_ITEM_ID_FILTER_SIZE])
+                        )
+                        for start in range(0, len(sorted_ids), LIST_RUN_RESULTS_ITEM_ID_FILTER_SIZE)
+                    )
+                )
+                for batch in batches:
+                    results += batch
+            items.update({str(item.item_id): item for item in results})
+            return [
+                item for item in results if str(item.item_id) in finished_ids and item.status in TERMINAL_ITEM_STATUSES
+            ]
+
+        async def download(finished: list[ItemResultData]) -> None:
+            await asyncio.gather(
+                *(
+                    self.ensure_artifacts_downloaded(application_run_dir, item, checksum_attribute_key, semaphore)
+                    for item in finished
+                    if item.status == ItemStatus.SUCCEEDED
+                )
+            )
+
+        interval_seconds = ITEM_RESULT_POLL_MIN_INTERVAL_SECONDS
+        while (await self.details()).status == ApplicationRunStatus.RUNNING:
+            finished = await poll()
+            await download(finished)
+            interval_seconds = (
+                ITEM_RESULT_POLL_MIN_INTERVAL_SECONDS
+                if finished
+                else min(interval_seconds * ITEM_RESULT_POLL_BACKOFF_FACTOR, ITEM_RESULT_POLL_MAX_INTERVAL_SECONDS)
+            )
+            await asyncio.sleep(interval_seconds)
+
+        # check if last results have been downloaded yet and report on errors
+        await download(await poll())
+        for item in items.values():
+            if item.status in {ItemStatus.ERROR_SYSTEM, ItemStatus.ERROR_USER}:
+                print(f"{item.reference} failed with {item.status.value}: {item.error}")
+
+    async def ensure_artifacts_downloaded(
+        self,
+        base_folder: Path,
+        item: ItemResultReadResponse,
+        checksum_attribute_key: str = "checksum_base64_crc32c",
+        semaphore: asyncio.Semaphore | None = None,
+    ) -> None:
+        """Ensures all artifacts for an item are downloaded, downloading them concurrently.
+
+        Args:
+            base_folder (Path): Base directory to download artifacts to.
+            item (ItemResultReadResponse): The item result containing the artifacts to download.
+            checksum_attribute_key (str): The key used to validate the checksum of the output artifacts.
+            semaphore (asyncio.Semaphore | None): Limits the number of concurrent downloads if given.
+
+        Raises:
+            ValueError: If checksums don't match.
+            Exception: If downloads fail.
+        """
+        item_dir = base_folder / item.reference
+
+        async def ensure_downloaded(artifact: OutputArtifactResultReadResponse) -> bool:
+            file_path = item_dir / f"{artifact.name}{mime_type_to_file_ending(get_mime_type_for_artifact(artifact))}"
+            checksum = artifact.metadata[checksum_attribute_key]
+            if file_path.exists() and await asyncio.to_thread(calculate_file_crc32c, file_path) == checksum:
+                return False
+            async with semaphore or contextlib.nullcontext():
+                await download_file_async(self._api.http_client, str(artifact.download_url), file_path, checksum)
+            return True
+
+        artifacts = [artifact for artifact in item.output_artifacts if artifact.download_url]
+        if artifacts:
+            item_dir.mkdir(exist_ok=True, parents=True)
+        downloaded = await asyncio.gather(*(ensure_downloaded(artifact) for artifact in artifacts))
+        if any(downloaded):
+            print(f"Downloaded results for item: {item.reference} to {item_dir}")
+        else:
+            print(f"Results for item: {item.reference} already present in {item_dir}")
+
+
+class AsyncRuns:
+    """Asynchronous resource class for managing application runs.
+
+    Provides the operations of Runs as coroutines.
+    """
+
+    def __init__(self, api: AsyncPublicApi, cache: CatalogCache | None = None) -> None:
+        """Initializes the AsyncRuns resource with the async API.
+
+        Args:
+            api (AsyncPublicApi): The configured async API.
+            cache (CatalogCache | None): Cache of catalog lookups, or None to always query the API.
+        """
+        self._api = api
+        self._cache = cache
+
+    def __call__(self, application_run_id: str) -> AsyncApplicationRun:
+        """Retrieves an AsyncApplicationRun instance for an existing run.
+
+        Args:
+            application_run_id (str): The ID of the application run.
+
+        Returns:
+            AsyncApplicationRun: The initialized AsyncApplicationRun instance.
+        """
+        return AsyncApplicationRun(self._api, application_run_id)
+
+    async def create(self, application_version: str, items: list[ItemCreationRequest]) -> AsyncApplicationRun:
+        """Creates a new application run.
+
+        Args:
+            application_version (str): The ID of the application version.
+            items (list[ItemCreationRequest]): The run creation request payload.
+
+        Returns:
+            AsyncApplicationRun: The created application run.
+
+        Raises:
+            ValueError: If the payload is invalid.
+            Exception: If the API request fails.
+        """
+        payload = RunCreationRequest(
+            application_version_id=application_version,
+            items=items,
+        )
+        app_version = await AsyncVersions(self._api, self._cache).details(
+            application_version=payload.application_version_id
+        )
+        validate_input_items(payload, app_version)
+        res = await self._api.create_application_run_v1_runs_post(payload)
+        return AsyncApplicationRun(self._api, str(res.application_run_id))
+
+    async def list(self, for_application_version: str | None = None) -> t.AsyncIterator[AsyncApplicationRun]:
+        """Find application runs, optionally filtered by application version.
+
+        Args:
+            for_application_version (str | None): Optional application version ID to filter by.
+
+        Yields:
+            AsyncApplicationRun: The application runs.
+
+        Raises:
+            Exception: If the API request fails.
+        """
+        async for response in self.list_data(for_application_version=for_application_version):
+            yield AsyncApplicationRun(self._api, response.application_run_id)
+
+    def list_data(
+        self,
+        for_application_version: str | None = None,
+        sort: str | None = None,
+        page_size: int = LIST_APPLICATION_RUNS_MAX_PAGE_SIZE,
+    ) -> t.AsyncIterator[ApplicationRunData]:
+        """Fetch application runs, optionally filtered by application version.
+
+        Args:
+            for_application_version (str | None): Optional application version ID to filter by.
+            sort (str | None): Optional field to sort by. Prefix with '-' for descending order.
+            page_size (int): Number of items per page, defaults to max
+
+        Returns:
+            AsyncIterator[ApplicationRunData]: Async iterator yielding application run data.
+
+        Raises:
+            ValueError: If page_size is greater than 100.
+            Exception: If the API request fails.
+        """
+        if page_size > LIST_APPLICATION_RUNS_MAX_PAGE_SIZE:
+            message = (
+                f"page_size is must be less than or equal to {LIST_APPLICATION_RUNS_MAX_PAGE_SIZE}, but got {page_size}"
+            )
+            raise ValueError(message)
+        return async_paginate(
+            self._api.list_application_runs_v1_runs_get,
+            page_size=page_size,
+            application_version=for_application_version,
+            sort=[sort] if sort else None,
+        )
+
+
+def validate_input_items(payload: RunCreationRequest, app_version: ApplicationVersion) -> None:
+    """Validates the input items in a run creation request against the application version.
+
+    Checks that references are unique, all required artifacts are provided,
+    and artifact metadata matches the expected schema.
+
+    Args:
+        payload (RunCreationRequest): The run creation request payload.
+        app_version (ApplicationVersion): The application version the run is created for.
+
+    Raises:
+        ValueError: If validation fails.
+    """
+    InputItemValidator.for_application_version(app_version).validate(payload.items)
+
+
+class InputItemValidator:
+    """Validates input items against the input artifacts of an application version.
+
+    The metadata schema of each input artifact is checked and compiled into a validator once, instead of
+    on every validated artifact as jsonschema.validate does.
+    """
+
+    def __init__(self, schemas: dict[str, dict[str, Any]]) -> None:
+        """Initializes the validator, compiling the metadata schemas.
+
+        Args:
+            schemas (dict[str, dict[str, Any]]): The metadata schemas by name of the input artifact.
+
+        Raises:
+            SchemaError: If a metadata schema is invalid.
+        """
+        self._schemas = schemas
+        self._validators: dict[str, Validator] = {}
+        for name, schema in schemas.items():
+            validator_class = validator_for(schema)
+            validator_class.check_schema(schema)
+            self._validators[name] = validator_class(schema)
+
+    @classmethod
+    def for_application_version(cls, app_version: ApplicationVersion) -> "InputItemValidator":
+        """Get the validator of an application version, compiled once per process and schemas.
+
+        Args:
+            app_version (ApplicationVersion): The application version.
+
+        Returns:
+            InputItemValidator: The validator.
+        """
+        schemas = {artifact.name: artifact.metadata_schema for artifact in app_version.input_artifacts}
+        key = json.dumps([app_version.application_version_id, schemas], sort_keys=True, default=str)
+        with _input_item_validators_lock:
+            validator = _input_item_validators.get(key)
+            if validator is None:
+                validator = _input_item_validators[key] = cls(schemas)
+        return validator
+
+    def validate_item(self, item: ItemCreationRequest) -> None:
+        """Validates the input artifacts of an item.
+
+        Args:
+            item (ItemCreationRequest): The item.
+
+        Raises:
+            ValueError: If an artifact is unknown or missing, or its metadata does not match the schema.
+        """
+        missing = set(self._schemas)
+        for artifact in item.input_artifacts:
+            validator = self._validators.get(artifact.name)
+            if validator is None:
+                msg = f"Invalid artifact `{artifact.name}`, application version requires: {self._schemas.keys()}"
+                raise ValueError(msg)
+            error = best_match(validator.iter_errors(artifact.metadata))
+            if error is not None:
+                msg = f"Invalid metadata for artifact `{artifact.name}`: {error.message}"
+                raise ValueError(msg)
+            missing.discard(artifact.name)
+        if missing:
+            msg = f"Missing artifact(s): {missing}"
+            raise ValueError(msg)
+
+    def validate(self, items: t.Sequence[ItemCreationRequest]) -> None:
+        """Validates items, checking that references are unique.
+
+        Args:
+            items (Sequence[ItemCreationRequest]): The items.
+
+        Raises:
+            ValueError: If a reference is duplicated or an item is invalid.
+        """
+        references: set[str] = set()
+        for item in items:
             if item.reference in references:
                 msg = f"Duplicate reference `{item.reference}` in items."
                 raise ValueError(msg)
             references.add(item.reference)
+        for item in items:
+            self.validate_item(item)
 
-            schema_check = set(schema_idx.keys())
-            for artifact in item.input_artifacts:
-                # check if artifact is in schema
-                if artifact.name not in schema_idx:
-                    msg = f"Invalid artifact `{artifact.name}`, application version requires: {schema_idx.keys()}"
-                    raise ValueError(msg)
-                try:
-                    # validate metadata
-                    validate(artifact.metadata, schema=schema_idx[artifact.name])
-                    schema_check.remove(artifact.name)
-                except ValidationError as e:
-                    msg = f"Invalid metadata for artifact `{artifact.name}`: {e.message}"
-                    raise ValueError(msg) from e
-            # all artifacts set?
-            if len(schema_check) > 0:
-                msg = f"Missing artifact(s): {schema_check}"
-                raise ValueError(msg)
+
+_input_item_validators: dict[str, InputItemValidator] = {}
+_input_item_validators_lock = threading.Lock()
+
+
+class RunSubmissionJournal(BaseModel):
+    """Journal of a batched run submission, persisted in the user data directory.
+
+    Records the runs created per batch, so an interrupted submission of the same cohort, split into
+    batches of the same size, continues with the first batch not yet submitted.
+    """
+
+    application_version_id: str
+    batch_size: int
+    digest: str
+    application_run_ids: list[str] = []
+
+    @staticmethod
+    def digest_for(application_version_id: str, batch_size: int, items: t.Sequence[ItemCreationRequest]) -> str:
+        """Compute the digest identifying a batched submission.
+
+        Args:
+            application_version_id (str): The ID of the application version.
+            batch_size (int): Maximum number of items per run.
+            items (Sequence[ItemCreationRequest]): The items of the cohort.
+
+        Returns:
+            str: The hex digest.
+        """
+        digest = hashlib.sha256(f"{application_version_id}\n{batch_size}".encode())
+        for item in items:
+            digest.update(b"\n")
+            digest.update(item.to_json().encode())
+        return digest.hexdigest()
+
+    @staticmethod
+    def path_for(digest: str) -> Path:
+        """Get the path of the journal of a batched submission.
+
+        Args:
+            digest (str): The digest identifying the submission.
+
+        Returns:
+            Path: Path of the journal.
+        """
+        return get_user_data_directory(RUN_SUBMISSION_JOURNAL_SCOPE) / f"{digest}.json"
+
+    @classmethod
+    def load(cls, journal_path: Path, digest: str) -> "RunSubmissionJournal | None":
+        """Load the journal of a submission if it can be resumed.
+
+        Args:
+            journal_path (Path): Path of the journal.
+            digest (str): The digest identifying the submission.
+
+        Returns:
+            RunSubmissionJournal | None: The journal, or None if there is no submission to resume.
+        """
+        try:
+            journal = cls.model_validate_json(journal_path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        if journal.digest != digest:
+            return None
+        return journal
+
+    def save(self, journal_path: Path) -> None:
+        """Persist the journal atomically.
+
+        Args:
+            journal_path (Path): Path of the journal.
+        """
+        journal_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = journal_path.with_suffix(".tmp")
+        temporary_path.write_text(self.model_dump_json(), encoding="utf-8")
+        temporary_path.replace(journal_path)
@@ -6,17 +6,163 @@ pagination utilities to handle API responses that span multiple pages. These uti
 functions are designed to be used internally by the SDK's resource classes.
 """
 
-from collections.abc import Callable, Iterator
+import asyncio
+import functools
+import inspect
+import typing as t
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import TypeVar
 
-from aignx.codegen.exceptions import NotFoundException
+from aignx.codegen.exceptions import ApiException, NotFoundException
+from aignx.codegen.rest import RESTResponse
+from pydantic import TypeAdapter
 
 T = TypeVar("T")
 
 PAGE_SIZE = 20
+PAGINATE_CONCURRENCY = 4
 
 
-def paginate(func: Callable[..., list[T]], *args: object, page_size: int = PAGE_SIZE, **kwargs: object) -> Iterator[T]:
+def get_max_page_size(func: Callable[..., object], default: int = PAGE_SIZE) -> int:
+    """Determine the maximum page size an endpoint accepts.
+
+    The maximum is read from the upper bound the generated client declares for the page_size
+    parameter of the endpoint, e.g. Optional[Annotated[int, Field(le=100, ge=5)]].
+
+    Args:
+        func (Callable[..., object]): The endpoint, accepting a page_size parameter.
+        default (int): The page size to use if the endpoint declares no upper bound.
+
+    Returns:
+        int: The maximum page size of the endpoint, or the default.
+    """
+    try:
+        parameter = inspect.signature(func).parameters.get("page_size")
+    except (TypeError, ValueError):
+        return default
+    if parameter is None:
+        return default
+    # Walk the annotation, its type arguments and the constraints of its pydantic fields
+    nodes: list[object] = [parameter.annotation]
+    while nodes:
+        node = nodes.pop()
+        le = getattr(node, "le", None)
+        if isinstance(le, int) and not isinstance(le, bool):
+            return le
+        metadata = getattr(node, "metadata", None)
+        if isinstance(metadata, list):
+            nodes.extend(metadata)
+        nodes.extend(t.get_args(node))
+    return default
+
+
+_list_adapters: dict[type, TypeAdapter[t.Any]] = {}
+
+
+def _list_adapter(model: type[T]) -> TypeAdapter[list[T]]:
+    """Get the adapter validating lists of the given model, built once per model.
+
+    Args:
+        model (type[T]): The model of the elements.
+
+    Returns:
+        TypeAdapter[list[T]]: The adapter.
+    """
+    adapter = _list_adapters.get(model)
+    if adapter is None:
+        adapter = _list_adapters.setdefault(model, TypeAdapter(list[model]))  # type: ignore[valid-type]
+    return adapter
+
+
+def deserialize_list(data: bytes | str, model: type[T]) -> list[T]:
+    """Deserialize a JSON array of models in a single pass.
+
+    The JSON is parsed and validated by pydantic-core directly, instead of decoding it into Python objects
+    first and building each model and nested model via from_dict, as the generated client does.
+
+    Args:
+        data (bytes | str): The JSON array.
+        model (type[T]): The model of the elements.
+
+    Returns:
+        list[T]: The models.
+    """
+    return _list_adapter(model).validate_json(data)
+
+
+def with_fast_deserialization(func: Callable[..., list[t.Any]], model: type[T]) -> Callable[..., list[T]]:
+    """Wrap a list endpoint of the generated client to deserialize responses via deserialize_list.
+
+    The endpoint is called via its variant returning the raw response, which is then deserialized in a
+    single pass. Errors are raised as the exceptions of the generated client. The wrapper keeps the
+    signature of the endpoint, so paginate determines the maximum page size as before.
+
+    The model may differ from the one declared by the endpoint, e.g. to project the response onto
+    fewer fields, as fields not declared by the model are skipped.
+
+    Args:
+        func (Callable[..., list[Any]]): The list endpoint, as bound method of the generated client.
+        model (type[T]): The model of the elements of the response.
+
+    Returns:
+        Callable[..., list[T]]: The wrapped endpoint, or the endpoint itself if it has no raw variant.
+    """
+    raw_func = (
+        getattr(func.__self__, f"{func.__name__}_without_preload_content", None) if inspect.ismethod(func) else None
+    )
+    if raw_func is None:
+        return func
+
+    @functools.wraps(func)
+    def fetch(*args: object, **kwargs: object) -> list[T]:
+        response = RESTResponse(raw_func(*args, **kwargs))
+        data = response.read()
+        if not 200 <= response.status <= 299:  # noqa: PLR2004
+            raise ApiException.from_response(http_resp=response, body=data.decode("utf-8", errors="replace"), data=None)
+        return deserialize_list(data, model)
+
+    return fetch
+
+
+def async_with_fast_deserialization(
+    func: Callable[..., Awaitable[list[t.Any]]], model: type[T]
+) -> Callable[..., Awaitable[list[T]]]:
+    """Wrap a list endpoint of AsyncPublicApi to deserialize responses into the given model.
+
+    Behaves like with_fast_deserialization, calling the variant of the endpoint returning the raw response.
+
+    Args:
+        func (Callable[..., Awaitable[list[Any]]]): The list endpoint, as bound method of AsyncPublicApi.
+        model (type[T]): The model of the elements of the response.
+
+    Returns:
+        Callable[..., Awaitable[list[T]]]: The wrapped endpoint, or the endpoint itself if it has no raw variant.
+    """
+    raw_func = (
+        getattr(func.__self__, f"{func.__name__}_without_preload_content", None) if inspect.ismethod(func) else None
+    )
+    if raw_func is None:
+        return func
+
+    @functools.wraps(func)
+    async def fetch(*args: object, **kwargs: object) -> list[T]:
+        response = await raw_func(*args, **kwargs)
+        return deserialize_list(response.content, model)
+
+    return fetch
+
+
+def paginate(
+    func: Callable[..., list[T]],
+    *args: object,
+    page_size: int | None = None,
+    prefetch: bool = True,
+    total_count: int | None = None,
+    concurrency: int = PAGINATE_CONCURRENCY,
+    **kwargs: object,
+) -> Iterator[T]:
     """
     A generator function that handles pagination for API calls.
 
@@ -24,10 +170,18 @@ def paginate(func: Callable[..., list[T]], *args: object, page_size: int = PAGE_
     by repeatedly calling the function with increasing page numbers until either
     a page returns fewer items than the requested page size or a NotFoundException is raised.
 
+    Pages are fetched on a background thread: while the items of a page are consumed, the next page
+    is already being fetched. If the total number of items is known, the pages covering it are fetched
+    concurrently, and items are still yielded in order.
+
     Args:
         func (Callable[..., list[T]]): The function to paginate, which should accept page and page_size parameters.
         *args: Positional arguments to pass to the function.
-        page_size (int): The number of items to request per page
+        page_size (int | None): The number of items to request per page,
+            defaults to the maximum page size the endpoint accepts.
+        prefetch (bool): Fetch the next page while the items of the current page are consumed.
+        total_count (int | None): The total number of items if known, used to fetch pages concurrently.
+        concurrency (int): The maximum number of pages fetched concurrently if total_count is given.
         **kwargs: Keyword arguments to pass to the function.
 
     Yields:
@@ -40,15 +194,110 @@ def paginate(func: Callable[..., list[T]], *args: object, page_size: int = PAGE_
         >>> items = list(paginate(list_items))
         >>> print(len(items))
     """
-    page = 1
-    while True:
+    if page_size is None:
+        page_size = get_max_page_size(func)
+    known_page_count = -(-total_count // page_size) if total_count else 0
+    concurrency = max(1, concurrency) if known_page_count else 1
+
+    def fetch(page: int) -> list[T]:
         try:
-            results = func(*args, page=page, page_size=page_size, **kwargs)
-            if not results:
-                break
+            return func(*args, page=page, page_size=page_size, **kwargs)
+        except NotFoundException:
+            return []  # We've paginated beyond the last page
+
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="paginate")
+    pending: deque[Future[list[T]]] = deque()
+    next_page = 1
+
+    def submit(ahead: bool) -> None:
+        nonlocal next_page
+        # Pages covering the known total are fetched concurrently, further pages one at a time
+        while next_page <= known_page_count and len(pending) < concurrency:
+            pending.append(executor.submit(fetch, next_page))
+            next_page += 1
+        if ahead and not pending:
+            pending.append(executor.submit(fetch, next_page))
+            next_page += 1
+
+    try:
+        submit(ahead=True)
+        while pending:
+            results = pending.popleft().result()
+            last = len(results) < page_size
+            if not last:
+                submit(ahead=prefetch)
             yield from results
-            if len(results) < page_size:
+            if last:
                 break
-            page += 1
+            submit(ahead=True)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def async_paginate(  # noqa: C901
+    func: Callable[..., Awaitable[list[T]]],
+    *args: object,
+    page_size: int | None = None,
+    prefetch: bool = True,
+    total_count: int | None = None,
+    concurrency: int = PAGINATE_CONCURRENCY,
+    **kwargs: object,
+) -> AsyncIterator[T]:
+    """
+    An asynchronous generator function that handles pagination for async API calls.
+
+    Behaves like paginate, with pages fetched as tasks of the running event loop instead of threads.
+
+    Args:
+        func (Callable[..., Awaitable[list[T]]]): The coroutine function to paginate,
+            which should accept page and page_size parameters.
+        *args: Positional arguments to pass to the function.
+        page_size (int | None): The number of items to request per page,
+            defaults to the maximum page size the endpoint accepts.
+        prefetch (bool): Fetch the next page while the items of the current page are consumed.
+        total_count (int | None): The total number of items if known, used to fetch pages concurrently.
+        concurrency (int): The maximum number of pages fetched concurrently if total_count is given.
+        **kwargs: Keyword arguments to pass to the function.
+
+    Yields:
+        Individual items from all pages.
+    """
+    if page_size is None:
+        page_size = get_max_page_size(func)
+    known_page_count = -(-total_count // page_size) if total_count else 0
+    concurrency = max(1, concurrency) if known_page_count else 1
+
+    async def fetch(page: int) -> list[T]:
+        try:
+            return await func(*args, page=page, page_size=page_size, **kwargs)
         except NotFoundException:
-            break  # We've paginated beyond the last page
+            return []  # We've paginated beyond the last page
+
+    pending: deque[asyncio.Task[list[T]]] = deque()
+    next_page = 1
+
+    def submit(ahead: bool) -> None:
+        nonlocal next_page
+        # Pages covering the known total are fetched concurrently, further pages one at a time
+        while next_page <= known_page_count and len(pending) < concurrency:
+            pending.append(asyncio.create_task(fetch(next_page)))
+            next_page += 1
+        if ahead and not pending:
+            pending.append(asyncio.create_task(fetch(next_page)))
+            next_page += 1
+
+    try:
+        submit(ahead=True)
+        while pending:
+            results = await pending.popleft()
+            last = len(results) < page_size
+            if not last:
+                submit(ahead=prefetch)
+            for result in results:
+                yield result
+            if last:
+                break
+            submit(ahead=True)
+    finally:
+        for task in pending:
+            task.cancel()
@@ -25,7 +25,14 @@ from packaging.version import Version
 from psutil import Process, wait_procs
 from pydantic import BaseModel, computed_field
 
-from aignostics.utils import UNHIDE_SENSITIVE_INFO, BaseService, Health, __project_name__, get_logger
+from aignostics.utils import (
+    UNHIDE_SENSITIVE_INFO,
+    BaseService,
+    Health,
+    __project_name__,
+    get_http_session,
+    get_logger,
+)
 
 from ._settings import Settings
 
@@ -519,7 +526,7 @@ class Service(BaseService):
         filepath = path / filename
 
         try:  # noqa: PLR1702
-            with requests.get(url, stream=True, timeout=60) as stream:
+            with get_http_session().get(url, stream=True) as stream:
                 stream.raise_for_status()
                 download_size = int(stream.headers.get("content-length", 0))
                 downloaded_size = 0
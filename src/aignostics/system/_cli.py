@@ -10,7 +10,7 @@ import typer
 import yaml
 
 from ..constants import API_VERSIONS  # noqa: TID252
-from ..utils import console, get_logger  # noqa: TID252
+from ..utils import console, get_checksum_cache, get_logger  # noqa: TID252
 from ._service import Service
 
 logger = get_logger(__name__)
@@ -231,3 +231,28 @@ def http_proxy_disable() -> None:
     except ValueError as e:
         console.print(f"Invalid HTTP proxy configuration: {e!s}", style="error")
         sys.exit(2)
+
+
+checksum_cache_app = typer.Typer()
+cli.add_typer(checksum_cache_app, name="checksum-cache", help="Inspect and clear the cache of local file checksums.")
+
+
+@checksum_cache_app.command("show")
+def checksum_cache_show() -> None:
+    """Show location, number of entries and size of the checksum cache."""
+    cache = get_checksum_cache()
+    if cache is None:
+        console.print("Checksum cache is disabled.", style="warning")
+        return
+    console.print_json(data=cache.stats().model_dump())
+
+
+@checksum_cache_app.command("clear")
+def checksum_cache_clear() -> None:
+    """Remove all entries from the checksum cache."""
+    cache = get_checksum_cache()
+    if cache is None:
+        console.print("Checksum cache is disabled.", style="warning")
+        return
+    removed = cache.clear()
+    console.print(f"Removed {removed} entries from checksum cache.", style="success")
@@ -27,6 +27,7 @@ from ..utils import (  # noqa: TID252
     __project_path__,
     __repository_url__,
     __version__,
+    get_http_pool_stats,
     get_logger,
     get_process_info,
     load_settings,
@@ -333,6 +334,7 @@ class Service(BaseService):
                         "public_ipv4": Service._get_public_ipv4(),
                         "proxies": getproxies(),
                         "requests_ca_bundle": os.getenv("REQUESTS_CA_BUNDLE"),
+                        "http_pools": [json.loads(stats.model_dump_json()) for stats in get_http_pool_stats()],
                     },
                     "uptime": {
                         "seconds": uptime(),
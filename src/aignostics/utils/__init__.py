@@ -1,5 +1,23 @@
 """Utilities module."""
 
+from ._checksum import (
+    CHECKSUM_CHUNK_SIZE,
+    FileChecksums,
+    StreamingChecksum,
+    calculate_file_checksums,
+    calculate_file_crc32c,
+    calculate_file_md5,
+    calculate_file_multipart_etags,
+    iter_file_chunks,
+)
+from ._checksum_cache import (
+    CachedFile,
+    ChecksumCache,
+    ChecksumCacheSettings,
+    ChecksumCacheStats,
+    FileIdentity,
+    get_checksum_cache,
+)
 from ._cli import prepare_cli
 from ._console import console
 from ._constants import (
@@ -20,6 +38,7 @@ from ._constants import (
 from ._di import load_modules, locate_implementations, locate_subclasses
 from ._fs import get_user_data_directory, open_user_data_directory, sanitize_path, sanitize_path_component
 from ._health import Health
+from ._http import HttpPoolStats, HttpSettings, get_http_pool_stats, get_http_session
 from ._log import LogSettings, get_logger
 from ._process import ProcessInfo, get_process_info
 from ._service import BaseService
@@ -27,12 +46,22 @@ from ._settings import UNHIDE_SENSITIVE_INFO, OpaqueSettings, load_settings, str
 from .boot import boot
 
 __all__ = [
+    "CHECKSUM_CHUNK_SIZE",
     "UNHIDE_SENSITIVE_INFO",
     "BaseService",
+    "CachedFile",
+    "ChecksumCache",
+    "ChecksumCacheSettings",
+    "ChecksumCacheStats",
+    "FileChecksums",
+    "FileIdentity",
     "Health",
+    "HttpPoolStats",
+    "HttpSettings",
     "LogSettings",
     "OpaqueSettings",
     "ProcessInfo",
+    "StreamingChecksum",
     "__author_email__",
     "__author_name__",
     "__base__url__",
@@ -47,10 +76,18 @@ __all__ = [
     "__repository_url__",
     "__version__",
     "boot",
+    "calculate_file_checksums",
+    "calculate_file_crc32c",
+    "calculate_file_md5",
+    "calculate_file_multipart_etags",
     "console",
+    "get_checksum_cache",
+    "get_http_pool_stats",
+    "get_http_session",
     "get_logger",
     "get_process_info",
     "get_user_data_directory",
+    "iter_file_chunks",
     "load_modules",
     "load_settings",
     "locate_implementations",
@@ -0,0 +1,247 @@
+"""Checksum utilities.
+
+Computes CRC32C and MD5 checksums of files and streams in a single pass, reading files
+with readinto into a preallocated buffer that is reused per thread. Also computes the ETags
+S3 compatible storage assigns to objects uploaded in multiple parts.
+"""
+
+import base64
+import hashlib
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from typing import BinaryIO
+
+import google_crc32c
+from pydantic import BaseModel
+
+from ._checksum_cache import FileIdentity, get_checksum_cache
+
+# Chosen by the throughput benchmark in tests/aignostics/utils/checksum_test.py: smaller chunks
+# cost syscall overhead, larger chunks fall out of the CPU caches while hashing
+CHECKSUM_CHUNK_SIZE = 1024 * 1024  # 1MB
+
+_buffers = threading.local()
+
+
+def _get_buffer(size: int) -> bytearray:
+    """Get the reusable read buffer of the current thread, (re)allocating it if its size differs.
+
+    Args:
+        size (int): Size of the buffer in bytes.
+
+    Returns:
+        bytearray: The buffer.
+    """
+    buffer: bytearray | None = getattr(_buffers, "buffer", None)
+    if buffer is None or len(buffer) != size:
+        buffer = bytearray(size)
+        _buffers.buffer = buffer
+    return buffer
+
+
+def iter_file_chunks(file: BinaryIO, chunk_size: int = CHECKSUM_CHUNK_SIZE) -> Iterator[memoryview]:
+    """Iterate over the content of a file in chunks read into a reused buffer.
+
+    Each chunk is a view into the same buffer and is only valid until the next chunk is read.
+
+    Args:
+        file (BinaryIO): File opened in binary mode.
+        chunk_size (int): Size of the chunks in bytes.
+
+    Yields:
+        memoryview: The next chunk of the file.
+    """
+    buffer = _get_buffer(chunk_size)
+    view = memoryview(buffer)
+    while size := file.readinto(buffer):  # type: ignore[attr-defined]
+        yield view[:size]
+
+
+class StreamingChecksum:
+    """CRC32C and optionally MD5 checksum computed incrementally over chunks of data."""
+
+    def __init__(self, md5: bool = False, crc32c: int = 0) -> None:
+        """Initialize the checksum.
+
+        Args:
+            md5 (bool): Whether to compute the MD5 checksum in addition to CRC32C.
+            crc32c (int): CRC32C of data already processed, to continue from.
+        """
+        self.crc32c = crc32c
+        self._md5 = hashlib.md5() if md5 else None  # noqa: S324
+        self.size = 0
+
+    def update(self, chunk: bytes | memoryview) -> None:
+        """Add a chunk of data to the checksum.
+
+        Args:
+            chunk (bytes | memoryview): The data.
+        """
+        if self._md5:
+            self._md5.update(chunk)
+        # google_crc32c only accepts bytes
+        self.crc32c = google_crc32c.extend(self.crc32c, chunk if isinstance(chunk, bytes) else bytes(chunk))
+        self.size += len(chunk)
+
+    def crc32c_base64(self) -> str:
+        """Get the CRC32C checksum in base64 encoding.
+
+        Returns:
+            str: The base64 encoded big-endian CRC32C.
+        """
+        return base64.b64encode(self.crc32c.to_bytes(4, "big")).decode("ascii")
+
+    def md5_hexdigest(self) -> str:
+        """Get the MD5 checksum as hex digest.
+
+        Returns:
+            str: The hex digest.
+
+        Raises:
+            ValueError: If the MD5 checksum was not requested.
+        """
+        if self._md5 is None:
+            msg = "MD5 checksum was not requested"
+            raise ValueError(msg)
+        return self._md5.hexdigest()
+
+
+class FileChecksums(BaseModel):
+    """Checksums of a file."""
+
+    size: int
+    crc32c_base64: str
+    md5_hex: str | None = None
+
+
+def calculate_file_checksums(
+    path: Path, md5: bool = False, chunk_size: int = CHECKSUM_CHUNK_SIZE, use_cache: bool = False
+) -> FileChecksums:
+    """Calculate the CRC32C and optionally the MD5 checksum of a file in a single pass.
+
+    Args:
+        path (Path): Path to the file.
+        md5 (bool): Whether to compute the MD5 checksum in addition to CRC32C.
+        chunk_size (int): Size of the chunks read in bytes.
+        use_cache (bool): Whether to look up and store the checksums in the persistent checksum cache.
+
+    Returns:
+        FileChecksums: Size and checksums of the file.
+    """
+    cache = get_checksum_cache() if use_cache else None
+    identity = FileIdentity.of(path) if cache else None
+    if cache and identity:
+        cached = cache.get(identity)
+        if cached and cached.crc32c_base64 and (cached.md5_hex or not md5):
+            return FileChecksums(
+                size=identity.size, crc32c_base64=cached.crc32c_base64, md5_hex=cached.md5_hex if md5 else None
+            )
+
+    checksum = StreamingChecksum(md5=md5)
+    with path.open("rb") as file:
+        for chunk in iter_file_chunks(file, chunk_size):
+            checksum.update(chunk)
+    checksums = FileChecksums(
+        size=checksum.size,
+        crc32c_base64=checksum.crc32c_base64(),
+        md5_hex=checksum.md5_hexdigest() if md5 else None,
+    )
+
+    # Only cache if the file did not change while reading it
+    if cache and identity and FileIdentity.of(path) == identity:
+        cache.put(identity, crc32c_base64=checksums.crc32c_base64, md5_hex=checksums.md5_hex)
+    return checksums
+
+
+def calculate_file_crc32c(path: Path, chunk_size: int = CHECKSUM_CHUNK_SIZE, use_cache: bool = False) -> str:
+    """Calculate the CRC32C checksum of a file.
+
+    Args:
+        path (Path): Path to the file.
+        chunk_size (int): Size of the chunks read in bytes.
+        use_cache (bool): Whether to look up and store the checksum in the persistent checksum cache.
+
+    Returns:
+        str: The CRC32C checksum in base64 encoding.
+    """
+    return calculate_file_checksums(path, chunk_size=chunk_size, use_cache=use_cache).crc32c_base64
+
+
+def calculate_file_md5(path: Path, chunk_size: int = CHECKSUM_CHUNK_SIZE, use_cache: bool = False) -> str:
+    """Calculate the MD5 checksum of a file.
+
+    The CRC32C checksum is computed in the same pass if the persistent checksum cache is used.
+
+    Args:
+        path (Path): Path to the file.
+        chunk_size (int): Size of the chunks read in bytes.
+        use_cache (bool): Whether to look up and store the checksums in the persistent checksum cache.
+
+    Returns:
+        str: The MD5 checksum as hex digest.
+    """
+    if use_cache:
+        return str(calculate_file_checksums(path, md5=True, chunk_size=chunk_size, use_cache=True).md5_hex)
+    checksum = hashlib.md5()  # noqa: S324
+    with path.open("rb") as file:
+        for chunk in iter_file_chunks(file, chunk_size):
+            checksum.update(chunk)
+    return checksum.hexdigest()
+
+
+def calculate_file_multipart_etags(
+    path: Path, part_sizes: list[int], chunk_size: int = CHECKSUM_CHUNK_SIZE, use_cache: bool = False
+) -> dict[int, str]:
+    """Calculate the ETags of a file uploaded as S3 multipart upload with the given part sizes in a single pass.
+
+    The ETag of a multipart upload is the MD5 of the concatenated binary MD5s of its parts,
+    followed by a dash and the number of parts, e.g. "<md5>-3".
+
+    Args:
+        path (Path): Path to the file.
+        part_sizes (list[int]): Part sizes in bytes to calculate the ETag for.
+        chunk_size (int): Size of the chunks read in bytes.
+        use_cache (bool): Whether to look up and store the ETags in the persistent checksum cache.
+
+    Returns:
+        dict[int, str]: The ETags by part size.
+    """
+    cache = get_checksum_cache() if use_cache else None
+    identity = FileIdentity.of(path) if cache else None
+    cached = cache.get(identity) if cache and identity else None
+    etags = {
+        part_size: etag
+        for part_size, etag in ((cached.multipart_etags or {}) if cached else {}).items()
+        if part_size in part_sizes
+    }
+    remaining = sorted(set(part_sizes) - etags.keys())
+    if not remaining:
+        return etags
+
+    part_digests: dict[int, list[bytes]] = {part_size: [] for part_size in remaining}
+    part_md5s = {part_size: hashlib.md5() for part_size in remaining}  # noqa: S324
+    part_filled = dict.fromkeys(remaining, 0)
+    with path.open("rb") as file:
+        for chunk in iter_file_chunks(file, chunk_size):
+            for part_size in remaining:
+                offset = 0
+                while offset < len(chunk):
+                    take = min(len(chunk) - offset, part_size - part_filled[part_size])
+                    part_md5s[part_size].update(chunk[offset : offset + take])
+                    part_filled[part_size] += take
+                    offset += take
+                    if part_filled[part_size] == part_size:
+                        part_digests[part_size].append(part_md5s[part_size].digest())
+                        part_md5s[part_size] = hashlib.md5()  # noqa: S324
+                        part_filled[part_size] = 0
+    for part_size in remaining:
+        if part_filled[part_size] or not part_digests[part_size]:
+            part_digests[part_size].append(part_md5s[part_size].digest())
+        digests = part_digests[part_size]
+        etags[part_size] = f"{hashlib.md5(b''.join(digests)).hexdigest()}-{len(digests)}"  # noqa: S324
+
+    # Only cache if the file did not change while reading it
+    if cache and identity and FileIdentity.of(path) == identity:
+        cache.put(identity, multipart_etags={part_size: etags[part_size] for part_size in remaining})
+    return etags
@@ -0,0 +1,306 @@
+"""Persistent cache of file checksums and metadata.
+
+Maps the identity of a file, i.e. its resolved path, size, modification time in nanoseconds and inode,
+to its CRC32C and MD5 checksums, its S3 multipart ETags per part size and further metadata, such as
+the dimensions of a whole slide image.
+Entries are invalidated as soon as the identity of the file changes, and the least recently used
+entries are evicted once the cache exceeds its maximum number of entries.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing, suppress
+from pathlib import Path
+from typing import Annotated, Any
+
+from pydantic import BaseModel, Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from ._constants import __env_file__, __is_running_in_read_only_environment__, __project_name__
+from ._fs import get_user_data_directory
+from ._log import get_logger
+
+logger = get_logger(__name__)
+
+CHECKSUM_CACHE_DATABASE_NAME = "checksums.sqlite3"
+CHECKSUM_CACHE_TIMEOUT_SECONDS = 30
+# Files modified this recently are not cached, as a further modification within the
+# resolution of the file system timestamps would not change their identity
+CHECKSUM_CACHE_RACY_WINDOW_NS = 2_000_000_000  # 2s
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    crc32c_base64 TEXT,
+    md5_hex TEXT,
+    metadata TEXT,
+    accessed_at REAL NOT NULL,
+    multipart_etags TEXT
+);
+CREATE INDEX IF NOT EXISTS files_accessed_at ON files (accessed_at);
+"""
+# Columns added after the initial schema, added to existing databases on first use
+_MIGRATIONS = ("ALTER TABLE files ADD COLUMN multipart_etags TEXT",)
+
+
+class ChecksumCacheSettings(BaseSettings):
+    """Settings for the persistent checksum cache."""
+
+    model_config = SettingsConfigDict(
+        env_prefix=f"{__project_name__.upper()}_CHECKSUM_CACHE_",
+        extra="ignore",
+        env_file=__env_file__,
+        env_file_encoding="utf-8",
+    )
+
+    enabled: Annotated[
+        bool,
+        Field(
+            description="Cache checksums and metadata of local files across runs",
+            default=not __is_running_in_read_only_environment__,
+        ),
+    ]
+    max_entries: Annotated[
+        int,
+        Field(description="Maximum number of files cached, least recently used are evicted", default=100_000, ge=1),
+    ]
+
+
+class FileIdentity(BaseModel):
+    """Identity of a file, changing whenever the file is modified or replaced."""
+
+    path: str
+    size: int
+    mtime_ns: int
+    inode: int
+
+    @classmethod
+    def of(cls, path: Path) -> "FileIdentity":
+        """Determine the identity of a file.
+
+        Args:
+            path (Path): Path to the file.
+
+        Returns:
+            FileIdentity: The identity of the file.
+
+        Raises:
+            OSError: If the file cannot be accessed.
+        """
+        stat = path.stat()
+        return cls(path=str(path.resolve()), size=stat.st_size, mtime_ns=stat.st_mtime_ns, inode=stat.st_ino)
+
+
+class CachedFile(BaseModel):
+    """Cached checksums and metadata of a file."""
+
+    identity: FileIdentity
+    crc32c_base64: str | None = None
+    md5_hex: str | None = None
+    metadata: dict[str, Any] | None = None
+    multipart_etags: dict[int, str] | None = None
+
+
+class ChecksumCacheStats(BaseModel):
+    """Statistics of the checksum cache."""
+
+    database: str
+    entries: int
+    max_entries: int
+    size_bytes: int
+
+
+class ChecksumCache:
+    """Persistent cache of file checksums and metadata, backed by SQLite.
+
+    Each operation uses its own connection, so the cache can be shared by threads and processes.
+    Database errors are logged and treated as cache misses, so the cache never breaks the caller.
+    """
+
+    def __init__(self, database: Path, max_entries: int = 100_000) -> None:
+        """Initialize the cache.
+
+        Args:
+            database (Path): Path of the SQLite database, created if it does not exist.
+            max_entries (int): Maximum number of files cached.
+        """
+        self.database = database
+        self.max_entries = max_entries
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the database, creating the schema on first use.
+
+        Returns:
+            sqlite3.Connection: The connection.
+        """
+        connection = sqlite3.connect(self.database, timeout=CHECKSUM_CACHE_TIMEOUT_SECONDS)
+        if not self._initialized:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_SCHEMA)
+            for migration in _MIGRATIONS:
+                with suppress(sqlite3.OperationalError):  # Already migrated
+                    connection.execute(migration)
+            self._initialized = True
+        return connection
+
+    def get(self, identity: FileIdentity) -> CachedFile | None:
+        """Get the cached checksums and metadata of a file.
+
+        Args:
+            identity (FileIdentity): The current identity of the file.
+
+        Returns:
+            CachedFile | None: The cached entry, or None if the file is not cached or changed since.
+        """
+        try:
+            with closing(self._connect()) as connection, connection:
+                row = connection.execute(
+                    "SELECT size, mtime_ns, inode, crc32c_base64, md5_hex, metadata, multipart_etags "
+                    "FROM files WHERE path = ?",
+                    (identity.path,),
+                ).fetchone()
+                if row is None:
+                    return None
+                if tuple(row[:3]) != (identity.size, identity.mtime_ns, identity.inode):
+                    connection.execute("DELETE FROM files WHERE path = ?", (identity.path,))
+                    return None
+                connection.execute("UPDATE files SET accessed_at = ? WHERE path = ?", (time.time(), identity.path))
+        except sqlite3.Error as e:
+            logger.warning("Failed to read checksum cache '%s': %s", self.database, e)
+            return None
+        return CachedFile(
+            identity=identity,
+            crc32c_base64=row[3],
+            md5_hex=row[4],
+            metadata=json.loads(row[5]) if row[5] else None,
+            multipart_etags=json.loads(row[6]) if row[6] else None,
+        )
+
+    def put(
+        self,
+        identity: FileIdentity,
+        crc32c_base64: str | None = None,
+        md5_hex: str | None = None,
+        metadata: dict[str, Any] | None = None,
+        multipart_etags: dict[int, str] | None = None,
+    ) -> None:
+        """Cache checksums and metadata of a file, keeping values cached before for the same identity.
+
+        Files modified less than CHECKSUM_CACHE_RACY_WINDOW_NS ago are not cached.
+
+        Args:
+            identity (FileIdentity): The identity of the file when the values were computed.
+            crc32c_base64 (str | None): The CRC32C checksum in base64 encoding.
+            md5_hex (str | None): The MD5 checksum as hex digest.
+            metadata (dict[str, Any] | None): Further metadata, must be JSON serializable.
+            multipart_etags (dict[int, str] | None): S3 multipart ETags by part size, merged with cached ones.
+        """
+        if time.time_ns() - identity.mtime_ns < CHECKSUM_CACHE_RACY_WINDOW_NS:
+            return
+        try:
+            with closing(self._connect()) as connection, connection:
+                row = connection.execute(
+                    "SELECT size, mtime_ns, inode, crc32c_base64, md5_hex, metadata, multipart_etags "
+                    "FROM files WHERE path = ?",
+                    (identity.path,),
+                ).fetchone()
+                metadata_json = json.dumps(metadata) if metadata is not None else None
+                if row is not None and tuple(row[:3]) == (identity.size, identity.mtime_ns, identity.inode):
+                    crc32c_base64 = crc32c_base64 or row[3]
+                    md5_hex = md5_hex or row[4]
+                    metadata_json = metadata_json or row[5]
+                    if row[6]:
+                        cached = {int(part_size): etag for part_size, etag in json.loads(row[6]).items()}
+                        multipart_etags = {**cached, **(multipart_etags or {})}
+                connection.execute(
+                    "INSERT OR REPLACE INTO files "
+                    "(path, size, mtime_ns, inode, crc32c_base64, md5_hex, metadata, multipart_etags, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        identity.path,
+                        identity.size,
+                        identity.mtime_ns,
+                        identity.inode,
+                        crc32c_base64,
+                        md5_hex,
+                        metadata_json,
+                        json.dumps(multipart_etags) if multipart_etags else None,
+                        time.time(),
+                    ),
+                )
+                self._evict(connection)
+        except sqlite3.Error as e:
+            logger.warning("Failed to write checksum cache '%s': %s", self.database, e)
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        """Evict the least recently used entries exceeding the maximum number of entries.
+
+        Args:
+            connection (sqlite3.Connection): Connection within the current transaction.
+        """
+        (entries,) = connection.execute("SELECT COUNT(*) FROM files").fetchone()
+        if entries > self.max_entries:
+            connection.execute(
+                "DELETE FROM files WHERE path IN (SELECT path FROM files ORDER BY accessed_at LIMIT ?)",
+                (entries - self.max_entries,),
+            )
+
+    def stats(self) -> ChecksumCacheStats:
+        """Get statistics of the cache.
+
+        Returns:
+            ChecksumCacheStats: The statistics.
+        """
+        with closing(self._connect()) as connection:
+            (entries,) = connection.execute("SELECT COUNT(*) FROM files").fetchone()
+        size_bytes = sum(
+            path.stat().st_size
+            for path in (self.database, Path(f"{self.database}-wal"), Path(f"{self.database}-shm"))
+            if path.exists()
+        )
+        return ChecksumCacheStats(
+            database=str(self.database), entries=entries, max_entries=self.max_entries, size_bytes=size_bytes
+        )
+
+    def clear(self) -> int:
+        """Remove all entries from the cache.
+
+        Returns:
+            int: The number of entries removed.
+        """
+        with closing(self._connect()) as connection, connection:
+            removed = connection.execute("DELETE FROM files").rowcount
+        with closing(self._connect()) as connection:
+            connection.execute("VACUUM")
+        return removed
+
+
+_checksum_cache: ChecksumCache | None = None
+_checksum_cache_pid: int | None = None
+_checksum_cache_lock = threading.Lock()
+
+
+def get_checksum_cache() -> ChecksumCache | None:
+    """Get the checksum cache of the user data directory.
+
+    Returns:
+        ChecksumCache | None: The cache, or None if disabled.
+    """
+    global _checksum_cache, _checksum_cache_pid  # noqa: PLW0603
+    with _checksum_cache_lock:
+        if _checksum_cache_pid != os.getpid():
+            settings = ChecksumCacheSettings()
+            _checksum_cache = (
+                ChecksumCache(get_user_data_directory("cache") / CHECKSUM_CACHE_DATABASE_NAME, settings.max_entries)
+                if settings.enabled
+                else None
+            )
+            _checksum_cache_pid = os.getpid()
+        return _checksum_cache
@@ -0,0 +1,184 @@
+"""Shared HTTP session for transfers via signed URLs.
+
+All transfers share one requests session per process, so connections and TLS sessions are kept
+alive and reused across files, and requests are retried with exponential backoff on transient
+failures. Proxies and CA bundles configured via the system module are honored, as the session
+trusts the environment.
+"""
+
+import os
+import threading
+from typing import Annotated, Any
+
+import requests
+from pydantic import BaseModel, Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ._constants import __env_file__, __project_name__
+
+# Only idempotent requests without body are retried, as streamed request bodies cannot be replayed
+HTTP_RETRY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+HTTP_RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class HttpSettings(BaseSettings):
+    """Settings of the shared HTTP session."""
+
+    model_config = SettingsConfigDict(
+        env_prefix=f"{__project_name__.upper()}_HTTP_",
+        extra="ignore",
+        env_file=__env_file__,
+        env_file_encoding="utf-8",
+    )
+
+    pool_connections: Annotated[
+        int,
+        Field(description="Number of hosts connection pools are kept for", default=10, ge=1, le=100),
+    ]
+    pool_maxsize: Annotated[
+        int,
+        Field(description="Maximum number of connections kept alive per host", default=32, ge=1, le=256),
+    ]
+    retries: Annotated[
+        int,
+        Field(description="Number of retries of failed idempotent requests", default=3, ge=0, le=10),
+    ]
+    retry_backoff_factor: Annotated[
+        float,
+        Field(description="Backoff factor in seconds of exponential backoff between retries", default=0.5, ge=0),
+    ]
+    connect_timeout: Annotated[
+        float,
+        Field(description="Timeout in seconds for establishing connections", default=10, gt=0),
+    ]
+    read_timeout: Annotated[
+        float,
+        Field(description="Timeout in seconds for receiving data on established connections", default=60, gt=0),
+    ]
+
+
+class HttpPoolStats(BaseModel):
+    """Statistics of the connection pool of a host."""
+
+    scheme: str
+    host: str
+    port: int | None
+    max_size: int
+    connections_created: int
+    requests: int
+    idle_connections: int
+
+
+class _TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTP adapter applying default timeouts to requests sent without an explicit timeout."""
+
+    def __init__(self, timeout: tuple[float, float], **kwargs: Any) -> None:  # noqa: ANN401
+        """Initialize the adapter.
+
+        Args:
+            timeout (tuple[float, float]): Default connect and read timeout in seconds.
+            **kwargs: Passed to HTTPAdapter.
+        """
+        self.timeout = timeout
+        super().__init__(**kwargs)
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:  # type: ignore[override]  # noqa: ANN401
+        """Send a request, applying the default timeout if none given.
+
+        Args:
+            request (requests.PreparedRequest): The request.
+            **kwargs: Passed to HTTPAdapter.send.
+
+        Returns:
+            requests.Response: The response.
+        """
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().send(request, **kwargs)
+
+
+_http_session: requests.Session | None = None
+_http_session_pid: int | None = None
+_http_session_lock = threading.Lock()
+
+
+def _create_http_session(settings: HttpSettings) -> requests.Session:
+    """Create a session with pooled connections, retries and default timeouts.
+
+    Args:
+        settings (HttpSettings): The settings.
+
+    Returns:
+        requests.Session: The session.
+    """
+    retry = Retry(
+        total=settings.retries,
+        backoff_factor=settings.retry_backoff_factor,
+        status_forcelist=HTTP_RETRY_STATUS_CODES,
+        allowed_methods=HTTP_RETRY_METHODS,
+        raise_on_status=False,
+    )
+    adapter = _TimeoutHTTPAdapter(
+        timeout=(settings.connect_timeout, settings.read_timeout),
+        pool_connections=settings.pool_connections,
+        pool_maxsize=settings.pool_maxsize,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if os.getenv("SSL_NO_VERIFY"):
+        session.verify = False
+    return session
+
+
+def get_http_session() -> requests.Session:
+    """Get the HTTP session shared by all transfers of this process.
+
+    The session is created on first use and recreated in forked processes, as pooled connections
+    must not be shared across processes.
+
+    Returns:
+        requests.Session: The session.
+    """
+    global _http_session, _http_session_pid  # noqa: PLW0603
+    with _http_session_lock:
+        if _http_session is None or _http_session_pid != os.getpid():
+            _http_session = _create_http_session(HttpSettings())
+            _http_session_pid = os.getpid()
+        return _http_session
+
+
+def get_http_pool_stats() -> list[HttpPoolStats]:
+    """Get statistics of the connection pools of the shared HTTP session.
+
+    Returns:
+        list[HttpPoolStats]: Statistics per host connected to, empty if the session was not used yet.
+    """
+    with _http_session_lock:
+        session = _http_session if _http_session_pid == os.getpid() else None
+    if session is None:
+        return []
+    stats: list[HttpPoolStats] = []
+    for adapter in dict.fromkeys(session.adapters.values()):
+        if not isinstance(adapter, HTTPAdapter):
+            continue
+        pools = adapter.poolmanager.pools
+        for key in pools.keys():  # noqa: SIM118
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            stats.append(
+                HttpPoolStats(
+                    scheme=pool.scheme,
+                    host=str(pool.host),
+                    port=pool.port,
+                    max_size=pool.pool.maxsize if pool.pool else 0,
+                    connections_created=pool.num_connections,
+                    requests=pool.num_requests,
+                    idle_connections=sum(1 for connection in list(pool.pool.queue) if connection) if pool.pool else 0,
+                )
+            )
+    return stats
@@ -7,12 +7,10 @@ from typing import Any
 import requests
 
 from aignostics import WSI_SUPPORTED_FILE_EXTENSIONS
-from aignostics.utils import BaseService, Health, get_logger
+from aignostics.utils import BaseService, Health, get_http_session, get_logger
 
 logger = get_logger(__name__)
 
-TIMEOUT = 60  # 1 minutes
-
 
 class Service(BaseService):
     """Service of the application module."""
@@ -141,7 +139,7 @@ class Service(BaseService):
             logger.warning(error_msg)
             raise ValueError(error_msg)
         try:
-            response = requests.get(url, timeout=TIMEOUT)
+            response = get_http_session().get(url)
             response.raise_for_status()
             tiff_data = response.content
             tiff_buffer = io.BytesIO(tiff_data)
@@ -1,10 +1,15 @@
 """Tests to verify the service functionality of the application module."""
 
+from collections.abc import Callable
+from pathlib import Path
+from unittest import mock
+
 import pytest
 from typer.testing import CliRunner
 
 from aignostics.application import Service as ApplicationService
-from aignostics.platform import NotFoundException
+from aignostics.application._service import DownloadProgress
+from aignostics.platform import ItemResult, ItemStatus, NotFoundException, OutputArtifactElement
 
 HETA_APPLICATION_ID = "he-tme"
 
@@ -89,3 +94,381 @@ def test_application_version_use_latest_fallback(runner: CliRunner) -> None:
 
     with pytest.raises(ValueError, match=r"Invalid application version id format"):
         service.application_version("invalid-format", use_latest_if_no_version_given=False)
+
+
+def _mock_item_results(item_count: int, artifact_count: int, content: bytes) -> list[ItemResult]:
+    """Create succeeded item results whose artifacts all share the given content."""
+    import base64
+
+    import google_crc32c
+
+    checksum = base64.b64encode(google_crc32c.Checksum(content).digest()).decode("ascii")
+    return [
+        ItemResult(
+            item_id=f"item-{item_index}",
+            application_run_id="run",
+            reference=f"slide_{item_index}.tiff",
+            status=ItemStatus.SUCCEEDED,
+            error=None,
+            output_artifacts=[
+                OutputArtifactElement(
+                    output_artifact_id=f"artifact-{item_index}-{artifact_index}",
+                    name=f"artifact_{artifact_index}",
+                    metadata={"checksum_base64_crc32c": checksum, "media_type": "text/csv"},
+                    download_url=f"https://example.com/{item_index}/{artifact_index}",
+                )
+                for artifact_index in range(artifact_count)
+            ],
+        )
+        for item_index in range(item_count)
+    ]
+
+
+def _mock_streaming_response(content: bytes) -> mock.MagicMock:
+    """Create a mocked streaming response returning the given content."""
+    response = mock.MagicMock()
+    response.__enter__.return_value = response
+    response.headers = {"content-length": str(len(content))}
+    response.iter_content.return_value = [content[: len(content) // 2], content[len(content) // 2 :]]
+    return response
+
+
+@pytest.mark.parametrize(("item_concurrency", "artifact_concurrency"), [(1, 1), (4, 2)])
+def test_download_available_items_concurrently(
+    tmp_path: Path, item_concurrency: int, artifact_concurrency: int
+) -> None:
+    """Test that items are downloaded with bounded concurrency and aggregate progress is coherent."""
+    content = b"aignostics" * 1000
+    items = _mock_item_results(item_count=6, artifact_count=3, content=content)
+    progress = DownloadProgress()
+    snapshots: list[DownloadProgress] = []
+    downloaded_items: set[str] = set()
+
+    with mock.patch("requests.Session.get", side_effect=lambda *_, **__: _mock_streaming_response(content)):
+        ApplicationService()._download_available_items(
+            progress,
+            items,
+            tmp_path,
+            downloaded_items,
+            create_subdirectory_per_item=True,
+            download_progress_callable=snapshots.append,
+            item_concurrency=item_concurrency,
+            artifact_concurrency=artifact_concurrency,
+        )
+
+    assert downloaded_items == {f"slide_{item_index}.tiff" for item_index in range(6)}
+    assert len(list(tmp_path.glob("slide_*/artifact_*.csv"))) == 18
+    assert progress.processed_artifact_count == 18
+    assert progress.total_downloaded_size == 18 * len(content)
+    assert progress.active_downloads == {}
+    assert snapshots[-1].item_progress_normalized == 1
+    assert [snapshot.total_downloaded_size for snapshot in snapshots] == sorted(
+        snapshot.total_downloaded_size for snapshot in snapshots
+    )
+
+
+def test_download_available_items_skips_present_artifacts(tmp_path: Path) -> None:
+    """Test that artifacts already present with matching checksum are not downloaded again."""
+    content = b"aignostics" * 1000
+    items = _mock_item_results(item_count=2, artifact_count=2, content=content)
+    for item_index in range(2):
+        (tmp_path / f"slide_{item_index}").mkdir()
+        for artifact_index in range(2):
+            (tmp_path / f"slide_{item_index}" / f"artifact_{artifact_index}.csv").write_bytes(content)
+    progress = DownloadProgress()
+
+    with mock.patch("requests.Session.get") as mock_get:
+        ApplicationService()._download_available_items(
+            progress, items, tmp_path, set(), True, item_concurrency=2, artifact_concurrency=2
+        )
+
+    mock_get.assert_not_called()
+    assert progress.processed_artifact_count == 4
+    assert progress.total_downloaded_size == 0
+
+
+@pytest.mark.parametrize("server_supports_range", [True, False])
+def test_download_file_with_progress_resumes_partial_download(tmp_path: Path, server_supports_range: bool) -> None:
+    """Test that an interrupted download continues at the checkpointed offset and verifies the full checksum."""
+    import base64
+
+    import google_crc32c
+
+    from aignostics.application._service import DownloadCheckpoint
+
+    content = b"aignostics" * 1000
+    offset = 4000
+    checksum = base64.b64encode(google_crc32c.Checksum(content).digest()).decode("ascii")
+    artifact_path = tmp_path / "artifact.csv"
+    part_path = tmp_path / "artifact.csv.part"
+    checkpoint_path = tmp_path / "artifact.csv.part.json"
+    part_path.write_bytes(content[:offset] + b"garbage written after last checkpoint")
+    DownloadCheckpoint(checksum=checksum, offset=offset, crc32c=google_crc32c.value(content[:offset])).save(
+        checkpoint_path
+    )
+
+    response = _mock_streaming_response(content[offset:] if server_supports_range else content)
+    response.status_code = 206 if server_supports_range else 200
+    with mock.patch("requests.Session.get", return_value=response) as mock_get:
+        ApplicationService._download_file_with_progress(
+            DownloadProgress(), "https://example.com", artifact_path, checksum
+        )
+
+    assert mock_get.call_args.kwargs["headers"] == {"Range": f"bytes={offset}-"}
+    assert artifact_path.read_bytes() == content
+    assert not part_path.exists()
+    assert not checkpoint_path.exists()
+
+
+def test_download_file_with_progress_keeps_checkpoint_on_interruption(tmp_path: Path) -> None:
+    """Test that the partial file and its checkpoint are kept if the download is interrupted."""
+    import requests
+
+    from aignostics.application._service import DownloadCheckpoint
+
+    content = b"aignostics" * 1000
+    artifact_path = tmp_path / "artifact.csv"
+
+    def interrupted_content(**_: object) -> object:
+        yield content[:3000]
+        raise requests.ConnectionError
+
+    response = _mock_streaming_response(content)
+    response.iter_content.side_effect = interrupted_content
+    with (
+        mock.patch("requests.Session.get", return_value=response),
+        pytest.raises(requests.ConnectionError),
+    ):
+        ApplicationService._download_file_with_progress(DownloadProgress(), "https://example.com", artifact_path, "x")
+
+    checkpoint = DownloadCheckpoint.load(tmp_path / "artifact.csv.part", tmp_path / "artifact.csv.part.json", "x")
+    assert checkpoint.offset == 3000
+    assert not artifact_path.exists()
+
+
+def test_download_file_with_progress_downloads_large_files_in_segments(tmp_path: Path) -> None:
+    """Test that a large artifact is fetched as concurrent byte ranges and verified by the combined checksum."""
+    import base64
+
+    import google_crc32c
+
+    content = bytes(range(256)) * 64
+    checksum = base64.b64encode(google_crc32c.Checksum(content).digest()).decode("ascii")
+    artifact_path = tmp_path / "artifact.tiff"
+    requested_ranges: list[str] = []
+
+    def get(*_: object, headers: dict[str, str], **__: object) -> mock.MagicMock:
+        requested_ranges.append(headers["Range"])
+        first, _, last = headers["Range"].removeprefix("bytes=").partition("-")
+        response = _mock_streaming_response(content[int(first) : int(last) + 1])
+        response.status_code = 206
+        response.headers["content-range"] = f"bytes {first}-{last}/{len(content)}"
+        return response
+
+    progress = DownloadProgress()
+    with (
+        mock.patch("aignostics.platform._utils.SEGMENTED_DOWNLOAD_MIN_SEGMENT_SIZE", 1024),
+        mock.patch("requests.Session.get", side_effect=get),
+    ):
+        ApplicationService._download_file_with_progress(
+            progress, "https://example.com", artifact_path, checksum, segment_count=4
+        )
+
+    assert artifact_path.read_bytes() == content
+    assert sorted(requested_ranges) == [
+        "bytes=0-0",
+        "bytes=0-4095",
+        "bytes=12288-16383",
+        "bytes=4096-8191",
+        "bytes=8192-12287",
+    ]
+    assert progress.artifact_downloaded_size == len(content)
+    assert not (tmp_path / "artifact.tiff.part").exists()
+
+
+def test_download_file_with_progress_resumes_interrupted_segmented_download(tmp_path: Path) -> None:
+    """Test that an interrupted segmented download only fetches the remainder of each segment when resumed."""
+    import base64
+
+    import google_crc32c
+    import requests
+
+    content = bytes(range(256)) * 64
+    checksum = base64.b64encode(google_crc32c.Checksum(content).digest()).decode("ascii")
+    artifact_path = tmp_path / "artifact.tiff"
+    requested_ranges: list[str] = []
+    interrupt = True
+
+    def get(*_: object, headers: dict[str, str], **__: object) -> mock.MagicMock:
+        requested_ranges.append(headers["Range"])
+        first, _, last = headers["Range"].removeprefix("bytes=").partition("-")
+        segment = content[int(first) : int(last) + 1]
+        response = _mock_streaming_response(segment)
+        response.status_code = 206
+        response.headers["content-range"] = f"bytes {first}-{last}/{len(content)}"
+        if interrupt and first == "8192":
+
+            def interrupted_content(**_: object) -> object:
+                yield segment[:2048]
+                raise requests.ConnectionError
+
+            response.iter_content.side_effect = interrupted_content
+        return response
+
+    with (
+        mock.patch("aignostics.platform._utils.SEGMENTED_DOWNLOAD_MIN_SEGMENT_SIZE", 1024),
+        mock.patch("requests.Session.get", side_effect=get),
+    ):
+        with pytest.raises(requests.ConnectionError):
+            ApplicationService._download_file_with_progress(
+                DownloadProgress(), "https://example.com", artifact_path, checksum, segment_count=4
+            )
+        assert not artifact_path.exists()
+
+        interrupt = False
+        requested_ranges.clear()
+        progress = DownloadProgress()
+        ApplicationService._download_file_with_progress(
+            progress, "https://example.com", artifact_path, checksum, segment_count=4
+        )
+
+    assert requested_ranges == ["bytes=10240-12287"]
+    assert artifact_path.read_bytes() == content
+    assert progress.artifact_downloaded_size == len(content)
+    assert not (tmp_path / "artifact.tiff.part").exists()
+    assert not (tmp_path / "artifact.tiff.part.json").exists()
+
+
+def test_find_slides_matches_glob_per_extension(tmp_path: Path) -> None:
+    """Test that the single directory walk finds slides in the order of globbing once per extension."""
+    from aignostics.constants import WSI_SUPPORTED_FILE_EXTENSIONS
+
+    for relative_path in ["a.tiff", "b/c.svs", "b/d.tif", "b/e/f.dcm", "g.dcm", "h.txt", "i.tiff.bak"]:
+        (tmp_path / relative_path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / relative_path).touch()
+
+    expected = [
+        file_path
+        for extension in list(WSI_SUPPORTED_FILE_EXTENSIONS)
+        for file_path in tmp_path.glob(f"**/*{extension}")
+    ]
+    assert ApplicationService._find_slides(tmp_path) == expected
+    assert len(expected) == 5
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_generate_metadata_from_source_directory_in_parallel(processes: int, tmp_path: Path) -> None:
+    """Test that the parallel scan generates the same rows as the serial scan and captures per-file errors."""
+    import shutil
+
+    resources = Path(__file__).parent.parent.parent / "resources"
+    shutil.copy(resources / "run" / "small-pyramidal.dcm", tmp_path / "small-pyramidal.dcm")
+    (tmp_path / "nested").mkdir()
+    shutil.copy(resources / "run" / "small-pyramidal.dcm", tmp_path / "nested" / "copy.dcm")
+    (tmp_path / "broken.tiff").write_bytes(b"not a slide")
+    progress: list[tuple[int, int]] = []
+
+    with mock.patch.object(ApplicationService, "application_version"):
+        metadata = ApplicationService.generate_metadata_from_source_directory(
+            "he-tme",
+            tmp_path,
+            processes=processes,
+            progress_callable=lambda scanned, total, _: progress.append((scanned, total)),
+        )
+        serial_metadata = ApplicationService.generate_metadata_from_source_directory("he-tme", tmp_path, processes=1)
+
+    assert metadata == serial_metadata
+    assert {Path(entry["reference"]).name for entry in metadata} == {"small-pyramidal.dcm", "copy.dcm"}
+    assert all(entry["checksum_base64_crc32c"] and entry["width_px"] for entry in metadata)
+    assert sorted(progress) == [(1, 3), (2, 3), (3, 3)]
+
+
+@pytest.mark.parametrize("file_concurrency", [1, 3])
+def test_application_run_upload_uploads_files_concurrently(tmp_path: Path, file_concurrency: int) -> None:
+    """Test that files are uploaded via one pooled session or in parts, with progress aggregated across workers."""
+    import queue
+
+    contents = {f"slide_{index}.tiff": bytes([index]) * (3 * 1024 * 1024 + index) for index in range(3)}
+    metadata = []
+    for name, content in contents.items():
+        (tmp_path / name).write_bytes(content)
+        metadata.append({"reference": str(tmp_path / name)})
+    uploaded: dict[str, bytes] = {}
+
+    def put(url: str, data: object, **_: object) -> mock.MagicMock:
+        uploaded[url] = b"".join(data)  # type: ignore[call-overload]
+        return mock.MagicMock()
+
+    def upload_file_multipart(source_path: Path, object_key: str, callback: Callable[[int, Path], None]) -> None:
+        uploaded[f"https://signed/{object_key}"] = source_path.read_bytes()
+        for _ in range(3):
+            callback(1024 * 1024, source_path)
+        callback(2, source_path)
+
+    callback = mock.MagicMock()
+    progress_queue: queue.Queue[dict[str, object]] = queue.Queue()
+    bucket_service = mock.MagicMock()
+    bucket_service.get_bucket_protocol.return_value = "gs"
+    bucket_service.get_bucket_name.return_value = "bucket"
+    bucket_service.create_signed_upload_url.side_effect = lambda key: f"https://signed/{key}"
+    bucket_service.is_multipart_upload.side_effect = lambda size: size >= 3 * 1024 * 1024 + 2
+    bucket_service.upload_file_multipart.side_effect = upload_file_multipart
+    with (
+        mock.patch.object(ApplicationService, "application_version") as application_version,
+        mock.patch("aignostics.application._service.BucketService", return_value=bucket_service) as bucket_cls,
+        mock.patch("aignostics.application._service.load_settings") as load_settings,
+        mock.patch("requests.Session.put", side_effect=put),
+    ):
+        application_version.return_value.application_version_id = "app:v1.0.0"
+        load_settings.return_value.upload_file_concurrency = file_concurrency
+        assert ApplicationService.application_run_upload("app:v1.0.0", metadata, "prefix", progress_queue, callback)
+
+    bucket_cls.assert_called_once_with()
+    bucket_service.upload_file_multipart.assert_called_once()
+    assert {url.rsplit("/", 1)[-1]: content for url, content in uploaded.items()} == contents
+    assert sum(call.args[0] for call in callback.call_args_list) == sum(len(content) for content in contents.values())
+    messages = list(progress_queue.queue)
+    for row in metadata:
+        file_messages = [message for message in messages if message["reference"] == row["reference"]]
+        progress = [message["file_upload_progress"] for message in file_messages if "file_upload_progress" in message]
+        assert progress == sorted(progress)
+        assert progress[-1] == 1.0
+        assert any("platform_bucket_url" in message for message in file_messages)
+
+
+def test_application_run_upload_fails_on_missing_file(tmp_path: Path) -> None:
+    """Test that nothing is uploaded if any referenced file is missing."""
+    (tmp_path / "present.tiff").write_bytes(b"slide")
+    metadata = [{"reference": str(tmp_path / "present.tiff")}, {"reference": str(tmp_path / "missing.tiff")}]
+    with (
+        mock.patch.object(ApplicationService, "application_version"),
+        mock.patch("aignostics.application._service.BucketService") as bucket_cls,
+    ):
+        assert not ApplicationService.application_run_upload("app:v1.0.0", metadata, "prefix")
+    bucket_cls.assert_not_called()
+
+
+def test_application_run_upload_skips_unchanged_files(tmp_path: Path) -> None:
+    """Test that files present in the bucket with identical content are reported as uploaded without uploading."""
+    (tmp_path / "unchanged.tiff").write_bytes(b"unchanged")
+    (tmp_path / "changed.tiff").write_bytes(b"changed")
+    metadata = [{"reference": str(tmp_path / "unchanged.tiff")}, {"reference": str(tmp_path / "changed.tiff")}]
+    callback = mock.MagicMock()
+    bucket_service = mock.MagicMock()
+    bucket_service.is_multipart_upload.return_value = False
+    bucket_service.is_object_unchanged.side_effect = lambda path, _: path.name == "unchanged.tiff"
+    with (
+        mock.patch.object(ApplicationService, "application_version"),
+        mock.patch("aignostics.application._service.BucketService", return_value=bucket_service),
+        mock.patch("requests.Session.put", side_effect=lambda url, data, **_: b"".join(data) and mock.MagicMock()),
+    ):
+        assert ApplicationService.application_run_upload(
+            "app:v1.0.0", metadata, "prefix", upload_progress_callable=callback, skip_unchanged=True
+        )
+
+    bucket_service.create_signed_upload_url.assert_called_once()
+    assert bucket_service.create_signed_upload_url.call_args.args[0].endswith("/changed.tiff")
+    assert sorted((call.args[0], call.args[1].name) for call in callback.call_args_list) == [
+        (len(b"changed"), "changed.tiff"),
+        (len(b"unchanged"), "unchanged.tiff"),
+    ]
@@ -4,9 +4,11 @@ import json
 import os
 import uuid
 from pathlib import Path
+from unittest import mock
 
 from typer.testing import CliRunner
 
+from aignostics.bucket._service import SyncAction, SyncDirection, SyncOperation, SyncPlan
 from aignostics.cli import cli
 from tests.conftest import normalize_output
 
@@ -96,9 +98,9 @@ def test_cli_bucket_flow(runner: CliRunner, tmpdir) -> None:  # noqa: C901, PLR0
 
     # Verify downloaded files match original files content-wise
     for i, original_file in enumerate(created_files, 1):
-        # Determine the relative path structure
+        # Directory structure of the object keys is preserved
         if i <= 9:
-            downloaded_file = tmpdir / "downloaded" / f"file{i}.txt"
+            downloaded_file = tmpdir / "downloaded" / test_prefix / str(Path(original_file).relative_to(tmpdir))
             assert downloaded_file.exists(), f"Downloaded file {downloaded_file} does not exist"
             # Convert LocalPath to bytes for comparison
             original_content = Path(original_file).read_bytes()
@@ -167,3 +169,42 @@ def test_cli_bucket_info_settings(runner: CliRunner) -> None:
     assert output_data["bucket"]["settings"]["download_signed_url_expiration_seconds"] == 604800
     assert output_data["bucket"]["settings"]["hmac_access_key_id"] == "**********"
     assert output_data["bucket"]["settings"]["hmac_secret_access_key"] == "**********"  # noqa: S105
+
+
+def test_cli_bucket_sync_dry_run_prints_plan(runner: CliRunner, tmp_path: Path) -> None:
+    """Check bucket sync in dry run prints the transfer plan without transferring anything."""
+    plan = SyncPlan(
+        direction=SyncDirection.UPLOAD,
+        local_directory=tmp_path,
+        prefix="user/project",
+        operations=[
+            SyncOperation(
+                action=SyncAction.UPLOAD,
+                object_key="user/project/slide.svs",
+                local_path=tmp_path / "slide.svs",
+                size=2_000_000,
+                reason="missing",
+            ),
+            SyncOperation(
+                action=SyncAction.DELETE_OBJECT,
+                object_key="user/project/old.svs",
+                local_path=tmp_path / "old.svs",
+                size=1000,
+                reason="extra",
+            ),
+        ],
+        unchanged_count=3,
+    )
+    with (
+        mock.patch("aignostics.bucket._cli.Service.plan_sync", return_value=plan) as plan_sync,
+        mock.patch("aignostics.bucket._cli.Service.sync") as sync,
+    ):
+        result = runner.invoke(cli, ["bucket", "sync", str(tmp_path), "user/project", "--delete", "--dry-run"])
+
+    assert result.exit_code == 0
+    plan_sync.assert_called_once_with(tmp_path, "user/project", SyncDirection.UPLOAD, True, True)
+    sync.assert_not_called()
+    output = normalize_output(result.stdout)
+    assert "upload        user/project/slide.svs (2.0 MB, missing)" in output
+    assert "delete object user/project/old.svs (1.0 kB, extra)" in output
+    assert "Plan: 1 to upload (2.0 MB), 1 to delete, 3 unchanged" in output
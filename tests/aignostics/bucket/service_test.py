@@ -1,8 +1,33 @@
 """Tests of the bucket service."""
 
+import hashlib
+import json
+import time
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
 from unittest import mock
+from urllib.parse import parse_qs, urlparse
 
-from aignostics.bucket._service import Service
+import pytest
+import requests
+from botocore.exceptions import ClientError
+from pydantic import SecretStr
+
+from aignostics.bucket._service import (
+    DownloadProgress,
+    MultipartUploadJournal,
+    Service,
+    SigV4Presigner,
+    SyncAction,
+    SyncDirection,
+    _get_literal_prefix,
+    _get_multipart_part_sizes,
+)
+from aignostics.utils import FileIdentity, calculate_file_checksums, get_logger
+
+log = get_logger(__name__)
 
 
 @mock.patch("aignostics.bucket._service.Service._get_s3_client")
@@ -53,3 +78,598 @@ def test_create_signed_download_url_expires_in_7_days(mock_get_s3_client: mock.M
         ExpiresIn=604800,  # 7 days in seconds
     )
     assert result == "https://example.com/signed-download-url"
+
+
+@mock.patch.dict("aignostics.bucket._service._s3_clients", clear=True)
+@mock.patch("boto3.Session")
+def test_get_s3_client_is_cached_per_endpoint_and_credentials(mock_session: mock.MagicMock) -> None:
+    """Test that S3 clients are created once per endpoint and credentials and shared across service instances."""
+    mock_session.return_value.client.side_effect = lambda *_, **__: mock.MagicMock()
+    service = Service()
+
+    first = service._get_s3_client()
+    assert service._get_s3_client() is first
+    assert Service()._get_s3_client() is first
+    assert service._get_s3_client("https://other.example.com") is not first
+    other_credentials = Service()
+    other_credentials._settings.hmac_secret_access_key = SecretStr("other-secret")
+    assert other_credentials._get_s3_client() is not first
+    assert mock_session.return_value.client.call_count == 3
+
+
+@pytest.mark.parametrize("object_key", ["plain/key.dcm", "a b/\u00fc+~x.svs", "user/1/a&b=c?.tiff", "x//y", "*;(),!'"])
+@pytest.mark.parametrize(("method", "client_method"), [("GET", "get_object"), ("PUT", "put_object")])
+def test_sigv4_presigner_matches_boto3(object_key: str, method: str, client_method: str) -> None:
+    """Test that locally presigned URLs are identical to URLs presigned by Boto3."""
+    service = Service()
+    expected = service._get_s3_client().generate_presigned_url(
+        ClientMethod=client_method, Params={"Bucket": "test-bucket", "Key": object_key}, ExpiresIn=3600
+    )
+    signed_at = datetime.strptime(parse_qs(urlparse(expected).query)["X-Amz-Date"][0] + "+0000", "%Y%m%dT%H%M%SZ%z")
+    presigner = SigV4Presigner(
+        access_key_id=service._settings.hmac_access_key_id.get_secret_value(),
+        secret_access_key=service._settings.hmac_secret_access_key.get_secret_value(),
+        region_name=service._settings.region_name,
+        expires_in=3600,
+        now=signed_at,
+    )
+
+    assert presigner.presign(method, "test-bucket", object_key) == expected
+
+
+def test_find_presigns_download_urls_in_bulk() -> None:
+    """Test that find presigns the download URLs of all matches of a page in one bulk call."""
+    s3_client = mock.MagicMock()
+    s3_client.get_paginator.return_value.paginate.return_value = [
+        {"Contents": [{"Key": "a/1", "Size": 1}, {"Key": "b/2", "Size": 2}, {"Key": "a/3", "Size": 3}]}
+    ]
+    service = Service()
+    service._get_s3_client = mock.MagicMock(return_value=s3_client)  # type: ignore[method-assign]
+
+    with mock.patch.object(
+        service, "create_signed_download_urls", side_effect=lambda keys: {key: f"url:{key}" for key in keys}
+    ) as bulk:
+        result = service.find(["a/.*"], include_signed_urls=True)
+
+    bulk.assert_called_once()
+    s3_client.generate_presigned_url.assert_not_called()
+    assert result == [
+        {"key": "a/1", "signed_download_url": "url:a/1"},
+        {"key": "a/3", "signed_download_url": "url:a/3"},
+    ]
+
+
+@pytest.mark.long_running
+def test_presign_throughput() -> None:
+    """Benchmark presigning 10k download URLs with a new client per key, a cached client and in bulk."""
+    object_keys = [f"user/1700000000/application:v1.0.0/slide_{index}.svs" for index in range(10_000)]
+    service = Service()
+    durations: dict[str, float] = {}
+
+    sample = object_keys[:50]
+    start = time.perf_counter()
+    for object_key in sample:
+        with mock.patch.dict("aignostics.bucket._service._s3_clients", clear=True):
+            service.create_signed_download_url(object_key)
+    durations["new client per key (extrapolated)"] = (time.perf_counter() - start) * len(object_keys) / len(sample)
+
+    start = time.perf_counter()
+    for object_key in object_keys:
+        service.create_signed_download_url(object_key)
+    durations["cached client"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    signed_urls = service.create_signed_download_urls(object_keys)
+    durations["bulk"] = time.perf_counter() - start
+
+    assert len(signed_urls) == len(object_keys)
+    for variant, seconds in durations.items():
+        log.info("Presigning %d keys with %s: %.3fs", len(object_keys), variant, seconds)
+    assert durations["bulk"] < durations["cached client"]
+
+
+def _multipart_service(s3_client: mock.MagicMock) -> Service:
+    service = Service()
+    service._settings.multipart_upload_part_size = 4
+    service._settings.multipart_upload_concurrency = 2
+    service._settings.multipart_upload_part_attempts = 2
+    service._get_s3_client = mock.MagicMock(return_value=s3_client)  # type: ignore[method-assign]
+    return service
+
+
+@mock.patch("aignostics.bucket._service.get_user_data_directory")
+def test_upload_file_multipart_resumes_from_committed_parts(get_dir: mock.MagicMock, tmp_path: Path) -> None:
+    """Test that an interrupted multipart upload only uploads parts not committed in the bucket."""
+    get_dir.return_value = tmp_path
+    source = tmp_path / "slide.svs"
+    source.write_bytes(b"0123456789")
+    s3_client = mock.MagicMock()
+    s3_client.get_paginator.return_value.paginate.return_value = [
+        {"Parts": [{"PartNumber": 1, "ETag": "etag-1"}, {"PartNumber": 2, "ETag": "etag-other"}]}
+    ]
+    s3_client.upload_part.side_effect = lambda **kwargs: {"ETag": f"etag-{kwargs['PartNumber']}-new"}
+    service = _multipart_service(s3_client)
+    journal_path = MultipartUploadJournal.path_for("test-bucket", "key")
+    MultipartUploadJournal(
+        bucket_name="test-bucket",
+        object_key="key",
+        source=FileIdentity.of(source),
+        upload_id="upload-id",
+        part_size=4,
+        parts={1: "etag-1", 2: "etag-stale"},
+    ).save(journal_path)
+    callback = mock.MagicMock()
+
+    service.upload_file_multipart(source, "key", callback, bucket_name="test-bucket")
+
+    s3_client.create_multipart_upload.assert_not_called()
+    assert sorted(call.kwargs["PartNumber"] for call in s3_client.upload_part.call_args_list) == [2, 3]
+    assert {call.kwargs["PartNumber"]: call.kwargs["Body"] for call in s3_client.upload_part.call_args_list} == {
+        2: b"4567",
+        3: b"89",
+    }
+    s3_client.complete_multipart_upload.assert_called_once_with(
+        Bucket="test-bucket",
+        Key="key",
+        UploadId="upload-id",
+        MultipartUpload={
+            "Parts": [
+                {"PartNumber": 1, "ETag": "etag-1"},
+                {"PartNumber": 2, "ETag": "etag-2-new"},
+                {"PartNumber": 3, "ETag": "etag-3-new"},
+            ]
+        },
+    )
+    assert sum(call.args[0] for call in callback.call_args_list) == 10
+    assert not journal_path.exists()
+
+
+@mock.patch("aignostics.bucket._service.time.sleep")
+@mock.patch("aignostics.bucket._service.get_user_data_directory")
+def test_upload_file_multipart_retries_parts_and_keeps_journal(
+    get_dir: mock.MagicMock, sleep: mock.MagicMock, tmp_path: Path
+) -> None:
+    """Test that failed parts are retried and committed parts stay journaled if the upload fails."""
+    get_dir.return_value = tmp_path
+    source = tmp_path / "slide.svs"
+    source.write_bytes(b"01234567")
+    error = ClientError({"Error": {"Code": "SlowDown"}}, "UploadPart")
+    s3_client = mock.MagicMock()
+    s3_client.create_multipart_upload.return_value = {"UploadId": "upload-id"}
+
+    def upload_part(**kwargs: object) -> dict[str, str]:
+        if kwargs["PartNumber"] == 1:
+            return {"ETag": "etag-1"}
+        raise error
+
+    s3_client.upload_part.side_effect = upload_part
+    service = _multipart_service(s3_client)
+
+    with pytest.raises(ClientError):
+        service.upload_file_multipart(source, "key", bucket_name="test-bucket")
+
+    assert [call.kwargs["PartNumber"] for call in s3_client.upload_part.call_args_list].count(2) == 2
+    sleep.assert_called_once()
+    s3_client.complete_multipart_upload.assert_not_called()
+    journal = MultipartUploadJournal.load(
+        MultipartUploadJournal.path_for("test-bucket", "key"), "test-bucket", "key", FileIdentity.of(source)
+    )
+    assert journal is not None
+    assert journal.parts == {1: "etag-1"}
+
+
+@pytest.mark.parametrize(
+    ("head_response", "expected_unchanged"),
+    [
+        (
+            {
+                "ContentLength": 8,
+                "ETag": '"etag-1"',
+                "ResponseMetadata": {"HTTPHeaders": {"x-goog-hash": "crc32c={crc}"}},
+            },
+            True,
+        ),
+        ({"ContentLength": 8, "ETag": '"{md5}"'}, True),
+        (
+            {
+                "ContentLength": 8,
+                "ETag": '"{md5}"',
+                "ResponseMetadata": {"HTTPHeaders": {"x-goog-hash": "crc32c=AAAAAA=="}},
+            },
+            False,
+        ),
+        ({"ContentLength": 9, "ETag": '"{md5}"'}, False),
+        ({"ContentLength": 8, "ETag": '"{md5}-2"'}, False),
+        (None, False),
+    ],
+)
+def test_is_object_unchanged_compares_size_and_checksum(
+    tmp_path: Path, head_response: dict[str, Any] | None, expected_unchanged: bool
+) -> None:
+    """Test that remote objects are compared by size, then CRC32C from x-goog-hash, then MD5 from the ETag."""
+    source = tmp_path / "slide.svs"
+    source.write_bytes(b"01234567")
+    checksums = calculate_file_checksums(source, md5=True)
+    s3_client = mock.MagicMock()
+    if head_response is None:
+        s3_client.head_object.side_effect = ClientError({"Error": {"Code": "404"}}, "HeadObject")
+    else:
+        s3_client.head_object.return_value = json.loads(
+            json.dumps(head_response).replace("{crc}", checksums.crc32c_base64).replace("{md5}", str(checksums.md5_hex))
+        )
+    service = Service()
+    service._get_s3_client = mock.MagicMock(return_value=s3_client)  # type: ignore[method-assign]
+
+    assert service.is_object_unchanged(source, "key") is expected_unchanged
+
+
+@pytest.mark.parametrize(
+    ("pattern", "expected_prefix"),
+    [
+        (".*", ""),
+        ("user/1700000000/.*", "user/1700000000/"),
+        ("^user/17\\.0/slide", "user/17.0/slide"),
+        ("user/slide?", "user/slid"),
+        ("user/a+", "user/a"),
+        ("user/[ab]", "user/"),
+        ("user/\\d+", "user/"),
+        ("user/a|other/b", ""),
+        ("(?i)user/", ""),
+    ],
+)
+def test_get_literal_prefix(pattern: str, expected_prefix: str) -> None:
+    """Test that the literal prefix of a pattern is a prefix of every key the pattern matches."""
+    assert _get_literal_prefix(pattern) == expected_prefix
+
+
+def test_find_lists_only_literal_prefixes_concurrently() -> None:
+    """Test that find lists the covering prefixes of patterns concurrently and yields matches in key order."""
+    listings = {
+        "a/": [{"Contents": [{"Key": "a/1"}, {"Key": "a/x"}]}, {"Contents": [{"Key": "a/3"}]}],
+        "b/x": [{"Contents": [{"Key": "b/x1"}]}],
+    }
+    s3_client = mock.MagicMock()
+    s3_client.get_paginator.return_value.paginate.side_effect = lambda Bucket, Prefix: listings[Prefix]  # noqa: N803
+    service = Service()
+    service._get_s3_client = mock.MagicMock(return_value=s3_client)  # type: ignore[method-assign]
+
+    result = service.find(["b/x.*", "a/\\d", "a/1"])
+
+    assert sorted(call.kwargs["Prefix"] for call in s3_client.get_paginator.return_value.paginate.call_args_list) == [
+        "a/",
+        "b/x",
+    ]
+    assert result == ["a/1", "a/3", "b/x1"]
+
+
+def test_find_iter_bounds_pages_buffered_per_prefix() -> None:
+    """Test that listings of later prefixes wait for the consumer instead of buffering all their pages."""
+    from aignostics.bucket._service import FIND_LISTING_BUFFERED_PAGES
+
+    fetched_pages = {"a/": 0, "b/": 0}
+
+    def paginate(Bucket: str, Prefix: str) -> Iterator[dict[str, Any]]:  # noqa: N803
+        for page in range(100):
+            fetched_pages[Prefix] += 1
+            yield {"Contents": [{"Key": f"{Prefix}{page:03d}"}]}
+
+    s3_client = mock.MagicMock()
+    s3_client.get_paginator.return_value.paginate.side_effect = paginate
+    service = Service()
+    service._get_s3_client = mock.MagicMock(return_value=s3_client)  # type: ignore[method-assign]
+
+    keys = service.find_iter(["a/.*", "b/.*"])
+    assert [next(keys) for _ in range(50)][-1] == "a/049"
+    time.sleep(0.2)
+
+    # The pending listing buffered a full queue, holds one page it waits to put, and fetches no further
+    assert fetched_pages["b/"] <= FIND_LISTING_BUFFERED_PAGES + 1
+    keys.close()
+
+
+def test_find_looks_up_exact_keys_with_head_requests() -> None:
+    """Test that find looks up exact keys without listing the bucket, skipping missing keys."""
+    s3_client = mock.MagicMock()
+
+    def head_object(Bucket: str, Key: str) -> dict[str, Any]:  # noqa: N803
+        if Key == "missing":
+            raise ClientError({"Error": {"Code": "404"}}, "HeadObject")
+        return {"ContentLength": 3, "ETag": '"etag"'}
+
+    s3_client.head_object.side_effect = head_object
+    service = Service()
+    service._get_s3_client = mock.MagicMock(return_value=s3_client)  # type: ignore[method-assign]
+
+    result = service.find([f"{service._settings.name}/a/1", "missing", "b/2"], what_is_key=True, detail=True)
+
+    s3_client.get_paginator.assert_not_called()
+    assert [(item["key"], item["size"], item["etag"]) for item in result] == [("a/1", 3, "etag"), ("b/2", 3, "etag")]
+
+
+def test_download_objects_concurrently_preserving_structure(tmp_path: Path) -> None:
+    """Test that objects are downloaded concurrently below their keys without HEAD requests, aggregating progress."""
+    contents = {"prefix/a.txt": b"a" * 10, "prefix/dir/b.txt": b"b" * 20, "prefix/dir/sub/a.txt": b"c" * 30}
+    found = [
+        {"key": key, "size": len(content), "etag": "", "signed_download_url": f"https://signed/{key}"}
+        for key, content in contents.items()
+    ]
+    found.append({"key": "../escape.txt", "size": 1, "etag": "", "signed_download_url": "https://signed/escape"})
+
+    def get(url: str, **_: object) -> mock.MagicMock:
+        response = mock.MagicMock()
+        content = contents[url.removeprefix("https://signed/")]
+        response.iter_content.return_value = [content[:5], content[5:]]
+        return response
+
+    progress_updates: list[DownloadProgress] = []
+    service = Service()
+    service._settings.download_concurrency = 3
+    with (
+        mock.patch.object(service, "find_iter", return_value=iter(found)),
+        mock.patch("requests.Session.get", side_effect=get),
+        mock.patch("requests.Session.head") as head,
+    ):
+        result = service.download(["prefix/.*"], tmp_path, progress_callback=progress_updates.append)
+
+    head.assert_not_called()
+    assert result.downloaded == [tmp_path / key for key in contents]
+    assert result.failed == ["../escape.txt"]
+    for key, content in contents.items():
+        assert (tmp_path / key).read_bytes() == content
+    assert not (tmp_path.parent / "escape.txt").exists()
+    final = progress_updates[-1]
+    assert final.overall_processed == final.overall_total == 4
+    assert final.overall_total_size == 61
+    assert final.overall_downloaded_size == 60
+    assert final.active_file_keys == []
+    assert [update.overall_downloaded_size for update in progress_updates] == sorted(
+        update.overall_downloaded_size for update in progress_updates
+    )
+
+
+@pytest.mark.parametrize(
+    ("size", "part_count", "expected_part_sizes"),
+    [
+        (10, 3, [4]),
+        (100 * 1024 * 1024, 4, [32 * 1024 * 1024, 25 * 1024 * 1024]),
+        (100 * 1024 * 1024, 13, [8 * 1024 * 1024, -(-100 * 1024 * 1024 // 13)]),
+        (10, 0, []),
+    ],
+)
+def test_get_multipart_part_sizes(size: int, part_count: int, expected_part_sizes: list[int]) -> None:
+    """Test that only candidate part sizes splitting the object into the given number of parts are inferred."""
+    assert sorted(_get_multipart_part_sizes(size, part_count, 4)) == sorted(expected_part_sizes)
+
+
+def test_download_skips_up_to_date_files_without_get_requests(tmp_path: Path) -> None:
+    """Test that files matching multipart ETags or the CRC32C of the object are not downloaded again."""
+    contents = {"inferred.svs": b"0123456789", "crc32c.svs": b"abcdefghij", "changed.svs": b"ABCDEFGHIJ"}
+    for key, content in contents.items():
+        (tmp_path / key).write_bytes(content)
+    part_md5s = b"".join(hashlib.md5(b"0123456789"[i : i + 4]).digest() for i in range(0, 10, 4))  # noqa: S324
+    etags = {
+        "inferred.svs": f"{hashlib.md5(part_md5s).hexdigest()}-3",  # noqa: S324
+        "crc32c.svs": f"{'0' * 32}-3",
+        "changed.svs": hashlib.md5(b"changed!!!").hexdigest(),  # noqa: S324
+    }
+    found = [
+        {"key": key, "size": 10, "etag": etags[key], "signed_download_url": f"https://signed/{key}"} for key in contents
+    ]
+    service = Service()
+    service._settings.multipart_upload_part_size = 4
+    service._settings.download_concurrency = 1
+    crc32c = calculate_file_checksums(tmp_path / "crc32c.svs").crc32c_base64
+    with (
+        mock.patch.object(service, "find_iter", return_value=iter(found)),
+        mock.patch.object(
+            service, "get_object_checksums", return_value=mock.MagicMock(size=10, crc32c_base64=crc32c)
+        ) as get_object_checksums,
+        mock.patch("requests.Session.get") as session_get,
+    ):
+        session_get.return_value.iter_content.return_value = [b"changed!!!"]
+        result = service.download(None, tmp_path)
+
+    assert result.downloaded == [tmp_path / key for key in contents]
+    get_object_checksums.assert_called_once_with("crc32c.svs", None)
+    session_get.assert_called_once_with("https://signed/changed.svs", stream=True)
+    assert (tmp_path / "changed.svs").read_bytes() == b"changed!!!"
+
+
+def test_delete_objects_in_concurrent_batches_reporting_failures_per_key() -> None:
+    """Test that keys are deleted in batches of 1000 keys, reporting keys that failed to delete."""
+    object_keys = [f"user/tile_{index}.png" for index in range(2500)]
+    s3_client = mock.MagicMock()
+    s3_client.delete_objects.side_effect = (
+        lambda Bucket, Delete: {  # noqa: N803
+            "Errors": [
+                {"Key": obj["Key"], "Code": "AccessDenied", "Message": "Denied"} for obj in Delete["Objects"][:1]
+            ]
+        }
+    )
+    service = Service()
+    service._get_s3_client = mock.MagicMock(return_value=s3_client)  # type: ignore[method-assign]
+
+    with mock.patch.object(service, "find_iter", return_value=iter(object_keys)):
+        assert service.delete(["user/.*"], dry_run=True) == 2500
+        s3_client.delete_objects.assert_not_called()
+        result = service.delete_objects(object_keys)
+
+    assert sorted(len(call.kwargs["Delete"]["Objects"]) for call in s3_client.delete_objects.call_args_list) == [
+        500,
+        1000,
+        1000,
+    ]
+    s3_client.delete_object.assert_not_called()
+    assert result.failed == dict.fromkeys(
+        ["user/tile_0.png", "user/tile_1000.png", "user/tile_2000.png"], "AccessDenied: Denied"
+    )
+    assert sorted(result.deleted) == sorted(set(object_keys) - result.failed.keys())
+
+
+def test_delete_objects_reports_keys_of_failed_batches() -> None:
+    """Test that a batch request failing as a whole fails the keys of that batch only."""
+    object_keys = [f"user/tile_{index}.png" for index in range(2500)]
+    s3_client = mock.MagicMock()
+
+    def delete_objects(Bucket: str, Delete: dict[str, Any]) -> dict[str, Any]:  # noqa: N803
+        if Delete["Objects"][0]["Key"] == "user/tile_1000.png":
+            raise ClientError({"Error": {"Code": "SlowDown", "Message": "Reduce your request rate"}}, "DeleteObjects")
+        return {}
+
+    s3_client.delete_objects.side_effect = delete_objects
+    service = Service()
+    service._get_s3_client = mock.MagicMock(return_value=s3_client)  # type: ignore[method-assign]
+
+    result = service.delete_objects(object_keys)
+
+    assert result.failed == dict.fromkeys(object_keys[1000:2000], "SlowDown: Reduce your request rate")
+    assert sorted(result.deleted) == sorted(object_keys[:1000] + object_keys[2000:])
+    s3_client.delete_object.assert_not_called()
+
+
+def test_delete_objects_falls_back_to_single_deletes() -> None:
+    """Test that objects are deleted one by one if the bucket does not support deleting multiple objects."""
+    s3_client = mock.MagicMock()
+    s3_client.delete_objects.side_effect = ClientError({"Error": {"Code": "NotImplemented"}}, "DeleteObjects")
+
+    def delete_object(Bucket: str, Key: str) -> dict[str, Any]:  # noqa: N803
+        if Key == "b":
+            raise ClientError({"Error": {"Code": "NoSuchKey"}}, "DeleteObject")
+        return {}
+
+    s3_client.delete_object.side_effect = delete_object
+    service = Service()
+    service._get_s3_client = mock.MagicMock(return_value=s3_client)  # type: ignore[method-assign]
+
+    with mock.patch.object(service, "find_iter", return_value=iter(["a", "b", "c"])):
+        deleted_count = service.delete(None, dry_run=False)
+
+    assert deleted_count == 2
+    s3_client.delete_objects.assert_called_once()
+    assert sorted(call.kwargs["Key"] for call in s3_client.delete_object.call_args_list) == ["a", "b", "c"]
+
+
+def _sync_fixture(tmp_path: Path) -> tuple[Path, list[dict[str, Any]]]:
+    local_directory = tmp_path / "local"
+    (local_directory / "dir").mkdir(parents=True)
+    (local_directory / "same.txt").write_bytes(b"same")
+    (local_directory / "changed.txt").write_bytes(b"local")
+    (local_directory / "dir" / "resized.txt").write_bytes(b"resized")
+    (local_directory / "dir" / "local_only.txt").write_bytes(b"local only")
+    found = [
+        {"key": f"user/project/{relative_path}", "size": size, "etag": etag, "last_modified": datetime.now(tz=UTC)}
+        for relative_path, size, etag in [
+            ("same.txt", 4, "same-etag"),
+            ("changed.txt", 5, "changed-etag"),
+            ("dir/resized.txt", 3, "resized-etag"),
+            ("remote_only.txt", 6, "remote-etag"),
+        ]
+    ]
+    return local_directory, found
+
+
+@pytest.mark.parametrize(
+    ("direction", "expected_operations"),
+    [
+        (
+            SyncDirection.UPLOAD,
+            [
+                (SyncAction.UPLOAD, "user/project/changed.txt", 5, "checksum differs"),
+                (SyncAction.UPLOAD, "user/project/dir/local_only.txt", 10, "missing"),
+                (SyncAction.UPLOAD, "user/project/dir/resized.txt", 7, "size differs"),
+                (SyncAction.DELETE_OBJECT, "user/project/remote_only.txt", 6, "extra"),
+            ],
+        ),
+        (
+            SyncDirection.DOWNLOAD,
+            [
+                (SyncAction.DOWNLOAD, "user/project/changed.txt", 5, "checksum differs"),
+                (SyncAction.DOWNLOAD, "user/project/dir/resized.txt", 3, "size differs"),
+                (SyncAction.DOWNLOAD, "user/project/remote_only.txt", 6, "missing"),
+                (SyncAction.DELETE_FILE, "user/project/dir/local_only.txt", 10, "extra"),
+            ],
+        ),
+    ],
+)
+def test_plan_sync_diffs_local_directory_and_prefix(
+    tmp_path: Path, direction: SyncDirection, expected_operations: list[tuple[SyncAction, str, int, str]]
+) -> None:
+    """Test that only files missing, of different size or checksum are transferred, and extras deleted."""
+    local_directory, found = _sync_fixture(tmp_path)
+    service = Service()
+    with (
+        mock.patch.object(service, "find_iter", return_value=iter(found)) as find_iter,
+        mock.patch.object(
+            service, "_is_file_identical_to_object", side_effect=lambda path, *_: path.name == "same.txt"
+        ) as is_identical,
+    ):
+        plan = service.plan_sync(local_directory, "/user/project/", direction, delete=True)
+
+    find_iter.assert_called_once_with([r"user/project/"], detail=True)
+    assert sorted(call.args[1] for call in is_identical.call_args_list) == [
+        "user/project/changed.txt",
+        "user/project/same.txt",
+    ]
+    assert [
+        (operation.action, operation.object_key, operation.size, operation.reason) for operation in plan.operations
+    ] == expected_operations
+    assert plan.unchanged_count == 1
+    assert plan.delete_count == 1
+    assert plan.transfer_count == 3
+
+
+def test_plan_sync_compares_modification_time_without_checksum(tmp_path: Path) -> None:
+    """Test that files of equal size are only uploaded if modified after the object, if checksums are disabled."""
+    local_directory, found = _sync_fixture(tmp_path)
+    found[0]["last_modified"] = datetime(2000, 1, 1, tzinfo=UTC)
+    service = Service()
+    with (
+        mock.patch.object(service, "find_iter", return_value=iter(found)),
+        mock.patch.object(service, "_is_file_identical_to_object") as is_identical,
+    ):
+        plan = service.plan_sync(local_directory, "user/project", checksum=False)
+
+    is_identical.assert_not_called()
+    assert [(operation.object_key, operation.reason) for operation in plan.operations] == [
+        ("user/project/dir/local_only.txt", "missing"),
+        ("user/project/dir/resized.txt", "size differs"),
+        ("user/project/same.txt", "newer"),
+    ]
+    assert plan.unchanged_count == 1
+
+
+def test_sync_transfers_concurrently_and_deletes_extras(tmp_path: Path) -> None:
+    """Test that a download plan is executed, reporting transferred bytes and failed operations."""
+    local_directory, found = _sync_fixture(tmp_path)
+    service = Service()
+    with (
+        mock.patch.object(service, "find_iter", return_value=iter(found)),
+        mock.patch.object(service, "_is_file_identical_to_object", return_value=False),
+    ):
+        plan = service.plan_sync(local_directory, "user/project", SyncDirection.DOWNLOAD, delete=True)
+
+    def get(url: str, **_: object) -> mock.MagicMock:
+        response = mock.MagicMock()
+        if url.endswith("remote_only.txt"):
+            response.raise_for_status.side_effect = requests.HTTPError("403")
+        response.iter_content.return_value = [url.rsplit("/", 1)[-1].encode()]
+        return response
+
+    transferred: list[int] = []
+    with (
+        mock.patch.object(
+            service,
+            "create_signed_download_urls",
+            side_effect=lambda keys: {key: f"https://signed/{key}" for key in keys},
+        ),
+        mock.patch("requests.Session.get", side_effect=get),
+    ):
+        result = service.sync(plan, transferred.append)
+
+    assert sorted(operation.object_key for operation in result.failed) == ["user/project/remote_only.txt"]
+    assert result.succeeded_count == 4
+    assert (local_directory / "same.txt").read_bytes() == b"same.txt"
+    assert (local_directory / "dir" / "resized.txt").read_bytes() == b"resized.txt"
+    assert not (local_directory / "dir" / "local_only.txt").exists()
+    assert not (local_directory / "remote_only.txt").exists()
+    assert sum(transferred) == len(b"same.txt") + len(b"changed.txt") + len(b"resized.txt")
@@ -0,0 +1,183 @@
+"""Tests for the asynchronous platform client, served by a mocked HTTP transport."""
+
+import asyncio
+import base64
+import json
+import time
+from collections.abc import AsyncIterator, Callable
+from pathlib import Path
+from unittest.mock import patch
+
+import google_crc32c
+import httpx
+import jwt
+import pytest
+from aignx.codegen.models import InputArtifactCreationRequest, ItemCreationRequest, ItemStatus
+
+from aignostics.platform import AsyncApplicationRun, AsyncClient, NotFoundException, TokenProvider, settings
+
+ARTIFACT_CONTENT = b"heatmap"
+ARTIFACT_URL = "https://storage.example.com/heatmap.png"
+APPLICATION_COUNT = 120
+TOKEN = jwt.encode({"exp": int(time.time()) + 3600}, "test-secret-of-sufficient-length-for-hs256", algorithm="HS256")
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+
+def _application(index: int) -> dict[str, object]:
+    return {"application_id": f"app-{index}", "name": f"App {index}", "regulatory_classes": [], "description": ""}
+
+
+def _version() -> dict[str, object]:
+    return {
+        "application_version_id": "app-1:v1.0.0",
+        "version": "1.0.0",
+        "application_id": "app-1",
+        "changelog": "",
+        "input_artifacts": [
+            {
+                "name": "slide",
+                "mime_type": "image/tiff",
+                "metadata_schema": {"type": "object", "required": ["checksum"]},
+            }
+        ],
+        "output_artifacts": [],
+        "created_at": "2025-01-01T00:00:00Z",
+    }
+
+
+def _item_result() -> dict[str, object]:
+    crc32c = base64.b64encode(google_crc32c.Checksum(ARTIFACT_CONTENT).digest()).decode()
+    return {
+        "item_id": "item-1",
+        "application_run_id": "run-1",
+        "reference": "slide-1",
+        "status": ItemStatus.SUCCEEDED.value,
+        "error": None,
+        "output_artifacts": [
+            {
+                "output_artifact_id": "artifact-1",
+                "name": "heatmap",
+                "metadata": {"media_type": "image/png", "checksum_base64_crc32c": crc32c},
+                "download_url": ARTIFACT_URL,
+            }
+        ],
+    }
+
+
+def _handle(request: httpx.Request) -> httpx.Response:  # noqa: PLR0911
+    path = request.url.path.removeprefix(httpx.URL(settings().api_root).path.rstrip("/"))
+    if request.url.host == "storage.example.com":
+        return httpx.Response(200, content=ARTIFACT_CONTENT)
+    if path == "/v1/applications":
+        page, page_size = int(request.url.params["page"]), int(request.url.params["page_size"])
+        indices = range((page - 1) * page_size, min(page * page_size, APPLICATION_COUNT))
+        return httpx.Response(200, json=[_application(index) for index in indices])
+    if path == "/v1/applications/app-1/versions":
+        return httpx.Response(200, json=[_version()])
+    if path == "/v1/runs" and request.method == "POST":
+        return httpx.Response(201, json={"application_run_id": "run-1"})
+    if path == "/v1/runs/run-1":
+        return httpx.Response(
+            200,
+            json={
+                "application_run_id": "run-1",
+                "application_version_id": "app-1:v1.0.0",
+                "organization_id": "org",
+                "status": "COMPLETED",
+                "triggered_at": "2025-01-01T00:00:00Z",
+                "triggered_by": "user",
+            },
+        )
+    if path == "/v1/runs/run-1/results":
+        return httpx.Response(200, json=[_item_result()] if request.url.params["page"] == "1" else [])
+    if path == "/v1/runs/run-1/cancel":
+        return httpx.Response(202, json={})
+    return httpx.Response(404, json={"detail": "Not found"})
+
+
+@pytest.fixture
+async def client_and_requests() -> AsyncIterator[tuple[AsyncClient, list[httpx.Request]]]:
+    """Provide an async client whose requests are served by the mocked transport.
+
+    Yields:
+        tuple[AsyncClient, list[httpx.Request]]: The client and the requests it sent.
+    """
+    requests: list[httpx.Request] = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return _handle(request)
+
+    with (
+        patch("aignostics.platform._token_provider.get_token", return_value=TOKEN),
+        patch("aignostics.platform._client.get_token_provider", return_value=TokenProvider()),
+    ):
+        client = AsyncClient(http_client=httpx.AsyncClient(transport=httpx.MockTransport(handle)))
+    async with client:
+        yield client, requests
+
+
+async def test_async_client_lists_applications_with_maximum_page_size(
+    client_and_requests: tuple[AsyncClient, list[httpx.Request]],
+) -> None:
+    """Test that applications are paginated with the maximum page size and deserialized into models."""
+    client, requests = client_and_requests
+
+    applications = [application async for application in client.applications.list()]
+
+    assert [application.application_id for application in applications] == [
+        f"app-{index}" for index in range(APPLICATION_COUNT)
+    ]
+    assert [(request.url.params["page"], request.url.params["page_size"]) for request in requests] == [
+        ("1", "100"),
+        ("2", "100"),
+    ]
+    assert all(request.headers["Authorization"] == f"Bearer {TOKEN}" for request in requests)
+    assert (await client.application("app-7")).name == "App 7"
+
+
+async def test_async_client_creates_validated_runs(
+    client_and_requests: tuple[AsyncClient, list[httpx.Request]],
+) -> None:
+    """Test that runs are created after validating items against the application version."""
+    client, requests = client_and_requests
+
+    def items(metadata: dict[str, object]) -> list[ItemCreationRequest]:
+        return [
+            ItemCreationRequest(
+                reference="slide-1",
+                input_artifacts=[InputArtifactCreationRequest(name="slide", download_url="url", metadata=metadata)],
+            )
+        ]
+
+    with pytest.raises(ValueError, match="Invalid metadata"):
+        await client.runs.create("app-1:v1.0.0", items({}))
+    run = await client.runs.create("app-1:v1.0.0", items({"checksum": "abc"}))
+
+    assert isinstance(run, AsyncApplicationRun)
+    assert run.application_run_id == "run-1"
+    assert json.loads(requests[-1].content)["items"][0]["reference"] == "slide-1"
+    await run.cancel()
+    assert requests[-1].url.path.endswith("/v1/runs/run-1/cancel")
+    with pytest.raises(NotFoundException):
+        await client.run("run-unknown").details()
+
+
+async def test_async_client_downloads_results_concurrently(
+    client_and_requests: tuple[AsyncClient, list[httpx.Request]], tmp_path: Path
+) -> None:
+    """Test that results of several runs are downloaded concurrently without sending credentials to storage."""
+    client, requests = client_and_requests
+    destinations = [tmp_path / "first", tmp_path / "second"]
+    for destination in destinations:
+        destination.mkdir()
+
+    await asyncio.gather(*(client.run("run-1").download_to_folder(destination) for destination in destinations))
+
+    for destination in destinations:
+        assert (destination / "run-1" / "slide-1" / "heatmap.png").read_bytes() == ARTIFACT_CONTENT
+    downloads = [request for request in requests if request.url == httpx.URL(ARTIFACT_URL)]
+    assert len(downloads) == len(destinations)
+    assert all("Authorization" not in request.headers for request in downloads)
+    assert await client.run("run-1").item_status() == {"slide-1": ItemStatus.SUCCEEDED}
@@ -1,7 +1,9 @@
 """Tests for the authentication module of the Aignostics Python SDK."""
 
+import json
 import socket
 import time
+import typing as t
 import webbrowser
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
@@ -9,6 +11,8 @@ from unittest.mock import MagicMock, patch
 
 import jwt
 import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
 from pydantic import SecretStr
 from requests_oauthlib import OAuth2Session
 
@@ -16,8 +20,10 @@ from aignostics.platform._authentication import (
     _authenticate,
     _can_open_browser,
     _ensure_local_port_is_available,
+    _get_jwk_client,
     _perform_authorization_code_with_pkce_flow,
     _perform_device_flow,
+    _PersistentPyJWKClient,
     get_token,
     remove_cached_token,
     verify_and_decode_token,
@@ -45,6 +51,8 @@ def mock_settings() -> MagicMock:
         settings.device_url = "https://test.auth/device"
         settings.audience = "test-audience"
         settings.jws_json_url = "https://test.auth/.well-known/jwks.json"
+        settings.jwks_cache_ttl_seconds = 3600
+        settings.cache_dir = "mock_cache_dir"
         settings.request_timeout_seconds = 10
         settings.refresh_token = None
         mock_settings.return_value = settings
@@ -231,7 +239,7 @@ class TestVerifyAndDecodeToken:
         mock_jwt_client.get_signing_key_from_jwt.return_value = mock_signing_key
 
         with (
-            patch("jwt.PyJWKClient", return_value=mock_jwt_client),
+            patch("aignostics.platform._authentication._get_jwk_client", return_value=mock_jwt_client),
             patch("jwt.get_unverified_header", return_value={"alg": "RS256"}),
             patch("jwt.decode", return_value={"sub": "user-id", "exp": int(time.time()) + 3600}),
         ):
@@ -243,7 +251,7 @@ class TestVerifyAndDecodeToken:
     def test_verify_and_decode_invalid_token() -> None:
         """Test that an invalid token raises an appropriate error."""
         with (
-            patch("jwt.PyJWKClient"),
+            patch("aignostics.platform._authentication._get_jwk_client"),
             patch("jwt.get_unverified_header"),
             patch("jwt.decode", side_effect=jwt.exceptions.PyJWTError("Invalid token")),
             pytest.raises(RuntimeError, match=AUTHENTICATION_FAILED),
@@ -251,6 +259,89 @@ class TestVerifyAndDecodeToken:
             verify_and_decode_token("invalid.token")
 
 
+class TestJwkCache:
+    """Test cases for caching the JWS key set used to verify tokens."""
+
+    @staticmethod
+    def _jwk_set_and_token(kid: str) -> tuple[dict[str, t.Any], str]:
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        jwk = {**RSAAlgorithm.to_jwk(private_key.public_key(), as_dict=True), "kid": kid, "use": "sig"}
+        token = jwt.encode({"sub": "user-id"}, private_key, algorithm="RS256", headers={"kid": kid})
+        return {"keys": [jwk]}, token
+
+    @staticmethod
+    def test_jwk_set_is_persisted_and_refetched_for_unknown_keys(tmp_path: Path) -> None:
+        """Test that the key set is fetched once across clients, and again for tokens signed with unknown keys."""
+        jwk_set, token = TestJwkCache._jwk_set_and_token("key-1")
+        rotated_jwk_set, rotated_token = TestJwkCache._jwk_set_and_token("key-2")
+        cache_file = tmp_path / ".jwks"
+
+        with patch.object(jwt.PyJWKClient, "fetch_data", side_effect=[jwk_set, rotated_jwk_set]) as fetch_data:
+            first = _PersistentPyJWKClient("https://test.auth/.well-known/jwks.json", cache_file, lifespan=60)
+            assert first.get_signing_key_from_jwt(token).key_id == "key-1"
+            second = _PersistentPyJWKClient("https://test.auth/.well-known/jwks.json", cache_file, lifespan=60)
+            assert second.get_signing_key_from_jwt(token).key_id == "key-1"
+            assert fetch_data.call_count == 1
+
+            assert second.get_signing_key_from_jwt(rotated_token).key_id == "key-2"
+            assert fetch_data.call_count == 2
+
+        assert json.loads(cache_file.read_text(encoding="utf-8"))["jwk_set"] == rotated_jwk_set
+
+    @staticmethod
+    def test_jwk_set_cache_file_expires_and_is_bound_to_url(tmp_path: Path) -> None:
+        """Test that expired key sets, or key sets of another URL, are fetched again."""
+        jwk_set, token = TestJwkCache._jwk_set_and_token("key-1")
+        cache_file = tmp_path / ".jwks"
+        cache_file.write_text(
+            json.dumps({"uri": "https://other.auth/.well-known/jwks.json", "fetched_at": time.time(), "jwk_set": {}}),
+            encoding="utf-8",
+        )
+
+        with patch.object(jwt.PyJWKClient, "fetch_data", return_value=jwk_set) as fetch_data:
+            _PersistentPyJWKClient("https://test.auth/.well-known/jwks.json", cache_file, 60).get_signing_key_from_jwt(
+                token
+            )
+            with patch("aignostics.platform._authentication.time.time", return_value=time.time() + 120):
+                _PersistentPyJWKClient(
+                    "https://test.auth/.well-known/jwks.json", cache_file, 60
+                ).get_signing_key_from_jwt(token)
+
+        assert fetch_data.call_count == 2
+
+    @staticmethod
+    def test_jwk_set_loaded_from_cache_file_expires_with_its_age(tmp_path: Path) -> None:
+        """Test that a key set loaded from the cache file is only trusted for the remainder of its time to live."""
+        jwk_set, token = TestJwkCache._jwk_set_and_token("key-1")
+        cache_file = tmp_path / ".jwks"
+        uri = "https://test.auth/.well-known/jwks.json"
+        cache_file.write_text(
+            json.dumps({"uri": uri, "fetched_at": time.time() - 50, "jwk_set": jwk_set}), encoding="utf-8"
+        )
+
+        with patch.object(jwt.PyJWKClient, "fetch_data", return_value=jwk_set) as fetch_data:
+            client = _PersistentPyJWKClient(uri, cache_file, lifespan=60)
+            assert client.get_signing_key_from_jwt(token).key_id == "key-1"
+            assert fetch_data.call_count == 0
+
+            with (
+                patch("aignostics.platform._authentication.time.time", return_value=time.time() + 20),
+                patch("aignostics.platform._authentication.time.monotonic", return_value=time.monotonic() + 20),
+            ):
+                assert client.get_signing_key_from_jwt(token).key_id == "key-1"
+            assert fetch_data.call_count == 1
+
+    @staticmethod
+    def test_jwk_client_is_shared_per_url(mock_settings, tmp_path: Path) -> None:
+        """Test that the JWK client is shared for the configured URL."""
+        mock_settings.return_value.cache_dir = str(tmp_path)
+        mock_settings.return_value.jwks_cache_ttl_seconds = 60
+        with patch("aignostics.platform._authentication._jwk_clients", {}):
+            client = _get_jwk_client()
+            assert _get_jwk_client() is client
+            assert client.uri == "https://test.auth/.well-known/jwks.json"
+
+
 class TestBrowserCapabilityCheck:
     """Test cases for the browser capability check functionality."""
 
@@ -0,0 +1,60 @@
+"""Tests for the cache of application catalog lookups."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+from aignx.codegen.models import ApplicationReadResponse
+
+from aignostics.platform import CatalogCache, get_catalog_cache, invalidate_catalog_cache
+
+
+def _application(application_id: str) -> ApplicationReadResponse:
+    return ApplicationReadResponse(
+        application_id=application_id, name=application_id, regulatory_classes=[], description=""
+    )
+
+
+def test_catalog_cache_expires_entries() -> None:
+    """Test that entries are served until their time to live passed."""
+    cache = CatalogCache(ttl_seconds=10)
+    cache.put("applications", [_application("he-tme")])
+
+    assert cache.get("applications", ApplicationReadResponse) == [_application("he-tme")]
+    with patch("aignostics.platform._catalog_cache.time.time", return_value=float("inf")):
+        assert cache.get("applications", ApplicationReadResponse) is None
+    assert cache.get("versions:he-tme", ApplicationReadResponse) is None
+
+
+def test_catalog_cache_persists_and_invalidates_by_prefix(tmp_path: Path) -> None:
+    """Test that persisted entries are shared across instances and invalidated by key prefix."""
+    writer = CatalogCache(ttl_seconds=10, directory=tmp_path)
+    writer.put("versions:he-tme", [_application("he-tme")])
+    writer.put("versions:test-app", [_application("test-app")])
+    writer.put("applications", [_application("he-tme")])
+
+    reader = CatalogCache(ttl_seconds=10, directory=tmp_path)
+    assert reader.get("versions:he-tme", ApplicationReadResponse) == [_application("he-tme")]
+
+    assert reader.invalidate("versions:") == 2
+    assert writer.get("applications", ApplicationReadResponse) == [_application("he-tme")]
+    assert CatalogCache(ttl_seconds=10, directory=tmp_path).get("versions:test-app", ApplicationReadResponse) is None
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+
+def test_get_catalog_cache_is_shared_per_api_root_and_can_be_disabled(monkeypatch, tmp_path: Path) -> None:
+    """Test that one cache is kept per API root, persisted on request, and none returned if disabled."""
+    monkeypatch.setenv("AIGNOSTICS_CATALOG_CACHE_PERSISTENT", "true")
+    with (
+        patch("aignostics.platform._catalog_cache._catalog_caches", {}),
+        patch("aignostics.platform._catalog_cache.get_user_data_directory", return_value=tmp_path),
+    ):
+        cache = get_catalog_cache("https://platform.example.com")
+        assert cache is not None
+        assert get_catalog_cache("https://platform.example.com") is cache
+        assert get_catalog_cache("https://staging.example.com") is not cache
+        cache.put("applications", [_application("he-tme")])
+        assert invalidate_catalog_cache() == 1
+        assert cache.get("applications", ApplicationReadResponse) is None
+
+        monkeypatch.setenv("AIGNOSTICS_CATALOG_CACHE_ENABLED", "false")
+        assert get_catalog_cache("https://platform.example.com") is None
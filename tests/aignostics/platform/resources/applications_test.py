@@ -11,6 +11,7 @@ from aignx.codegen.api.public_api import PublicApi
 from aignx.codegen.models import ApplicationVersionReadResponse
 from aignx.codegen.models.application_read_response import ApplicationReadResponse
 
+from aignostics.platform import CatalogCache
 from aignostics.platform.resources.applications import Applications, Versions
 from aignostics.platform.resources.utils import PAGE_SIZE
 
@@ -253,3 +254,31 @@ def test_versions_list_passes_through_api_exception(mock_api) -> None:
     # Act & Assert
     with pytest.raises(Exception, match=API_ERROR):
         list(versions.list(application=mock_app))
+
+
+def test_versions_details_are_cached(mock_api) -> None:
+    """Test that Versions.details() only queries the API once if a catalog cache is given.
+
+    Args:
+        mock_api: Mock ExternalsApi instance.
+    """
+    # Arrange
+    version = ApplicationVersionReadResponse(
+        application_version_id="test-app:v1.0.0",
+        version="1.0.0",
+        application_id="test-app",
+        changelog="",
+        input_artifacts=[],
+        output_artifacts=[],
+        created_at="2025-01-01T00:00:00Z",
+    )
+    mock_api.list_versions_by_application_id_v1_applications_application_id_versions_get.return_value = [version]
+    cache = CatalogCache(ttl_seconds=60)
+
+    # Act
+    results = [Versions(mock_api, cache).details("test-app:v1.0.0") for _ in range(2)]
+
+    # Assert
+    assert results == [version, version]
+    mock_api.list_versions_by_application_id_v1_applications_application_id_versions_get.assert_called_once()
+    assert cache.invalidate("version:") == 1
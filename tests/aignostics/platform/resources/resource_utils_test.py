@@ -4,9 +4,88 @@ This module contains unit tests for the utility functions, particularly focusing
 on pagination functionality that is used across resource modules.
 """
 
+import asyncio
+import json
+import threading
+import time
 from unittest.mock import Mock
 
-from aignostics.platform.resources.utils import PAGE_SIZE, paginate
+import pytest
+import urllib3
+from aignx.codegen.api.public_api import PublicApi
+from aignx.codegen.api_client import ApiClient
+from aignx.codegen.configuration import Configuration
+from aignx.codegen.exceptions import NotFoundException
+from aignx.codegen.models import ItemResultReadResponse
+from aignx.codegen.rest import RESTResponse
+
+from aignostics.platform.resources.utils import (
+    PAGE_SIZE,
+    async_paginate,
+    deserialize_list,
+    get_max_page_size,
+    paginate,
+    with_fast_deserialization,
+)
+from aignostics.utils import get_logger
+
+log = get_logger(__name__)
+
+BENCHMARK_PAGE_COUNT = 50
+
+
+def _results_page(item_count: int = 100, artifact_count: int = 10) -> bytes:
+    """Build a page of item results shaped like a response of the results endpoint.
+
+    Args:
+        item_count (int): The number of items in the page.
+        artifact_count (int): The number of output artifacts per item.
+
+    Returns:
+        bytes: The page as JSON.
+    """
+    return json.dumps([
+        {
+            "item_id": f"item-{item}",
+            "application_run_id": "run-1",
+            "reference": f"slides/slide_{item}.svs",
+            "status": "SUCCEEDED",
+            "error": None,
+            "output_artifacts": [
+                {
+                    "output_artifact_id": f"artifact-{item}-{artifact}",
+                    "name": f"tissue_qc:geojson_polygons_{artifact}",
+                    "metadata": {
+                        "media_type": "application/geo+json",
+                        "checksum_base64_crc32c": "AAAAAA==",
+                        "schema": {"type": "object", "properties": {"features": {"type": "array"}}},
+                    },
+                    "download_url": f"https://storage.example.com/run-1/item-{item}/artifact-{artifact}?sig=abc",
+                }
+                for artifact in range(artifact_count)
+            ],
+        }
+        for item in range(item_count)
+    ]).encode()
+
+
+def _public_api_responding(status: int, body: bytes) -> PublicApi:
+    """Create a generated API client whose requests are answered with the given response.
+
+    Args:
+        status (int): The status code of the response.
+        body (bytes): The body of the response.
+
+    Returns:
+        PublicApi: The API client.
+    """
+    api = PublicApi(ApiClient(Configuration(host="https://platform.example.com")))
+    api.api_client.rest_client.request = Mock(  # type: ignore[method-assign]
+        side_effect=lambda *_, **__: RESTResponse(
+            urllib3.HTTPResponse(body=body, status=status, headers={"Content-Type": "application/json"})
+        )
+    )
+    return api
 
 
 def test_paginate_stops_when_results_less_than_page_size() -> None:
@@ -115,3 +194,133 @@ def test_paginate_multiple_pages() -> None:
     assert results[0] == "page1_item_0"
     assert results[PAGE_SIZE] == "page2_item_0"
     assert results[2 * PAGE_SIZE] == "page3_item_0"
+
+
+def test_get_max_page_size_reads_upper_bound_of_endpoint() -> None:
+    """Test that the maximum page size is read from the page_size annotation of the endpoint."""
+    api = PublicApi.__new__(PublicApi)
+
+    assert get_max_page_size(api.list_applications_v1_applications_get) == 100
+    assert get_max_page_size(api.list_run_results_v1_runs_application_run_id_results_get) == 100
+    assert get_max_page_size(Mock()) == PAGE_SIZE
+
+
+def test_paginate_prefetches_next_page_while_current_is_consumed() -> None:
+    """Test that the next page is fetched before the items of the current page are consumed."""
+    requested_pages: list[int] = []
+    second_page_requested = threading.Event()
+
+    def list_items(page: int, page_size: int) -> list[str]:
+        requested_pages.append(page)
+        if page == 2:
+            second_page_requested.set()
+        return [f"page{page}_item_{i}" for i in range(page_size if page < 3 else 1)]
+
+    items = paginate(list_items, page_size=5)
+    assert next(items) == "page1_item_0"
+    assert second_page_requested.wait(timeout=5)
+
+    assert len([next(items), *items]) == 10
+    assert requested_pages == [1, 2, 3]
+
+
+def test_paginate_without_prefetch_fetches_pages_on_demand() -> None:
+    """Test that no page is fetched ahead if prefetching is disabled."""
+    mock_func = Mock(side_effect=[[f"item_{i}" for i in range(5)], []])
+
+    items = paginate(mock_func, page_size=5, prefetch=False)
+    assert [next(items) for _ in range(5)] == [f"item_{i}" for i in range(5)]
+    assert mock_func.call_count == 1
+
+    assert list(items) == []
+    assert mock_func.call_count == 2
+
+
+def test_paginate_fetches_pages_concurrently_if_total_count_known() -> None:
+    """Test that pages covering the known total are fetched concurrently and yielded in order."""
+    barrier = threading.Barrier(3, timeout=5)
+
+    def list_items(page: int, page_size: int) -> list[str]:
+        if page <= 3:
+            barrier.wait()  # Blocks unless the first three pages are fetched concurrently
+        return [f"page{page}_item_{i}" for i in range(page_size if page < 4 else 2)]
+
+    results = list(paginate(list_items, page_size=5, total_count=17, concurrency=3))
+
+    assert results == [f"page{page}_item_{i}" for page in range(1, 5) for i in range(5 if page < 4 else 2)]
+
+
+async def test_async_paginate_fetches_pages_concurrently_if_total_count_known() -> None:
+    """Test that async pagination fetches the pages covering the known total concurrently, in order."""
+    in_flight = 0
+    max_in_flight = 0
+
+    async def list_items(page: int, page_size: int) -> list[str]:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01 * (4 - page))  # Later pages complete first
+        in_flight -= 1
+        return [f"page{page}_item_{i}" for i in range(page_size if page < 3 else 2)]
+
+    results = [item async for item in async_paginate(list_items, page_size=5, total_count=12, concurrency=3)]
+
+    assert results == [f"page{page}_item_{i}" for page in range(1, 4) for i in range(5 if page < 3 else 2)]
+    assert max_in_flight == 3
+
+
+def test_deserialize_list_matches_generated_client() -> None:
+    """Test that single-pass deserialization yields the same models as the generated client."""
+    page = _results_page(item_count=3, artifact_count=2)
+
+    assert deserialize_list(page, ItemResultReadResponse) == [
+        ItemResultReadResponse.from_dict(element) for element in json.loads(page)
+    ]
+
+
+def test_with_fast_deserialization_wraps_endpoints_of_generated_client() -> None:
+    """Test that endpoints are called via their raw variant, keep their signature, and raise their exceptions."""
+    api = _public_api_responding(200, _results_page(item_count=2, artifact_count=1))
+    endpoint = with_fast_deserialization(
+        api.list_run_results_v1_runs_application_run_id_results_get, ItemResultReadResponse
+    )
+
+    results = endpoint(application_run_id="run-1", page=1, page_size=10)
+
+    assert [result.item_id for result in results] == ["item-0", "item-1"]
+    assert get_max_page_size(endpoint) == 100
+    method, url = api.api_client.rest_client.request.call_args.args  # type: ignore[attr-defined]
+    assert method == "GET"
+    assert url.startswith("https://platform.example.com/v1/runs/run-1/results?")
+
+    with pytest.raises(NotFoundException):
+        with_fast_deserialization(
+            _public_api_responding(404, b'{"detail": "Not found"}').list_applications_v1_applications_get,
+            ItemResultReadResponse,
+        )()
+    mock_endpoint = Mock(spec=PublicApi).list_applications_v1_applications_get
+    assert with_fast_deserialization(mock_endpoint, ItemResultReadResponse) is mock_endpoint
+
+
+@pytest.mark.long_running
+def test_results_page_deserialization_throughput() -> None:
+    """Benchmark fetching pages of 100 item results with 10 artifacts each via the generated client and fast path."""
+    page = _results_page()
+    durations: dict[str, float] = {}
+
+    api = _public_api_responding(200, page)
+    endpoints = {
+        "generated client": api.list_run_results_v1_runs_application_run_id_results_get,
+        "single pass": with_fast_deserialization(
+            api.list_run_results_v1_runs_application_run_id_results_get, ItemResultReadResponse
+        ),
+    }
+    for variant, endpoint in endpoints.items():
+        start = time.perf_counter()
+        for _ in range(BENCHMARK_PAGE_COUNT):
+            endpoint(application_run_id="run-1", page=1, page_size=100)
+        durations[variant] = time.perf_counter() - start
+
+    for variant, seconds in durations.items():
+        log.info("Fetching %d results pages with %s: %.3fs", BENCHMARK_PAGE_COUNT, variant, seconds)
+    assert durations["single pass"] < durations["generated client"]
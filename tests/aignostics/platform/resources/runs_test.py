@@ -4,20 +4,43 @@ This module contains unit tests for the Runs class and ApplicationRun class,
 verifying their functionality for listing, creating, and managing application runs.
 """
 
+import json
+import time
+from pathlib import Path
 from unittest.mock import Mock, call
 
 import pytest
+import urllib3
 from aignx.codegen.api.public_api import PublicApi
+from aignx.codegen.api_client import ApiClient
+from aignx.codegen.configuration import Configuration
 from aignx.codegen.models import (
+    ApplicationVersionReadResponse,
     InputArtifactCreationRequest,
     ItemCreationRequest,
     ItemResultReadResponse,
+    ItemStatus,
     RunCreationResponse,
     RunReadResponse,
 )
-
-from aignostics.platform.resources.runs import ApplicationRun, Runs
+from aignx.codegen.rest import RESTResponse
+from jsonschema.validators import validate
+
+from aignostics.platform.resources.runs import (
+    ITEM_RESULT_POLL_MAX_INTERVAL_SECONDS,
+    ITEM_RESULT_POLL_MIN_INTERVAL_SECONDS,
+    LIST_APPLICATION_RUNS_MAX_PAGE_SIZE,
+    ApplicationRun,
+    InputItemValidator,
+    ItemResultSummary,
+    ItemResultTracker,
+    Runs,
+    RunSubmissionJournal,
+)
 from aignostics.platform.resources.utils import PAGE_SIZE
+from aignostics.utils import get_logger
+
+log = get_logger(__name__)
 
 
 @pytest.fixture
@@ -243,3 +266,282 @@ def test_paginate_with_not_found_exception_after_full_page(runs, mock_api) -> No
         call(page=1, page_size=PAGE_SIZE),
         call(page=2, page_size=PAGE_SIZE),
     ])
+
+
+def _item_result(index: int, status: ItemStatus) -> ItemResultReadResponse:
+    """Create an item result with the given status.
+
+    Args:
+        index: Index of the item.
+        status: Status of the item.
+
+    Returns:
+        ItemResultReadResponse: The item result.
+    """
+    return ItemResultReadResponse(
+        item_id=f"item-{index}",
+        application_run_id="test-run-id",
+        reference=f"slide-{index}.tiff",
+        status=status,
+        error=None,
+        output_artifacts=[],
+    )
+
+
+def test_item_result_tracker_only_polls_unfinished_items(app_run, mock_api) -> None:
+    """Test that the tracker lists all items once and afterwards only pending and newly finished items.
+
+    Args:
+        app_run: ApplicationRun instance with mock API.
+        mock_api: Mock ExternalsApi instance.
+    """
+    list_results = mock_api.list_run_results_v1_runs_application_run_id_results_get
+    list_results.side_effect = [
+        [
+            _item_result(0, ItemStatus.SUCCEEDED),
+            _item_result(1, ItemStatus.PENDING),
+            _item_result(2, ItemStatus.PENDING),
+        ],
+        [_item_result(2, ItemStatus.PENDING)],
+        [_item_result(1, ItemStatus.ERROR_USER)],
+        [_item_result(2, ItemStatus.PENDING)],
+    ]
+    tracker = ItemResultTracker(app_run)
+
+    first = tracker.poll()
+    assert [item.item_id for item in first.finished] == ["item-0"]
+    assert first.pending_count == 2
+    assert first.request_count == 1
+
+    second = tracker.poll()
+    assert [item.item_id for item in second.finished] == ["item-1"]
+    assert second.pending_count == 1
+    assert second.request_count == 2
+    pending_statuses = [status for status in ItemStatus if status == ItemStatus.PENDING]
+    list_results.assert_has_calls([
+        call(
+            application_run_id="test-run-id",
+            page=1,
+            page_size=LIST_APPLICATION_RUNS_MAX_PAGE_SIZE,
+            status__in=pending_statuses,
+        ),
+        call(
+            application_run_id="test-run-id",
+            page=1,
+            page_size=LIST_APPLICATION_RUNS_MAX_PAGE_SIZE,
+            item_id__in=["item-1"],
+        ),
+    ])
+
+    third = tracker.poll()
+    assert third.finished == []
+    assert tracker.items["item-2"].status == ItemStatus.PENDING
+    assert tracker.request_count == 4
+
+
+def test_item_result_tracker_backs_off_while_idle(app_run, mock_api) -> None:
+    """Test that the suggested poll interval grows while idle and resets when items finish.
+
+    Args:
+        app_run: ApplicationRun instance with mock API.
+        mock_api: Mock ExternalsApi instance.
+    """
+    pending = [_item_result(0, ItemStatus.PENDING), _item_result(1, ItemStatus.PENDING)]
+    mock_api.list_run_results_v1_runs_application_run_id_results_get.side_effect = (
+        [pending]
+        + [pending] * 10
+        + [
+            [_item_result(1, ItemStatus.PENDING)],
+            [_item_result(0, ItemStatus.SUCCEEDED)],
+        ]
+    )
+    tracker = ItemResultTracker(app_run)
+
+    intervals = [tracker.poll().next_poll_in_seconds for _ in range(11)]
+    assert intervals == sorted(intervals)
+    assert intervals[0] > ITEM_RESULT_POLL_MIN_INTERVAL_SECONDS
+    assert intervals[-1] == ITEM_RESULT_POLL_MAX_INTERVAL_SECONDS
+    assert tracker.poll().next_poll_in_seconds == ITEM_RESULT_POLL_MIN_INTERVAL_SECONDS
+
+
+def test_item_result_tracker_skips_requests_when_all_items_finished(app_run, mock_api) -> None:
+    """Test that no requests are made once all items reached a terminal status.
+
+    Args:
+        app_run: ApplicationRun instance with mock API.
+        mock_api: Mock ExternalsApi instance.
+    """
+    mock_api.list_run_results_v1_runs_application_run_id_results_get.return_value = [
+        _item_result(0, ItemStatus.SUCCEEDED)
+    ]
+    tracker = ItemResultTracker(app_run)
+    tracker.poll()
+
+    poll = tracker.poll()
+
+    assert poll.request_count == 0
+    assert mock_api.list_run_results_v1_runs_application_run_id_results_get.call_count == 1
+
+
+def test_application_run_item_status_projects_results_without_artifacts() -> None:
+    """Test that item statuses are deserialized into compact summaries, skipping output artifacts."""
+    results = [
+        {
+            "item_id": f"item-{index}",
+            "application_run_id": "run-1",
+            "reference": f"slide-{index}",
+            "status": status.value,
+            "error": None,
+            "output_artifacts": [{"output_artifact_id": "artifact", "name": "heatmap", "metadata": {}}],
+        }
+        for index, status in enumerate([ItemStatus.SUCCEEDED, ItemStatus.PENDING])
+    ]
+    api = PublicApi(ApiClient(Configuration(host="https://platform.example.com")))
+    api.api_client.rest_client.request = Mock(  # type: ignore[method-assign]
+        return_value=RESTResponse(urllib3.HTTPResponse(body=json.dumps(results).encode(), status=200))
+    )
+    app_run = ApplicationRun(api, "run-1")
+
+    summaries = list(app_run.result_summaries())
+
+    assert summaries == [
+        ItemResultSummary(item_id="item-0", reference="slide-0", status=ItemStatus.SUCCEEDED),
+        ItemResultSummary(item_id="item-1", reference="slide-1", status=ItemStatus.PENDING),
+    ]
+    assert not hasattr(summaries[0], "__dict__")
+    assert app_run.item_status() == {"slide-0": ItemStatus.SUCCEEDED, "slide-1": ItemStatus.PENDING}
+
+
+def _application_version() -> ApplicationVersionReadResponse:
+    return ApplicationVersionReadResponse.from_dict({
+        "application_version_id": "app-1:v1.0.0",
+        "version": "1.0.0",
+        "application_id": "app-1",
+        "changelog": "",
+        "input_artifacts": [
+            {
+                "name": "slide",
+                "mime_type": "image/tiff",
+                "metadata_schema": {
+                    "type": "object",
+                    "properties": {"checksum": {"type": "string"}},
+                    "required": ["checksum"],
+                },
+            }
+        ],
+        "output_artifacts": [],
+        "created_at": "2025-01-01T00:00:00Z",
+    })
+
+
+def _items(count: int, metadata: dict[str, object] | None = None) -> list[ItemCreationRequest]:
+    return [
+        ItemCreationRequest(
+            reference=f"slide-{index}",
+            input_artifacts=[
+                InputArtifactCreationRequest(
+                    name="slide", download_url="url", metadata=metadata or {"checksum": f"crc-{index}"}
+                )
+            ],
+        )
+        for index in range(count)
+    ]
+
+
+@pytest.mark.parametrize(
+    ("items", "message"),
+    [
+        (_items(1) + _items(1), "Duplicate reference `slide-0` in items."),
+        (_items(1, {"checksum": 1}), "Invalid metadata for artifact `slide`: 1 is not of type 'string'"),
+        (
+            [ItemCreationRequest(reference="slide-0", input_artifacts=[])],
+            "Missing artifact(s): {'slide'}",
+        ),
+        (
+            [
+                ItemCreationRequest(
+                    reference="slide-0",
+                    input_artifacts=[InputArtifactCreationRequest(name="mask", download_url="url", metadata={})],
+                )
+            ],
+            "Invalid artifact `mask`, application version requires: dict_keys(['slide'])",
+        ),
+    ],
+)
+def test_input_item_validator_reports_invalid_items(items: list[ItemCreationRequest], message: str) -> None:
+    """Test that the precompiled validator reports invalid items as validation per artifact did."""
+    validator = InputItemValidator.for_application_version(_application_version())
+
+    assert InputItemValidator.for_application_version(_application_version()) is validator
+    with pytest.raises(ValueError) as exc_info:
+        validator.validate(items)
+    assert str(exc_info.value) == message
+
+
+@pytest.mark.long_running
+def test_input_item_validation_throughput() -> None:
+    """Benchmark validating a cohort of 5,000 items with precompiled validators and per artifact as before."""
+    app_version = _application_version()
+    schema = app_version.input_artifacts[0].metadata_schema
+    items = _items(5000)
+    durations: dict[str, float] = {}
+
+    start = time.perf_counter()
+    for item in items:
+        for artifact in item.input_artifacts:
+            validate(artifact.metadata, schema=schema)
+    durations["validate per artifact"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    InputItemValidator(dict.fromkeys(["slide"], schema)).validate(items)
+    durations["precompiled validators"] = time.perf_counter() - start
+
+    for variant, seconds in durations.items():
+        log.info("Validating %d items with %s: %.3fs", len(items), variant, seconds)
+    assert durations["precompiled validators"] < durations["validate per artifact"]
+
+
+def test_runs_create_batched_resumes_interrupted_submission(runs, mock_api, tmp_path: Path) -> None:
+    """Test that a cohort is submitted in batches, and an interrupted submission only submits remaining batches."""
+    mock_api.list_versions_by_application_id_v1_applications_application_id_versions_get.return_value = [
+        _application_version()
+    ]
+    mock_api.create_application_run_v1_runs_post.side_effect = [
+        RunCreationResponse(application_run_id="run-0"),
+        ConnectionError("interrupted"),
+    ]
+    items = _items(5)
+    journal_path = tmp_path / "journal.json"
+
+    with pytest.raises(ConnectionError):
+        runs.create_batched("app-1:v1.0.0", items, batch_size=2, journal_path=journal_path)
+    journal = RunSubmissionJournal.model_validate_json(journal_path.read_bytes())
+    assert journal.application_run_ids == ["run-0"]
+
+    mock_api.create_application_run_v1_runs_post.reset_mock()
+    mock_api.create_application_run_v1_runs_post.side_effect = [
+        RunCreationResponse(application_run_id="run-1"),
+        RunCreationResponse(application_run_id="run-2"),
+    ]
+    created = runs.create_batched("app-1:v1.0.0", items, batch_size=2, journal_path=journal_path)
+
+    assert [run.application_run_id for run in created] == ["run-0", "run-1", "run-2"]
+    submitted = [
+        [item.reference for item in submission.args[0].items]
+        for submission in mock_api.create_application_run_v1_runs_post.call_args_list
+    ]
+    assert submitted == [["slide-2", "slide-3"], ["slide-4"]]
+    assert not journal_path.exists()
+
+
+def test_runs_create_batched_validates_cohort_before_submitting(runs, mock_api, tmp_path: Path) -> None:
+    """Test that no run is created if any item of the cohort is invalid."""
+    mock_api.list_versions_by_application_id_v1_applications_application_id_versions_get.return_value = [
+        _application_version()
+    ]
+    items = _items(3)
+    items[2].input_artifacts[0].metadata = {}
+
+    with pytest.raises(ValueError, match="Invalid metadata for artifact `slide`"):
+        runs.create_batched("app-1:v1.0.0", items, batch_size=1, journal_path=tmp_path / "journal.json")
+    mock_api.create_application_run_v1_runs_post.assert_not_called()
@@ -0,0 +1,137 @@
+"""Tests for the in-process provider of access tokens."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import jwt
+from aignx.codegen.api.public_api import PublicApi
+from pydantic import SecretStr
+
+from aignostics.platform import Client, TokenProvider, get_token_provider, invalidate_token_providers
+
+
+def _token(lifetime_seconds: int) -> str:
+    return jwt.encode(
+        {"exp": int(time.time()) + lifetime_seconds, "sub": "user"},
+        "test-secret-of-sufficient-length-for-hs256",
+        algorithm="HS256",
+    )
+
+
+def test_token_provider_reuses_token_until_about_to_expire() -> None:
+    """Test that the token is obtained once, renewed when about to expire, and forgotten when invalidated."""
+    tokens = [_token(3600), _token(60), _token(3600)]
+    with patch("aignostics.platform._token_provider.get_token", side_effect=tokens) as get_token:
+        provider = TokenProvider(use_cache=False)
+
+        assert [provider.get_token() for _ in range(3)] == [tokens[0]] * 3
+        provider.invalidate()
+        assert provider.get_token() == tokens[1]  # Expires within the margin, so renewed on next use
+        assert asyncio.run(provider.get_token_async()) == tokens[2]
+        assert provider.get_token() == tokens[2]
+
+    assert get_token.call_count == 3
+    get_token.assert_called_with(use_cache=False)
+
+
+def test_token_provider_refreshes_in_background() -> None:
+    """Test that tokens are refreshed via the refresh token before they expire, and stored in the token file."""
+    refreshed = _token(3600)
+    refreshed_event = threading.Event()
+    mock_settings = MagicMock(refresh_token=SecretStr("refresh"))
+
+    def store(token: str, expiry: int) -> None:
+        assert (token, expiry) == (refreshed, jwt.decode(token, options={"verify_signature": False})["exp"])
+        refreshed_event.set()
+
+    with (
+        patch("aignostics.platform._token_provider.settings", return_value=mock_settings),
+        patch("aignostics.platform._token_provider.get_token", return_value=_token(22)),
+        patch("aignostics.platform._token_provider._token_from_refresh_token", return_value=refreshed) as refresh,
+        patch(
+            "aignostics.platform._token_provider.verify_and_decode_token",
+            side_effect=lambda token: jwt.decode(token, options={"verify_signature": False}),
+        ) as verify,
+        patch("aignostics.platform._token_provider.store_cached_token", side_effect=store),
+    ):
+        provider = TokenProvider(use_cache=True, refresh_margin_seconds=10)
+        provider.get_token()
+        assert refreshed_event.wait(timeout=10)
+
+        assert provider.get_token() == refreshed
+        refresh.assert_called_once_with(mock_settings.refresh_token)
+        verify.assert_called_once_with(refreshed)
+        provider.invalidate()
+
+
+def test_token_provider_does_not_refresh_short_lived_tokens_in_a_loop() -> None:
+    """Test that refreshed tokens living no longer than twice the margin are not refreshed again right away."""
+    refreshed_event = threading.Event()
+    mock_settings = MagicMock(refresh_token=SecretStr("refresh"))
+    with (
+        patch("aignostics.platform._token_provider.settings", return_value=mock_settings),
+        patch("aignostics.platform._token_provider.get_token", return_value=_token(602)),
+        patch("aignostics.platform._token_provider._token_from_refresh_token", return_value=_token(60)) as refresh,
+        patch(
+            "aignostics.platform._token_provider.verify_and_decode_token",
+            side_effect=lambda token: jwt.decode(token, options={"verify_signature": False}),
+        ),
+        patch("aignostics.platform._token_provider.store_cached_token", side_effect=lambda *_: refreshed_event.set()),
+    ):
+        provider = TokenProvider(use_cache=True)
+        provider.get_token()
+        assert refreshed_event.wait(timeout=10)
+        time.sleep(1)
+
+        assert refresh.call_count == 1
+        assert provider._refresh_timer is None
+        provider.invalidate()
+
+
+def test_token_provider_rejects_unverified_refreshed_token() -> None:
+    """Test that a refreshed token failing verification is neither used nor stored."""
+    current = _token(3600)
+    mock_settings = MagicMock(refresh_token=SecretStr("refresh"))
+    with (
+        patch("aignostics.platform._token_provider.settings", return_value=mock_settings),
+        patch("aignostics.platform._token_provider.get_token", return_value=current),
+        patch("aignostics.platform._token_provider._token_from_refresh_token", return_value=_token(3600)),
+        patch("aignostics.platform._token_provider.verify_and_decode_token", side_effect=RuntimeError("invalid")),
+        patch("aignostics.platform._token_provider.store_cached_token") as store,
+    ):
+        provider = TokenProvider(use_cache=True)
+        provider.get_token()
+        provider._refresh()
+
+        assert provider.get_token() == current
+        store.assert_not_called()
+        provider.invalidate()
+
+
+def test_token_provider_is_shared_and_injects_token_per_request() -> None:
+    """Test that clients share the token provider and send the current token with each request."""
+    tokens = [_token(3600), _token(3600)]
+    with (
+        patch("aignostics.platform._token_provider._token_providers", {}),
+        patch("aignostics.platform._token_provider.get_token", side_effect=tokens),
+        patch("aignostics.platform._client.get_catalog_cache", return_value=None),
+    ):
+        api = Client.get_api_client(cache_token=False)
+        assert isinstance(api, PublicApi)
+        assert get_token_provider(use_cache=False) is get_token_provider(use_cache=False)
+        assert get_token_provider(use_cache=True) is not get_token_provider(use_cache=False)
+
+        sent_headers: list[dict[str, str]] = []
+        with patch.object(
+            api.api_client.rest_client, "request", side_effect=lambda *_, headers, **__: sent_headers.append(headers)
+        ):
+            api.api_client.call_api("GET", "https://platform.example.com/api/v1/health")
+            invalidate_token_providers()
+            api.api_client.call_api("GET", "https://platform.example.com/api/v1/health", {"Accept": "text/plain"})
+
+    assert sent_headers == [
+        {"Authorization": f"Bearer {tokens[0]}"},
+        {"Accept": "text/plain", "Authorization": f"Bearer {tokens[1]}"},
+    ]
@@ -1,8 +1,20 @@
 """Tests for the platform utility functions."""
 
+import base64
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import google_crc32c
 import pytest
 
-from aignostics.platform import mime_type_to_file_ending
+from aignostics.platform import (
+    crc32c_combine,
+    download_file,
+    download_file_segmented,
+    get_segment_count,
+    mime_type_to_file_ending,
+)
+from aignostics.platform._utils import SEGMENTED_DOWNLOAD_MIN_SEGMENT_SIZE
 
 
 class TestMimeTypeToFileEnding:
@@ -71,3 +83,81 @@ class TestMimeTypeToFileEnding:
         """
         with pytest.raises(ValueError, match="Unknown mime type: application/unknown"):
             mime_type_to_file_ending("application/unknown")
+
+
+def _mock_range_get(content: bytes) -> MagicMock:
+    """Mock GET requests of the shared HTTP session serving byte ranges of the given content.
+
+    Args:
+        content (bytes): The content served.
+
+    Returns:
+        MagicMock: The mock to patch requests.Session.get with.
+    """
+
+    def get(*_: object, headers: dict[str, str] | None = None, **__: object) -> MagicMock:
+        response = MagicMock()
+        response.__enter__.return_value = response
+        start, end = 0, len(content) - 1
+        if headers and "Range" in headers:
+            first, _, last = headers["Range"].removeprefix("bytes=").partition("-")
+            start, end = int(first), int(last or end)
+            response.status_code = 206
+            response.headers = {"content-range": f"bytes {start}-{end}/{len(content)}"}
+        else:
+            response.status_code = 200
+            response.headers = {"content-length": str(len(content))}
+        body = content[start : end + 1]
+        response.iter_content.return_value = [body[: len(body) // 2], body[len(body) // 2 :]]
+        return response
+
+    return MagicMock(side_effect=get)
+
+
+class TestSegmentedDownload:
+    """Tests for downloading files as concurrently fetched byte ranges."""
+
+    @staticmethod
+    @pytest.mark.parametrize("length", [0, 1, 3, 1000, 1 << 20])
+    def test_crc32c_combine(length: int) -> None:
+        """Test that combining checksums of two blocks equals the checksum of their concatenation."""
+        first, second = b"a" * 777, bytes(range(256)) * (length // 256) + b"x" * (length % 256)
+        assert crc32c_combine(google_crc32c.value(first), google_crc32c.value(second), len(second)) == (
+            google_crc32c.value(first + second)
+        )
+
+    @staticmethod
+    def test_get_segment_count() -> None:
+        """Test that small files are not split and large files are split up to the maximum."""
+        assert get_segment_count(SEGMENTED_DOWNLOAD_MIN_SEGMENT_SIZE - 1, 8) == 1
+        assert get_segment_count(3 * SEGMENTED_DOWNLOAD_MIN_SEGMENT_SIZE, 8) == 3
+        assert get_segment_count(100 * SEGMENTED_DOWNLOAD_MIN_SEGMENT_SIZE, 8) == 8
+
+    @staticmethod
+    @pytest.mark.parametrize("segment_count", [1, 3, 7])
+    def test_download_file_segmented(tmp_path: Path, segment_count: int) -> None:
+        """Test that segments are written to their region of the file and the checksum is combined."""
+        content = bytes(range(256)) * 40 + b"tail"
+        progress = []
+        with patch("requests.Session.get", _mock_range_get(content)):
+            checksum = download_file_segmented(
+                "https://example.com", tmp_path / "file", len(content), segment_count, progress.append
+            )
+
+        assert (tmp_path / "file").read_bytes() == content
+        assert checksum == base64.b64encode(google_crc32c.Checksum(content).digest()).decode("ascii")
+        assert sum(progress) == len(content)
+
+    @staticmethod
+    def test_download_file_uses_segments_for_large_files(tmp_path: Path) -> None:
+        """Test that download_file splits large files if the server supports range requests."""
+        content = b"aignostics" * (SEGMENTED_DOWNLOAD_MIN_SEGMENT_SIZE // 5 + 1)
+        checksum = base64.b64encode(google_crc32c.Checksum(content).digest()).decode("ascii")
+        mock_get = _mock_range_get(content)
+        with patch("requests.Session.get", mock_get):
+            download_file("https://example.com", str(tmp_path / "file"), checksum, segment_count=4)
+
+        assert (tmp_path / "file").read_bytes() == content
+        ranges = sorted(call.kwargs["headers"]["Range"] for call in mock_get.call_args_list)
+        half = len(content) // 2
+        assert ranges == ["bytes=0-0", f"bytes=0-{half - 1}", f"bytes={half}-{len(content) - 1}"]
@@ -348,3 +348,27 @@ def test_cli_http_proxy(runner: CliRunner, silent_logging, tmp_path: Path) -> No
         result = runner.invoke(cli, ["system", "config", "get", "CURL_CA_BUNDLE"])
         assert result.exit_code == 0
         assert "None" in result.output
+
+
+def test_cli_checksum_cache_show_and_clear(runner: CliRunner, tmp_path: Path) -> None:
+    """Check the checksum cache can be inspected and cleared."""
+    from aignostics.utils import ChecksumCache, FileIdentity
+
+    cache = ChecksumCache(tmp_path / "checksums.sqlite3")
+    (tmp_path / "slide.tiff").write_bytes(b"slide")
+    os.utime(tmp_path / "slide.tiff", (0, 0))
+    cache.put(FileIdentity.of(tmp_path / "slide.tiff"), crc32c_base64="crc")
+
+    with patch("aignostics.system._cli.get_checksum_cache", return_value=cache):
+        result = runner.invoke(cli, ["system", "checksum-cache", "show"])
+        assert result.exit_code == 0
+        assert '"entries": 1' in result.output
+
+        result = runner.invoke(cli, ["system", "checksum-cache", "clear"])
+        assert result.exit_code == 0
+        assert "Removed 1 entries from checksum cache." in normalize_output(result.output)
+
+    with patch("aignostics.system._cli.get_checksum_cache", return_value=None):
+        result = runner.invoke(cli, ["system", "checksum-cache", "show"])
+        assert result.exit_code == 0
+        assert "Checksum cache is disabled." in result.output
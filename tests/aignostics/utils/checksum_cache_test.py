@@ -0,0 +1,126 @@
+"""Tests for the persistent checksum cache."""
+
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from aignostics.utils._checksum import calculate_file_checksums, calculate_file_multipart_etags
+from aignostics.utils._checksum_cache import ChecksumCache, FileIdentity
+
+AN_HOUR_AGO_NS = time.time_ns() - 3600 * 1_000_000_000
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> ChecksumCache:
+    """Provide an empty checksum cache in a temporary directory.
+
+    Returns:
+        ChecksumCache: The cache.
+    """
+    return ChecksumCache(tmp_path / "checksums.sqlite3", max_entries=3)
+
+
+def _write(path: Path, content: bytes, mtime_ns: int = AN_HOUR_AGO_NS) -> FileIdentity:
+    """Write a file and set its modification time.
+
+    Returns:
+        FileIdentity: The identity of the file written.
+    """
+    path.write_bytes(content)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+    return FileIdentity.of(path)
+
+
+def test_put_get_merges_values_of_same_identity(cache: ChecksumCache, tmp_path: Path) -> None:
+    """Test that values cached separately for the same file identity are merged."""
+    identity = _write(tmp_path / "slide.tiff", b"slide")
+
+    cache.put(identity, crc32c_base64="crc")
+    cache.put(identity, metadata={"width": 10})
+
+    cached = cache.get(identity)
+    assert cached is not None
+    assert cached.crc32c_base64 == "crc"
+    assert cached.md5_hex is None
+    assert cached.metadata == {"width": 10}
+
+
+def test_modified_file_invalidates_entry(cache: ChecksumCache, tmp_path: Path) -> None:
+    """Test that an entry is invalidated once the file is modified."""
+    identity = _write(tmp_path / "slide.tiff", b"slide")
+    cache.put(identity, crc32c_base64="crc")
+
+    modified = _write(tmp_path / "slide.tiff", b"slide", mtime_ns=AN_HOUR_AGO_NS + 1)
+
+    assert cache.get(modified) is None
+    assert cache.get(identity) is None
+    assert cache.stats().entries == 0
+
+
+def test_recently_modified_file_is_not_cached(cache: ChecksumCache, tmp_path: Path) -> None:
+    """Test that files modified within the racy window are not cached."""
+    identity = _write(tmp_path / "slide.tiff", b"slide", mtime_ns=time.time_ns())
+
+    cache.put(identity, crc32c_base64="crc")
+
+    assert cache.get(identity) is None
+
+
+def test_least_recently_used_entries_are_evicted(cache: ChecksumCache, tmp_path: Path) -> None:
+    """Test that the cache is bounded by evicting the least recently used entries."""
+    identities = [_write(tmp_path / f"slide_{index}.tiff", b"slide") for index in range(4)]
+    for identity in identities[:3]:
+        cache.put(identity, crc32c_base64="crc")
+    assert cache.get(identities[0]) is not None
+
+    cache.put(identities[3], crc32c_base64="crc")
+
+    assert cache.stats().entries == 3
+    assert cache.get(identities[1]) is None
+    assert all(cache.get(identity) for identity in (identities[0], identities[2], identities[3]))
+
+
+def test_clear_removes_all_entries(cache: ChecksumCache, tmp_path: Path) -> None:
+    """Test that clearing the cache removes all entries."""
+    cache.put(_write(tmp_path / "slide.tiff", b"slide"), crc32c_base64="crc")
+
+    assert cache.clear() == 1
+    assert cache.stats().entries == 0
+
+
+def test_calculate_file_checksums_uses_cache(cache: ChecksumCache, tmp_path: Path) -> None:
+    """Test that checksums of unchanged files are served from the cache without reading the file."""
+    path = tmp_path / "slide.tiff"
+    _write(path, b"slide")
+
+    with patch("aignostics.utils._checksum.get_checksum_cache", return_value=cache):
+        first = calculate_file_checksums(path, md5=True, use_cache=True)
+        with patch("aignostics.utils._checksum.iter_file_chunks") as mock_iter_file_chunks:
+            second = calculate_file_checksums(path, md5=True, use_cache=True)
+            crc32c_only = calculate_file_checksums(path, use_cache=True)
+
+    mock_iter_file_chunks.assert_not_called()
+    assert first == second
+    assert crc32c_only.crc32c_base64 == first.crc32c_base64
+    assert crc32c_only.md5_hex is None
+
+
+def test_multipart_etags_are_merged_and_served_from_cache(cache: ChecksumCache, tmp_path: Path) -> None:
+    """Test that multipart ETags of different part sizes are merged and unchanged files are not read again."""
+    path = tmp_path / "slide.tiff"
+    identity = _write(path, b"slide" * 10)
+
+    with patch("aignostics.utils._checksum.get_checksum_cache", return_value=cache):
+        first = calculate_file_multipart_etags(path, [5], use_cache=True)
+        second = calculate_file_multipart_etags(path, [5, 20], use_cache=True)
+        with patch("aignostics.utils._checksum.iter_file_chunks") as mock_iter_file_chunks:
+            third = calculate_file_multipart_etags(path, [20, 5], use_cache=True)
+
+    mock_iter_file_chunks.assert_not_called()
+    assert second == third == {**first, 20: second[20]}
+    cached = cache.get(identity)
+    assert cached is not None
+    assert cached.multipart_etags == third
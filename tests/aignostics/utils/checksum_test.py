@@ -0,0 +1,116 @@
+"""Tests for checksum utilities."""
+
+import base64
+import hashlib
+import os
+import time
+from pathlib import Path
+
+import google_crc32c
+import pytest
+
+from aignostics.utils import get_logger
+from aignostics.utils._checksum import (
+    CHECKSUM_CHUNK_SIZE,
+    StreamingChecksum,
+    calculate_file_checksums,
+    calculate_file_crc32c,
+    calculate_file_md5,
+    calculate_file_multipart_etags,
+    iter_file_chunks,
+)
+
+log = get_logger(__name__)
+
+BENCHMARK_FILE_SIZE = 256 * 1024 * 1024  # 256MB
+BENCHMARK_CHUNK_SIZES = [1024, 64 * 1024, 1024 * 1024, 8 * 1024 * 1024, 100 * 1024 * 1024]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, CHECKSUM_CHUNK_SIZE])
+def test_calculate_file_checksums_matches_reference(tmp_path: Path, chunk_size: int) -> None:
+    """Test that CRC32C and MD5 match the reference implementations for any chunk size."""
+    content = os.urandom(10_000)
+    path = tmp_path / "file.bin"
+    path.write_bytes(content)
+
+    checksums = calculate_file_checksums(path, md5=True, chunk_size=chunk_size)
+
+    assert checksums.size == len(content)
+    assert checksums.crc32c_base64 == base64.b64encode(google_crc32c.Checksum(content).digest()).decode("ascii")
+    assert checksums.md5_hex == hashlib.md5(content).hexdigest()  # noqa: S324
+    assert calculate_file_crc32c(path, chunk_size) == checksums.crc32c_base64
+    assert calculate_file_md5(path, chunk_size) == checksums.md5_hex
+
+
+def test_calculate_file_checksums_of_empty_file(tmp_path: Path) -> None:
+    """Test the checksums of an empty file."""
+    path = tmp_path / "empty.bin"
+    path.touch()
+
+    checksums = calculate_file_checksums(path)
+
+    assert checksums.size == 0
+    assert checksums.crc32c_base64 == "AAAAAA=="
+    assert checksums.md5_hex is None
+
+
+def test_iter_file_chunks_reuses_buffer(tmp_path: Path) -> None:
+    """Test that chunks are views into one buffer and the last chunk is truncated."""
+    path = tmp_path / "file.bin"
+    path.write_bytes(b"abcdefghij")
+
+    with path.open("rb") as file:
+        chunks = [(chunk.obj, bytes(chunk)) for chunk in iter_file_chunks(file, chunk_size=4)]
+
+    assert [content for _, content in chunks] == [b"abcd", b"efgh", b"ij"]
+    assert len({id(buffer) for buffer, _ in chunks}) == 1
+
+
+def test_streaming_checksum_continues_from_state() -> None:
+    """Test that a checksum continued from a previous CRC32C equals the checksum of all data."""
+    checksum = StreamingChecksum()
+    checksum.update(b"aignostics")
+    continued = StreamingChecksum(crc32c=checksum.crc32c)
+    continued.update(memoryview(b"platform"))
+
+    assert continued.crc32c == google_crc32c.value(b"aignosticsplatform")
+    with pytest.raises(ValueError, match="MD5 checksum was not requested"):
+        continued.md5_hexdigest()
+
+
+@pytest.mark.parametrize("chunk_size", [3, 4, 1000])
+def test_calculate_file_multipart_etags_matches_reference(tmp_path: Path, chunk_size: int) -> None:
+    """Test that multipart ETags of several part sizes are computed in one pass for any chunk size."""
+    content = os.urandom(100)
+    path = tmp_path / "file.bin"
+    path.write_bytes(content)
+
+    etags = calculate_file_multipart_etags(path, [10, 30, 100, 200], chunk_size=chunk_size)
+
+    for part_size, etag in etags.items():
+        parts = [content[offset : offset + part_size] for offset in range(0, len(content), part_size)]
+        digests = b"".join(hashlib.md5(part).digest() for part in parts)  # noqa: S324
+        assert etag == f"{hashlib.md5(digests).hexdigest()}-{len(parts)}"  # noqa: S324
+    assert etags.keys() == {10, 30, 100, 200}
+    assert etags[30].endswith("-4")
+    assert etags[200].endswith("-1")
+
+
+@pytest.mark.long_running
+def test_checksum_throughput_per_chunk_size(tmp_path: Path) -> None:
+    """Benchmark the throughput of single-pass CRC32C and MD5 computation per chunk size."""
+    path = tmp_path / "benchmark.bin"
+    with path.open("wb") as file:
+        for _ in range(BENCHMARK_FILE_SIZE // (16 * 1024 * 1024)):
+            file.write(os.urandom(16 * 1024 * 1024))
+
+    throughput: dict[int, float] = {}
+    reference = None
+    for chunk_size in BENCHMARK_CHUNK_SIZES:
+        start = time.perf_counter()
+        checksums = calculate_file_checksums(path, md5=True, chunk_size=chunk_size)
+        throughput[chunk_size] = BENCHMARK_FILE_SIZE / (time.perf_counter() - start) / 1024 / 1024
+        reference = reference or checksums
+        assert checksums == reference
+    for chunk_size, mb_per_second in throughput.items():
+        log.info("Chunk size %10d bytes: %8.1f MB/s", chunk_size, mb_per_second)
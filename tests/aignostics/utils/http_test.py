@@ -0,0 +1,100 @@
+"""Tests for the shared HTTP session."""
+
+import os
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from aignostics.utils._http import (
+    HttpSettings,
+    _create_http_session,
+    get_http_pool_stats,
+    get_http_session,
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Handler failing the first GET with 503 and serving a body afterwards."""
+
+    protocol_version = "HTTP/1.1"
+    failures = 1
+
+    def do_GET(self) -> None:
+        if _Handler.failures:
+            _Handler.failures -= 1
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *_: object) -> None:
+        pass
+
+
+@pytest.fixture
+def server_url() -> Iterator[str]:
+    """Serve the handler on a free local port.
+
+    Yields:
+        str: The base URL of the server.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_get_http_session_is_shared_per_process() -> None:
+    """Test that the session is shared within a process and recreated in forked processes."""
+    session = get_http_session()
+
+    assert get_http_session() is session
+    with patch("aignostics.utils._http.os.getpid", return_value=-1):
+        assert get_http_session() is not session
+
+
+def test_http_session_retries_and_reuses_connections(server_url: str) -> None:
+    """Test that transient failures are retried with keep-alive connections and pool stats are reported."""
+    _Handler.failures = 1
+    session = _create_http_session(HttpSettings(retries=2, retry_backoff_factor=0, read_timeout=5))
+
+    with (
+        patch("aignostics.utils._http._http_session", session),
+        patch("aignostics.utils._http._http_session_pid", os.getpid()),
+    ):
+        for _ in range(3):
+            response = session.get(f"{server_url}/file")
+            assert response.status_code == 200
+            assert response.content == b"ok"
+        stats = get_http_pool_stats()
+
+    assert len(stats) == 1
+    assert stats[0].host == "127.0.0.1"
+    assert stats[0].requests == 4
+    assert stats[0].connections_created == 1
+    assert stats[0].idle_connections == 1
+
+
+def test_http_session_applies_default_timeout() -> None:
+    """Test that requests without explicit timeout use the configured connect and read timeouts."""
+    session = _create_http_session(HttpSettings(connect_timeout=3, read_timeout=7))
+    adapter = session.get_adapter("https://example.com")
+
+    with patch("requests.adapters.HTTPAdapter.send", side_effect=requests.ConnectionError) as send:
+        with pytest.raises(requests.ConnectionError):
+            session.get("https://example.com")
+        with pytest.raises(requests.ConnectionError):
+            session.get("https://example.com", timeout=1)
+
+    assert [call.kwargs["timeout"] for call in send.call_args_list] == [(3, 7), 1]
+    assert adapter.max_retries.allowed_methods == frozenset({"GET", "HEAD", "OPTIONS"})  # type: ignore[attr-defined]